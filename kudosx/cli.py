@@ -8,6 +8,8 @@ from kudosx.commands.cloud import cloud
 from kudosx.commands.explore import explore
 from kudosx.commands.init import init_project
 from kudosx.commands.list import list_skills
+from kudosx.commands.mirror import mirror
+from kudosx.commands.registry import registry
 from kudosx.commands.remove import remove
 from kudosx.commands.repo import repo
 from kudosx.commands.search import search
@@ -30,6 +32,8 @@ cli.add_command(cloud)
 cli.add_command(explore)
 cli.add_command(init_project)
 cli.add_command(list_skills)
+cli.add_command(mirror)
+cli.add_command(registry)
 cli.add_command(remove)
 cli.add_command(repo)
 cli.add_command(search)
@@ -1,18 +1,56 @@
 """Add command for Kudosx CLI - Install skills and extensions."""
 
+import atexit
+import hashlib
+import json
+import os
 import re
 import shutil
 import ssl
 import subprocess
 import tempfile
+import threading
+import time
 import zipfile
+from collections.abc import Mapping
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
+from typing import Callable
 from urllib.request import urlopen, Request
 from urllib.error import URLError, HTTPError
 
 import click
 import yaml
 
+from kudosx.utils.archive_cache import ArchiveCache
+from kudosx.utils.download import CHUNK_SIZE, DownloadProgress, stream_to_file
+from kudosx.utils.fs import atomic_write_bytes, replace_with_clone, staged_directory
+from kudosx.utils.manifest import (
+    UNTRACKED_FILES,
+    installed_sha256,
+    manifest_entry,
+    read_manifest,
+    write_manifest,
+)
+from kudosx.utils.mirror import (
+    MIRROR_REGISTRY,
+    archive_path,
+    mirror_base,
+    mirror_local_path,
+    mirror_url,
+    tags_path,
+)
+from kudosx.utils.registry import (
+    REGISTRY_TTL,
+    SkillRegistry,
+    load_yaml_snapshot,
+    parse_registry_yaml,
+    read_registry_cache,
+    write_registry_cache,
+)
+from kudosx.utils.store import SkillStore
+from kudosx.utils.tag_cache import TagCache
+
 
 def get_ssl_context(verify: bool = True) -> ssl.SSLContext:
     """Create an SSL context for HTTPS requests.
@@ -96,39 +134,135 @@ REMOTE_SKILLS_URL = "https://raw.githubusercontent.com/kudosx/kudosx/refs/heads/
 
 # Cache for loaded skills (to avoid repeated fetches)
 _skills_cache: dict | None = None
+_skills_lock = threading.Lock()
+_refresh_thread: threading.Thread | None = None
 
+# Seconds to wait at exit for a background registry refresh to finish
+REGISTRY_REFRESH_JOIN_TIMEOUT = 3
 
-def load_skills_from_remote() -> dict | None:
-    """Fetch skills from remote skills.yaml.
+
+def fetch_remote_registry(cached: dict | None = None) -> dict | None:
+    """Fetch the remote skills.yaml, revalidating a cached copy if given.
+
+    With a cached record, its ETag and Last-Modified are sent as
+    If-None-Match/If-Modified-Since; a 304 reuses the cached skills
+    without downloading or parsing the YAML again, as does a full response
+    whose body hashes the same as the cached one.
+
+    The registry is read from KUDOSX_MIRROR instead of GitHub when set.
+
+    Args:
+        cached: Record from read_registry_cache(), if any
 
     Returns:
-        Skills dict or None if fetch fails
+        Record with skills, etag, last_modified and sha256, or None if fetch fails
     """
+    url = mirror_url(MIRROR_REGISTRY) if mirror_base() else REMOTE_SKILLS_URL
+    headers = {"User-Agent": "kudosx"}
+    conditional = cached is not None and cached.get("skills") is not None
+    if conditional:
+        if cached.get("etag"):
+            headers["If-None-Match"] = cached["etag"]
+        if cached.get("last_modified"):
+            headers["If-Modified-Since"] = cached["last_modified"]
+
     try:
-        request = Request(REMOTE_SKILLS_URL, headers={"User-Agent": "kudosx"})
+        request = Request(url, headers=headers)
         with request_with_retry(request, timeout=5) as response:
-            content = response.read().decode("utf-8")
-            data = yaml.safe_load(content)
-            return data.get("skills", {})
-    except (URLError, HTTPError, yaml.YAMLError, OSError, ssl.SSLError):
+            content = response.read()
+            sha256 = hashlib.sha256(content).hexdigest()
+            if conditional and cached.get("sha256") == sha256:
+                # Same document without 304 support: skip the parse
+                skills = cached["skills"]
+            else:
+                skills = parse_registry_yaml(content).get("skills", {})
+            return {
+                "skills": skills,
+                "etag": response.headers.get("ETag"),
+                "last_modified": response.headers.get("Last-Modified"),
+                "sha256": sha256,
+            }
+    except HTTPError as e:
+        if e.code == 304 and conditional:
+            return {key: cached.get(key) for key in ("skills", "etag", "last_modified", "sha256")}
         return None
+    except (URLError, yaml.YAMLError, OSError, ssl.SSLError):
+        return None
+
+
+def load_skills_from_remote() -> dict | None:
+    """Fetch skills from remote skills.yaml.
+
+    Returns:
+        Skills dict or None if fetch fails
+    """
+    record = fetch_remote_registry()
+    return record["skills"] if record else None
 
 
 def load_skills_from_local() -> dict:
-    """Load skills from local bundled skills.yaml."""
+    """Load skills from local bundled skills.yaml (via its precompiled snapshot)."""
     if not SKILLS_YAML.exists():
         return {}
-    with open(SKILLS_YAML) as f:
-        data = yaml.safe_load(f)
+    data = load_yaml_snapshot(SKILLS_YAML)
     return data.get("skills", {})
 
 
+def refresh_remote_skills() -> dict | None:
+    """Revalidate the cached remote registry and update it on disk.
+
+    A failed fetch is cached only when there is nothing better on disk,
+    so offline runs stop retrying synchronously without losing a good copy.
+
+    Returns:
+        Remote skills dict or None if the fetch failed
+    """
+    cached = read_registry_cache()
+    record = fetch_remote_registry(cached)
+    try:
+        if record is not None:
+            write_registry_cache(record["skills"], record["etag"], record["last_modified"], record["sha256"])
+        elif cached is None:
+            write_registry_cache(None)
+    except OSError:
+        pass
+    return record["skills"] if record else None
+
+
+def refresh_skills_in_background() -> None:
+    """Refresh the cached remote registry on a daemon thread (at most one at a time)."""
+    global _refresh_thread
+    if _refresh_thread is not None and _refresh_thread.is_alive():
+        return
+    _refresh_thread = threading.Thread(target=refresh_remote_skills, name="registry-refresh", daemon=True)
+    _refresh_thread.start()
+
+
+@atexit.register
+def join_background_refresh(timeout: float = REGISTRY_REFRESH_JOIN_TIMEOUT) -> None:
+    """Wait for a running background refresh, for at most timeout seconds.
+
+    Runs at exit so short commands still write the refreshed registry to
+    disk; a refresh that is still stuck on the network after timeout is
+    abandoned and retried on the next run.
+    """
+    thread = _refresh_thread
+    if thread is not None and thread.is_alive():
+        thread.join(timeout)
+
+
 def load_skills() -> dict:
     """Load skills by merging local and remote registries.
 
     Local skills are loaded first, then remote skills are merged in.
     Remote skills take precedence for version info (latest field).
 
+    The remote registry is served stale-while-revalidate from the on-disk
+    cache: once it is older than REGISTRY_TTL (or the last fetch failed) it
+    is still used, and a background conditional request refreshes it for
+    the next run. Only the first run without any cache waits for the network.
+    With KUDOSX_MIRROR set, the mirror's registry is read directly instead.
+
     Returns:
         Merged skills dict from local and remote registries
     """
@@ -136,27 +270,81 @@ def load_skills() -> dict:
     if _skills_cache is not None:
         return _skills_cache
 
-    # Start with local skills
-    skills = load_skills_from_local()
+    with _skills_lock:
+        if _skills_cache is not None:
+            return _skills_cache
+
+        # Start with local skills
+        skills = load_skills_from_local()
+
+        cached = read_registry_cache()
+        if mirror_base():
+            # Local mirror: cheap to read, and must not overwrite the cache
+            remote_skills = load_skills_from_remote()
+        elif cached is None:
+            remote_skills = refresh_remote_skills()
+        else:
+            remote_skills = cached["skills"]
+            if remote_skills is None or time.time() - cached["fetched_at"] > REGISTRY_TTL:
+                refresh_skills_in_background()
+
+        # Merge remote skills (remote takes precedence for existing keys)
+        if remote_skills:
+            skills.update(remote_skills)
+
+        _skills_cache = skills
+    return skills
+
 
-    # Merge remote skills (remote takes precedence for existing keys)
+def reload_skills() -> dict:
+    """Force reload skills (clear cache and fetch the remote registry)."""
+    global _skills_cache
+    skills = load_skills_from_local()
     remote_skills = load_skills_from_remote()
     if remote_skills:
         skills.update(remote_skills)
-
     _skills_cache = skills
     return skills
 
 
-def reload_skills() -> dict:
-    """Force reload skills (clear cache and reload)."""
-    global _skills_cache
-    _skills_cache = None
-    return load_skills()
+_registry: SkillRegistry | None = None
+
+
+def get_skill_registry() -> SkillRegistry:
+    """Return the indexed registry for the currently loaded skills."""
+    global _registry
+    skills = load_skills()
+    registry = _registry
+    if registry is None or registry.skills is not skills:
+        registry = _registry = SkillRegistry(skills)
+    return registry
+
+
+class _LazySkills(Mapping):
+    """Read-only view of the skills registry, loaded on first access.
+
+    Importing this module never touches the network; commands that do not
+    look at the registry never load it.
+    """
+
+    def __getitem__(self, name: str) -> dict:
+        return get_skill_registry()[name]
 
+    def __iter__(self):
+        return iter(get_skill_registry())
 
-# Load skills from registry (remote with local fallback)
-SKILLS = load_skills()
+    def __len__(self) -> int:
+        return len(get_skill_registry())
+
+    def __contains__(self, name) -> bool:
+        return name in get_skill_registry()
+
+    def __repr__(self) -> str:
+        return repr(load_skills())
+
+
+# Skills registry (remote with local fallback), loaded lazily
+SKILLS = _LazySkills()
 
 
 def parse_version(tag: str) -> tuple[int, ...]:
@@ -189,27 +377,26 @@ def get_latest_version(repo: str) -> str | None:
         Version string (e.g., "0.1.0") or None if not found
     """
     # First, check skills.yaml for cached latest version
-    for skill_config in SKILLS.values():
-        if skill_config.get("repo") == repo:
-            latest = skill_config.get("latest")
-            if latest:
-                return str(latest)
-            break
+    registry = get_skill_registry()
+    names = registry.find_by_repo(repo)
+    if names:
+        latest = registry[names[0]].get("latest")
+        if latest:
+            return str(latest)
 
     # Fallback to git ls-remote
     return fetch_latest_version_from_git(repo)
 
 
-def fetch_latest_version_from_git(repo: str) -> str | None:
-    """Fetch the latest version tag from GitHub using git ls-remote.
-
-    Uses git ls-remote instead of GitHub API to avoid rate limiting.
+def fetch_tags_from_git(repo: str, timeout: float = 10) -> list[str] | None:
+    """List the tags of a GitHub repo using git ls-remote.
 
     Args:
         repo: GitHub repo in format "owner/repo"
+        timeout: Seconds to wait for git before giving up
 
     Returns:
-        Version string (e.g., "0.1.0") or None if not found
+        Tag names (e.g. ["v0.1.0", "v0.2.0"]) or None if the lookup failed
     """
     repo_url = f"https://github.com/{repo}.git"
     try:
@@ -217,104 +404,642 @@ def fetch_latest_version_from_git(repo: str) -> str | None:
             ["git", "ls-remote", "--tags", repo_url],
             capture_output=True,
             text=True,
-            timeout=10,
+            timeout=timeout,
         )
-        if result.returncode != 0:
-            return None
+    except (subprocess.TimeoutExpired, subprocess.SubprocessError, OSError):
+        return None
+    if result.returncode != 0:
+        return None
 
-        # Parse tags from output: "sha\trefs/tags/v0.1.0"
-        tags = []
-        for line in result.stdout.strip().split("\n"):
-            if not line:
+    # Parse tags from output: "sha\trefs/tags/v0.1.0"
+    tags = []
+    for line in result.stdout.strip().split("\n"):
+        if not line:
+            continue
+        parts = line.split("\t")
+        if len(parts) == 2:
+            ref = parts[1]
+            # Skip ^{} dereferenced tags
+            if ref.endswith("^{}"):
                 continue
-            parts = line.split("\t")
-            if len(parts) == 2:
-                ref = parts[1]
-                # Skip ^{} dereferenced tags
-                if ref.endswith("^{}"):
-                    continue
-                tag = ref.replace("refs/tags/", "")
-                tags.append(tag)
-
-        if not tags:
-            return None
-
-        # Sort by semantic version and return latest
-        tags.sort(key=parse_version, reverse=True)
-        latest = tags[0]
-        # Strip 'v' prefix if present
-        return latest[1:] if latest.startswith("v") else latest
-    except (subprocess.TimeoutExpired, subprocess.SubprocessError, OSError):
+            tags.append(ref.replace("refs/tags/", ""))
+    return tags
+
+
+def fetch_tags_from_mirror(repo: str, timeout: float = 10) -> list[str] | None:
+    """Read the tags of a repo from the KUDOSX_MIRROR tag lists.
+
+    Returns:
+        Tag names, or None if the mirror has no tag list for the repo
+    """
+    try:
+        with request_with_retry(Request(mirror_url(tags_path(repo))), timeout=timeout) as response:
+            tags = json.loads(response.read())
+    except (URLError, OSError, ValueError):
         return None
+    return tags if isinstance(tags, list) else None
+
+
+def latest_version_from_tags(tags: list[str] | None) -> str | None:
+    """Pick the highest semantic version from a list of tags.
+
+    Returns:
+        Version string without a "v" prefix, or None if there are no tags
+    """
+    if not tags:
+        return None
+    latest = max(tags, key=parse_version)
+    # Strip 'v' prefix if present
+    return latest[1:] if latest.startswith("v") else latest
+
+
+def fetch_tags(repo: str, use_cache: bool = True, timeout: float = 10) -> list[str] | None:
+    """List the tags of a repo, from the TagCache, KUDOSX_MIRROR or GitHub.
+
+    Uses git ls-remote instead of GitHub API to avoid rate limiting. Tag
+    lists are kept in a persistent TagCache; failed lookups are cached for
+    a shorter time. With KUDOSX_MIRROR set, the mirror's tag list is used
+    instead (and not cached).
+
+    Args:
+        repo: GitHub repo in format "owner/repo"
+        use_cache: Reuse a cached tag list instead of always asking GitHub
+        timeout: Seconds to wait for git ls-remote
+
+    Returns:
+        Tag names (empty if the repo has none), or None if the lookup failed
+    """
+    if mirror_base():
+        return fetch_tags_from_mirror(repo, timeout)
+
+    cache = TagCache()
+    if use_cache:
+        hit, tags = cache.get(repo)
+        if hit:
+            return tags
+
+    tags = fetch_tags_from_git(repo, timeout)
+    cache.put(repo, tags)
+    return tags
+
+
+def fetch_latest_version_from_git(repo: str, use_cache: bool = True, timeout: float = 10) -> str | None:
+    """Fetch the latest version tag of a repo (see fetch_tags).
+
+    Args:
+        repo: GitHub repo in format "owner/repo"
+        use_cache: Reuse a cached tag list instead of always asking GitHub
+        timeout: Seconds to wait for git ls-remote
+
+    Returns:
+        Version string (e.g., "0.1.0") or None if not found
+    """
+    return latest_version_from_tags(fetch_tags(repo, use_cache, timeout))
+
+
+# Concurrent lookups when resolving the latest versions of many repos
+DEFAULT_RESOLVE_JOBS = 8
+
+
+def resolve_latest_versions(repos, jobs: int = DEFAULT_RESOLVE_JOBS) -> dict[str, str | None]:
+    """Resolve the latest versions of several repos concurrently.
+
+    Each distinct repo is looked up once with get_latest_version on a pool
+    of up to ``jobs`` threads, so the wall time is about that of the
+    slowest lookup rather than the sum of all of them.
+
+    Args:
+        repos: GitHub repos in format "owner/repo" (duplicates allowed)
+        jobs: Maximum number of concurrent lookups
+
+    Returns:
+        Dict of repo -> latest version (None if not found)
+    """
+    unique = list(dict.fromkeys(repos))
+    if len(unique) <= 1 or jobs <= 1:
+        return {repo: get_latest_version(repo) for repo in unique}
+    with ThreadPoolExecutor(max_workers=min(jobs, len(unique))) as pool:
+        return dict(zip(unique, pool.map(get_latest_version, unique)))
+
+
+# Seconds a cached archive is trusted without revalidating it with GitHub
+ARCHIVE_FRESH_SECONDS = 300
+
+
+def fetch_skill_archive(
+    repo: str, ref: str = "main", progress: DownloadProgress | None = None
+) -> Path:
+    """Return a local copy of a repository archive, downloading it if needed.
+
+    Archives live in the content-addressed ArchiveCache. A copy checked
+    within ARCHIVE_FRESH_SECONDS is used as is; an older one is revalidated
+    with If-None-Match and reused on 304 Not Modified. If GitHub cannot be
+    reached, a cached copy is used when there is one. Downloads are streamed
+    to disk in chunks and hashed on the fly.
+
+    With KUDOSX_MIRROR set, the archive comes from the mirror: a local
+    mirror's file is used in place, and an HTTP mirror is downloaded from
+    (and cached) like GitHub, under a cache key that includes the mirror
+    URL so copies from different sources are never mixed up.
+
+    Args:
+        repo: GitHub repo in format "owner/repo"
+        ref: Branch to download
+        progress: Progress reporter (default: print throughput when done)
+
+    Returns:
+        Path of the cached (or mirrored) zip archive
+    """
+    mirror = mirror_base()
+    if mirror:
+        mirrored = mirror_local_path(archive_path(repo, ref), mirror)
+        if mirrored is not None:
+            if not mirrored.is_file():
+                raise click.ClickException(f"{repo}@{ref} is not in the mirror at {mirror}")
+            click.echo(f"Using mirrored archive for {repo}@{ref}")
+            return mirrored
+        zip_url = mirror_url(archive_path(repo, ref), mirror)
+    else:
+        zip_url = f"https://github.com/{repo}/archive/refs/heads/{ref}.zip"
+
+    cache = ArchiveCache()
+    cached = cache.lookup(repo, ref, mirror)
+    if cached and time.time() - cached["checked_at"] < ARCHIVE_FRESH_SECONDS:
+        click.echo(f"Using cached archive for {repo}@{ref}")
+        return cached["path"]
+
+    headers = {"User-Agent": "kudosx"}
+    if cached and cached.get("etag"):
+        headers["If-None-Match"] = cached["etag"]
+
+    click.echo(f"Downloading from {zip_url}...")
+
+    if progress is None:
+        progress = DownloadProgress()
+    download = cache.temp_file()
+    try:
+        with request_with_retry(Request(zip_url, headers=headers), timeout=30) as response:
+            etag = response.headers.get("ETag")
+            with open(download, "wb") as f:
+                sha256, size = stream_to_file(response, f, progress=progress)
+        progress.finish(size)
+        return cache.store(repo, ref, download, sha256, etag, mirror)
+    except HTTPError as e:
+        if e.code == 304 and cached:
+            cache.touch(repo, ref, mirror)
+            click.echo("Archive unchanged, using cached copy")
+            return cached["path"]
+        if cached:
+            click.echo(f"Download failed (HTTP {e.code}), using cached copy")
+            return cached["path"]
+        raise click.ClickException(f"Failed to download: HTTP {e.code} - {e.reason}")
+    except URLError as e:
+        if cached:
+            click.echo("Download failed, using cached copy")
+            return cached["path"]
+        raise click.ClickException(f"Failed to download: {e.reason}")
+    except ssl.SSLError as e:
+        raise click.ClickException(f"SSL error during download: {e}")
+    finally:
+        download.unlink(missing_ok=True)
+
+
+def _skill_members(zip_ref: zipfile.ZipFile, source_path: str):
+    """Yield (info, relative path parts) for the archive members under source_path.
+
+    GitHub archives wrap the repository in a single top-level folder
+    (e.g. "repo-main/"), which is skipped.
+    """
+    members = zip_ref.infolist()
+    if not members:
+        raise click.ClickException("No directory found in extracted archive")
+
+    root = members[0].filename.split("/", 1)[0]
+    prefix = f"{root}/{source_path.strip('/')}/"
+    found = False
+
+    for info in members:
+        if not info.filename.startswith(prefix):
+            continue
+        found = True
+        relative = info.filename[len(prefix):]
+        parts = [p for p in relative.split("/") if p]
+        if not parts:
+            continue
+        if any(p == ".." for p in parts) or relative.startswith("/"):
+            raise click.ClickException(f"Unsafe path in archive: {info.filename}")
+        yield info, parts
+
+    if not found:
+        raise click.ClickException(f"Skill folder not found at '{source_path}' in repository")
+
+
+def extract_zip_subtree(
+    zip_path: Path, source_path: str, dest: Path, manifest: dict | None = None
+) -> int:
+    """Extract only the members under source_path from a repository archive.
+
+    Members are streamed straight into dest, so only the skill's files are
+    ever written. Permission bits recorded in the archive (e.g. an
+    executable script) are applied to the extracted files.
+
+    Args:
+        zip_path: Repository zip archive
+        source_path: Folder within the repository to extract
+        dest: Existing directory to extract into
+        manifest: If given, filled with a manifest entry per extracted file
+
+    Returns:
+        Number of files extracted
+    """
+    files = 0
+    with zipfile.ZipFile(zip_path, "r") as zip_ref:
+        for info, parts in _skill_members(zip_ref, source_path):
+            member_path = dest.joinpath(*parts)
+            if info.is_dir():
+                member_path.mkdir(parents=True, exist_ok=True)
+                continue
+            member_path.parent.mkdir(parents=True, exist_ok=True)
+            with zip_ref.open(info) as src, open(member_path, "wb") as dst:
+                digest, _ = stream_to_file(src, dst)
+            mode = _member_mode(info)
+            if mode is not None:
+                os.chmod(member_path, mode)
+            relative = "/".join(parts)
+            if manifest is not None and relative not in UNTRACKED_FILES:
+                manifest[relative] = manifest_entry(member_path, digest)
+            files += 1
+    return files
+
+
+def _member_sha256(zip_ref: zipfile.ZipFile, info: zipfile.ZipInfo) -> str:
+    digest = hashlib.sha256()
+    with zip_ref.open(info) as src:
+        for chunk in iter(lambda: src.read(CHUNK_SIZE), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _member_mode(info: zipfile.ZipInfo) -> int | None:
+    """Permission bits recorded for an archive member (None if it has none)."""
+    mode = (info.external_attr >> 16) & 0o777
+    return mode or None
+
+
+def _replace_with_member(zip_ref: zipfile.ZipFile, info: zipfile.ZipInfo, path: Path) -> str:
+    """Atomically replace path with an archive member, returning its sha256.
+
+    The file gets the member's permission bits when the archive records
+    them, otherwise those of the file it replaces (0644 for a new file).
+    """
+    if path.is_dir() and not path.is_symlink():
+        shutil.rmtree(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    mode = _member_mode(info)
+    if mode is None:
+        try:
+            mode = os.stat(path).st_mode & 0o7777
+        except FileNotFoundError:
+            mode = 0o644
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as dst, zip_ref.open(info) as src:
+            digest, _ = stream_to_file(src, dst)
+        os.chmod(tmp_name, mode)
+        os.replace(tmp_name, path)
+    except BaseException:
+        Path(tmp_name).unlink(missing_ok=True)
+        raise
+    return digest
+
+
+def _sync_skill_files(
+    target_path: Path,
+    manifest: dict,
+    wanted: dict[str, str],
+    write: Callable[[str, Path], None],
+    version: str | None,
+) -> tuple[int, int]:
+    """Bring an installed skill in line with a wanted set of files.
+
+    Files whose installed hash differs from the wanted one are passed to
+    write (which must replace them atomically), files listed in the old
+    manifest but no longer wanted are deleted, and VERSION and the manifest
+    are rewritten last. An interrupted update therefore keeps the old
+    VERSION and is completed by the next one. Files that were never part of
+    the skill (not in the manifest) are left alone.
+
+    Each file is swapped atomically, but the skill as a whole is not: a
+    session reading it during the update can see some files from the old
+    version and some from the new one. That is the price of not rewriting
+    unchanged files.
+
+    Args:
+        target_path: Installed skill directory
+        manifest: Manifest of the installed skill
+        wanted: Relative path -> sha256 of every file the skill should have
+        write: Called with (relative path, destination) for each file to write
+        version: Version string to save in VERSION file
+
+    Returns:
+        Tuple of (files written, files removed)
+    """
+    new_manifest = {}
+    written = 0
+    for relative, digest in wanted.items():
+        path = target_path.joinpath(*relative.split("/"))
+        if installed_sha256(target_path, relative, manifest.get(relative)) != digest:
+            if path.is_dir() and not path.is_symlink():
+                shutil.rmtree(path)
+            path.parent.mkdir(parents=True, exist_ok=True)
+            write(relative, path)
+            written += 1
+        new_manifest[relative] = manifest_entry(path, digest)
+
+    removed = 0
+    for relative in manifest.keys() - new_manifest.keys():
+        path = target_path.joinpath(*relative.split("/"))
+        if path.is_file() or path.is_symlink():
+            path.unlink()
+            removed += 1
+        # Prune directories left empty
+        parent = path.parent
+        while parent != target_path and parent.is_dir() and not any(parent.iterdir()):
+            parent.rmdir()
+            parent = parent.parent
+
+    if version:
+        version_file = target_path / "VERSION"
+        if not version_file.is_file() or version_file.read_text() != version + "\n":
+            atomic_write_bytes(version_file, (version + "\n").encode("utf-8"))
+    write_manifest(target_path, new_manifest)
+    return written, removed
+
+
+def apply_skill_delta(
+    zip_path: Path, source_path: str, target_path: Path, manifest: dict, version: str | None = None
+) -> tuple[int, int]:
+    """Update an installed skill in place from an archive, touching only changed files.
+
+    Every member is hashed first (which also validates the archive), so a
+    bad archive fails before anything is written; see _sync_skill_files.
+
+    Args:
+        zip_path: Repository zip archive
+        source_path: Path within the repo to the skill folder
+        target_path: Installed skill directory
+        manifest: Manifest of the installed skill
+        version: Version string to save in VERSION file
+
+    Returns:
+        Tuple of (files written, files removed)
+    """
+    with zipfile.ZipFile(zip_path, "r") as zip_ref:
+        members = {}
+        wanted = {}
+        for info, parts in _skill_members(zip_ref, source_path):
+            relative = "/".join(parts)
+            if not info.is_dir() and relative not in UNTRACKED_FILES:
+                members[relative] = info
+                wanted[relative] = _member_sha256(zip_ref, info)
+
+        def write(relative: str, path: Path) -> None:
+            _replace_with_member(zip_ref, members[relative], path)
+
+        return _sync_skill_files(target_path, manifest, wanted, write, version)
+
+
+def install_from_store(
+    store_path: Path, stored: dict, target_path: Path, version: str
+) -> tuple[int, int]:
+    """Install a skill from its SkillStore directory.
+
+    Files are materialized with replace_with_clone (reflink, hardlink or
+    copy). An existing install with a manifest is updated in place like
+    apply_skill_delta; otherwise the skill is assembled in a staging
+    directory and swapped in.
+
+    Args:
+        store_path: Stored skill version directory
+        stored: Manifest of the stored version
+        target_path: Path to install the skill to
+        version: Version string to save in VERSION file
+
+    Returns:
+        Tuple of (files written, files removed)
+    """
+    wanted = {relative: entry["sha256"] for relative, entry in stored.items()}
+
+    def write(relative: str, path: Path) -> None:
+        replace_with_clone(store_path.joinpath(*relative.split("/")), path)
+
+    manifest = read_manifest(target_path) if target_path.is_dir() else None
+    if manifest is not None:
+        return _sync_skill_files(target_path, manifest, wanted, write, version)
+
+    with staged_directory(target_path) as staging:
+        result = _sync_skill_files(staging, {}, wanted, write, version)
+    return result
+
+
+def install_skill_archive(
+    zip_path: Path | None,
+    source_path: str,
+    target_path: Path,
+    version: str | None = None,
+    force: bool = False,
+) -> tuple[int, int]:
+    """Install a skill from a downloaded repository archive.
+
+    With a version, the skill is extracted once into the shared SkillStore
+    (skipped when that version is already stored, in which case zip_path
+    may be None) and installed from there with install_from_store. The
+    store is keyed by version but filled from the branch archive, so
+    ``force`` re-extracts the stored version from zip_path. Without
+    one, a skill installed with a manifest is updated in place with
+    apply_skill_delta, and anything else is extracted into a staging
+    directory next to target_path, flushed to disk and swapped in with
+    renames.
+
+    A new install (or one without a manifest) is swapped in as a whole, so
+    the previous install stays in place until the swap succeeds. Updating
+    an install that has a manifest, from the store or an archive, replaces
+    only the changed files in the live directory, one atomic rename at a
+    time: no file is ever half-written, but a session reading the skill
+    mid-update can see a mix of old and new files, and an interrupted
+    update leaves such a mix (with the old VERSION) until the next one.
+
+    Args:
+        zip_path: Repository zip archive
+        source_path: Path within the repo to the skill folder
+        target_path: Path to extract the skill to
+        version: Version string to save in VERSION file
+        force: Replace the stored version with the one in zip_path
+
+    Returns:
+        Tuple of (files written, files removed)
+    """
+    if version:
+        store = SkillStore()
+        skill = target_path.name
+        stored = None if force and zip_path is not None else store.lookup(skill, version)
+        if stored is None:
+            if zip_path is None:
+                raise click.ClickException(f"{skill} {version} is not in the local store")
+            stored = store.add(
+                skill, version,
+                lambda staging, manifest: extract_zip_subtree(zip_path, source_path, staging, manifest),
+            )
+        return install_from_store(store.path(skill, version), stored, target_path, version)
+
+    manifest = read_manifest(target_path) if target_path.is_dir() else None
+    if manifest is not None:
+        return apply_skill_delta(zip_path, source_path, target_path, manifest, version)
+
+    manifest = {}
+    with staged_directory(target_path) as staging:
+        files = extract_zip_subtree(zip_path, source_path, staging, manifest)
+        write_manifest(staging, manifest)
+    return files, 0
+
+
+def is_stored(target_dirs, version: str | None) -> bool:
+    """Check whether every given skill is in the SkillStore at a version."""
+    if not version:
+        return False
+    store = SkillStore()
+    return all(store.lookup(target_dir, version) is not None for target_dir in target_dirs)
 
 
 def download_and_extract_skill(
-    repo: str, source_path: str, target_path: Path, version: str | None = None
+    repo: str, source_path: str, target_path: Path, version: str | None = None, force: bool = False
 ) -> None:
     """Download a GitHub repo and extract only the skill folder.
 
+    Nothing is downloaded when the version is already in the SkillStore,
+    unless force is set.
+
     Args:
         repo: GitHub repo in format "owner/repo"
         source_path: Path within the repo to the skill folder (e.g., ".claude/skills/browser-use")
         target_path: Path to extract the skill to
         version: Version string to save in VERSION file
+        force: Download again and refresh the stored version
     """
-    zip_url = f"https://github.com/{repo}/archive/refs/heads/main.zip"
+    if not force and is_stored([target_path.name], version):
+        click.echo("Linking from local store...")
+        install_skill_archive(None, source_path, target_path, version)
+        return
 
-    click.echo(f"Downloading from {zip_url}...")
+    zip_path = fetch_skill_archive(repo)
 
-    with tempfile.TemporaryDirectory() as tmp_dir:
-        tmp_path = Path(tmp_dir)
-        zip_path = tmp_path / "repo.zip"
+    click.echo("Extracting archive...")
+    install_skill_archive(zip_path, source_path, target_path, version, force=force)
 
-        # Download zip file
-        try:
-            with urlopen_with_retry(zip_url, timeout=30) as response:
-                with open(zip_path, "wb") as f:
-                    f.write(response.read())
-        except HTTPError as e:
-            raise click.ClickException(f"Failed to download: HTTP {e.code} - {e.reason}")
-        except URLError as e:
-            raise click.ClickException(f"Failed to download: {e.reason}")
-        except ssl.SSLError as e:
-            raise click.ClickException(f"SSL error during download: {e}")
 
-        click.echo("Extracting archive...")
+# Concurrent repository downloads when installing several skills
+DEFAULT_INSTALL_JOBS = 4
 
-        # Extract zip file
-        with zipfile.ZipFile(zip_path, "r") as zip_ref:
-            zip_ref.extractall(tmp_path)
 
-        # Find extracted folder (usually repo-name-main)
-        extracted_dirs = [d for d in tmp_path.iterdir() if d.is_dir()]
-        if not extracted_dirs:
-            raise click.ClickException("No directory found in extracted archive")
+def _error_message(error: Exception) -> str:
+    if isinstance(error, click.ClickException):
+        return error.format_message()
+    return str(error) or type(error).__name__
 
-        extracted_dir = extracted_dirs[0]
 
-        # Find the skill source folder within the extracted repo
-        skill_source = extracted_dir / source_path
-        if not skill_source.exists():
-            raise click.ClickException(f"Skill folder not found at '{source_path}' in repository")
+def _fetch_skill_repo(
+    repo: str, interactive: bool | None, target_dirs: list[str], force: bool = False
+) -> tuple[str | None, Path | None]:
+    """Resolve the latest version of a repo and fetch its archive.
+
+    The archive is None when every skill needed from the repo is already
+    in the SkillStore at that version (and force is not set).
+    """
+    click.echo(f"Fetching latest version from {repo}...")
+    version = get_latest_version(repo)
+    if not force and is_stored(target_dirs, version):
+        return version, None
+    progress = DownloadProgress(label=f"Downloaded {repo}:", interactive=interactive)
+    return version, fetch_skill_archive(repo, progress=progress)
 
-        # Create target parent directory if needed
-        target_path.parent.mkdir(parents=True, exist_ok=True)
 
-        # Remove existing target if exists
-        if target_path.exists():
-            shutil.rmtree(target_path)
+def install_skills(
+    names: list[str], skills_dir: Path, jobs: int = DEFAULT_INSTALL_JOBS, force: bool = False
+) -> dict[str, str]:
+    """Install several skills, downloading concurrently.
 
-        # Copy only the skill folder to target
-        shutil.copytree(skill_source, target_path)
+    Versions are resolved and archives fetched on a pool of up to ``jobs``
+    threads, one task per repository. Extraction is pipelined behind the
+    downloads: each skill is installed on the calling thread as soon as its
+    archive is ready, while the remaining downloads continue.
 
-        # Save version file if version is provided
-        if version:
-            version_file = target_path / "VERSION"
-            version_file.write_text(version + "\n")
+    Args:
+        names: Skill names from the registry
+        skills_dir: Directory the skills are installed into
+        jobs: Maximum number of concurrent downloads
+        force: Download even versions already in the SkillStore
+
+    Returns:
+        Dict of skill name -> error message for skills that failed
+    """
+    total = len(names)
+    by_repo: dict[str, list[str]] = {}
+    for name in names:
+        by_repo.setdefault(SKILLS[name]["repo"], []).append(name)
+
+    # Progress is only redrawn in place when a single download is running
+    interactive = None if len(by_repo) == 1 else False
+    failures: dict[str, str] = {}
+    done = 0
+
+    with ThreadPoolExecutor(max_workers=max(1, min(jobs, len(by_repo)))) as pool:
+        futures = {
+            pool.submit(
+                _fetch_skill_repo, repo, interactive, [SKILLS[name]["target_dir"] for name in repo_names], force
+            ): repo
+            for repo, repo_names in by_repo.items()
+        }
+        for future in as_completed(futures):
+            repo = futures[future]
+            try:
+                version, zip_path = future.result()
+                error = None
+            except Exception as e:
+                error = _error_message(e)
+
+            for name in by_repo[repo]:
+                done += 1
+                prefix = f"[{done}/{total}] " if total > 1 else ""
+                target_path = skills_dir / SKILLS[name]["target_dir"]
+                if error is None:
+                    try:
+                        install_skill_archive(
+                            zip_path, SKILLS[name]["source_path"], target_path, version, force=force
+                        )
+                    except Exception as e:
+                        failures[name] = _error_message(e)
+                else:
+                    failures[name] = error
+
+                if name in failures:
+                    click.secho(f"{prefix}Failed to install {name}: {failures[name]}", fg="red")
+                elif version:
+                    click.secho(f"{prefix}Successfully installed {name} {version} to {target_path}", fg="green")
+                else:
+                    click.secho(f"{prefix}Successfully installed {name} to {target_path}", fg="green")
+
+    return failures
 
 
 @click.command("add")
-@click.argument("name")
+@click.argument("names", nargs=-1)
+@click.option(
+    "--all",
+    "-a",
+    "install_all",
+    is_flag=True,
+    help="Install every skill in the registry",
+)
 @click.option(
     "--force",
     "-f",
@@ -327,10 +1052,17 @@ def download_and_extract_skill(
     is_flag=True,
     help="Install to project folder (./.claude/skills) instead of home (~/.claude/skills)",
 )
-def add(name: str, force: bool, local: bool):
-    """Add a skill or extension to Claude Code.
+@click.option(
+    "--jobs",
+    "-j",
+    default=DEFAULT_INSTALL_JOBS,
+    show_default=True,
+    help="Number of skills to download concurrently",
+)
+def add(names: tuple[str, ...], install_all: bool, force: bool, local: bool, jobs: int):
+    """Add skills or extensions to Claude Code.
 
-    NAME is the skill/extension to install.
+    NAMES are the skills/extensions to install.
 
     Available skills:
 
@@ -344,51 +1076,56 @@ def add(name: str, force: bool, local: bool):
 
         kudosx add browser-use
 
-        kudosx add browser-use --force
+        kudosx add browser-use cloud-aws product-aio
 
-        kudosx add browser-use --local
+        kudosx add --all --local
+
+        kudosx add browser-use --force
     """
-    if name not in SKILLS:
+    if install_all:
+        names = tuple(SKILLS)
+    if not names:
+        click.secho("Error: Specify skill names or use --all", fg="red")
+        raise SystemExit(1)
+
+    unknown = [name for name in names if name not in SKILLS]
+    if unknown:
         available = ", ".join(SKILLS.keys())
-        click.secho(f"Error: Unknown skill '{name}'", fg="red")
+        if len(unknown) == 1:
+            click.secho(f"Error: Unknown skill '{unknown[0]}'", fg="red")
+        else:
+            click.secho(f"Error: Unknown skills: {', '.join(unknown)}", fg="red")
         click.echo(f"Available skills: {available}")
         raise SystemExit(1)
 
-    skill_config = SKILLS[name]
-    repo = skill_config["repo"]
-    source_path = skill_config["source_path"]
-    target_dir = skill_config["target_dir"]
-
     # Target path: ./.claude/skills (local) or ~/.claude/skills (global)
     if local:
         skills_dir = Path.cwd() / ".claude" / "skills"
     else:
         skills_dir = Path.home() / ".claude" / "skills"
-    target_path = skills_dir / target_dir
 
-    if target_path.exists() and not force:
-        click.secho(f"Skill already installed at {target_path}", fg="yellow")
+    pending = []
+    for name in dict.fromkeys(names):
+        target_path = skills_dir / SKILLS[name]["target_dir"]
+        if target_path.exists() and not force:
+            click.secho(f"Skill already installed at {target_path}", fg="yellow")
+        else:
+            pending.append(name)
+
+    if not pending:
         click.echo("Use --force to reinstall")
         raise SystemExit(1)
 
     location = "project" if local else "global"
-
-    # Fetch latest version from GitHub
-    click.echo(f"Fetching latest version from {repo}...")
-    version = get_latest_version(repo)
-    if version:
-        click.echo(f"Latest version: {version}")
-
-    click.echo(f"Installing '{name}' from {repo} ({location})...")
-
-    try:
-        download_and_extract_skill(repo, source_path, target_path, version)
-        if version:
-            click.secho(f"Successfully installed {name} {version} to {target_path}", fg="green")
-        else:
-            click.secho(f"Successfully installed {name} to {target_path}", fg="green")
-    except click.ClickException:
-        raise
-    except Exception as e:
-        click.secho(f"Error: {e}", fg="red")
+    if len(pending) == 1:
+        click.echo(f"Installing '{pending[0]}' ({location})...")
+    else:
+        click.echo(f"Installing {len(pending)} skills ({location}), up to {jobs} downloads at a time...")
+
+    failures = install_skills(pending, skills_dir, jobs, force=force)
+    if failures:
+        if len(pending) > 1:
+            click.secho(f"\nFailed to install {len(failures)} of {len(pending)} skills:", fg="red")
+            for name, error in failures.items():
+                click.echo(f"  {name}: {error}")
         raise SystemExit(1)
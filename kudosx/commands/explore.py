@@ -12,10 +12,11 @@ from textual.binding import Binding
 from textual.containers import Horizontal, Vertical, Center
 from textual.reactive import reactive
 from textual.screen import ModalScreen
-from textual.widgets import Button, DataTable, Footer, Static
+from rich.markup import escape
+from textual.widgets import Button, DataTable, Footer, Input, Static
 from textual.worker import Worker
 
-from kudosx.commands.add import SKILLS, get_latest_version, download_and_extract_skill
+from kudosx.commands.add import SKILLS, download_and_extract_skill, resolve_latest_versions
 from kudosx import __version__, __package_name__
 from kudosx.utils.claude_usage import (
     get_claude_usage as get_usage_from_sessions,
@@ -23,6 +24,9 @@ from kudosx.utils.claude_usage import (
     aggregate_usage,
     calculate_totals,
 )
+from kudosx.utils.file_index import FileIndex
+from kudosx.utils.fuzzy import FuzzyFinder
+from kudosx.utils.registry import registry_freshness
 from kudosx.utils.version import is_update_available, format_version
 
 # Claude Code built-in agents
@@ -34,6 +38,9 @@ AGENTS = [
     {"name": "skill-adder", "type": "automation", "description": "Add new skills to projects"},
 ]
 
+# Maximum number of rows shown in the finder view
+FINDER_LIMIT = 200
+
 BANNER_ART = [
     "  ██╗  ██╗██╗   ██╗██████╗  ██████╗ ███████╗██╗   ██╗  ",
     "  ██║ ██╔╝██║   ██║██╔══██╗██╔═══██╗██╔════╝╚██╗ ██╔╝  ",
@@ -104,9 +111,19 @@ class SystemInfo(Static):
             f"[#d77757]OS     :[/] {os_name}\n"
             f"[#d77757]Python :[/] {py_ver}\n"
             f"[#d77757]Claude :[/] {self._claude_version}\n"
-            f"[#d77757]Kudosx :[/] {__version__}"
+            f"[#d77757]Kudosx :[/] {__version__}\n"
+            f"[#d77757]Skills :[/] {self._registry_status()}"
         )
 
+    def _registry_status(self) -> str:
+        """Compact freshness of the cached skills registry."""
+        state, age = registry_freshness()
+        if state == "fresh":
+            return f"[green]{age}[/]"
+        if state == "stale":
+            return f"[yellow]{age}[/]"
+        return f"[yellow]{'offline' if state == 'offline' else 'bundled'}[/]"
+
 
 class ExplorerTabs(Static):
     """Vertical explorer tabs."""
@@ -117,7 +134,7 @@ class ExplorerTabs(Static):
         """Render vertical tabs.
 
         Format: key  label with shortcut letter underlined (lowercase).
-        Example: a  agents, k  skills, c  commands, u  usage
+        Example: a  agents, k  skills, c  commands, u  usage, f  finder
         """
         # (key, before_underline, underline_char, after_underline, tab_name)
         tabs = [
@@ -125,6 +142,7 @@ class ExplorerTabs(Static):
             ("k", "s", "k", "ills", "skills"),       # k  s_k_ills
             ("c", "", "c", "ommands", "commands"),   # c  _c_ommands
             ("u", "", "u", "sage", "usage"),         # u  _u_sage
+            ("f", "", "f", "inder", "finder"),       # f  _f_inder
         ]
         lines = []
         for key, before, char, after, tab_name in tabs:
@@ -276,7 +294,7 @@ class ExploreTUI(App):
     }
 
     #header {
-        height: 8;
+        height: 9;
         layout: horizontal;
         background: #1e1e1e;
         margin: 1 1 0 1;
@@ -315,6 +333,15 @@ class ExploreTUI(App):
         display: block;
     }
 
+    #finder-input {
+        margin: 0 1;
+        display: none;
+    }
+
+    #finder-input.visible {
+        display: block;
+    }
+
     #data-table {
         background: #1e1e1e;
         margin: 1 1 0 1;
@@ -353,6 +380,8 @@ class ExploreTUI(App):
         Binding("k", "show_skills", "Skills"),
         Binding("c", "show_commands", "Commands"),
         Binding("u", "show_usage", "Usage"),
+        Binding("f", "show_finder", "Finder"),
+        Binding("escape", "focus_table", "Back to list", show=False),
         Binding("d", "usage_daily", "Daily", show=False),
         Binding("w", "usage_weekly", "Weekly", show=False),
         Binding("m", "usage_monthly", "Monthly", show=False),
@@ -375,6 +404,8 @@ class ExploreTUI(App):
         self.usage_data = []
         self._cached_usage: dict | None = None
         self._latest_versions: dict | None = None
+        self._finder: FuzzyFinder | None = None
+        self.finder_data = []
 
     def compose(self) -> ComposeResult:
         with Horizontal(id="header"):
@@ -382,6 +413,7 @@ class ExploreTUI(App):
             yield ExplorerTabs(id="explorer-tabs")
             yield Static(self._render_banner(), id="banner")
         yield UsagePeriodTabs(id="usage-period-tabs")
+        yield Input(placeholder="Type to fuzzy find files...", id="finder-input")
         yield ExploreTable(id="data-table")
         yield Footer()
 
@@ -399,12 +431,17 @@ class ExploreTUI(App):
         self.sub_title = "Explorer"
         table = self.query_one("#data-table", DataTable)
         table.fixed_columns = 0
+        table.focus()
         self.load_skills()
 
     def watch_current_view(self, view: str) -> None:
         """React to current_view changes."""
         explorer_tabs = self.query_one("#explorer-tabs", ExplorerTabs)
         explorer_tabs.current_tab = view
+        finder_input = self.query_one("#finder-input", Input)
+        finder_input.set_class(view == "finder", "visible")
+        if view != "finder" and finder_input.has_focus:
+            self.query_one("#data-table", DataTable).focus()
 
     def load_skills(self) -> None:
         """Load skills data into the table."""
@@ -461,6 +498,8 @@ class ExploreTUI(App):
             )
 
         table.cursor_type = "row"
+        # Loading SKILLS above may have fetched the registry
+        self.query_one(SystemInfo).refresh()
 
         # Fetch latest versions in background if not cached
         if not self._latest_versions:
@@ -478,11 +517,10 @@ class ExploreTUI(App):
         return "[green]installed[/green]"
 
     def _fetch_latest_versions(self) -> dict:
-        """Fetch latest versions from GitHub in background."""
-        versions = {}
-        for skill_name, config in SKILLS.items():
-            versions[skill_name] = get_latest_version(config["repo"])
-        return versions
+        """Fetch latest versions from GitHub in background, all repos concurrently."""
+        skills = dict(SKILLS.items())
+        latest = resolve_latest_versions(config["repo"] for config in skills.values())
+        return {skill_name: latest[config["repo"]] for skill_name, config in skills.items()}
 
     def load_agents(self) -> None:
         """Load agents data into the table."""
@@ -605,6 +643,64 @@ class ExploreTUI(App):
         else:
             self.run_worker(self._fetch_usage, thread=True, name="_fetch_usage")
 
+    def load_finder(self) -> None:
+        """Show the fuzzy file finder for the current directory."""
+        self.current_view = "finder"
+        table = self.query_one("#data-table", DataTable)
+        table.clear(columns=True)
+        table.border_title = "Finder"
+        table.add_column("PATH", width=80)
+        table.add_column("SCORE", width=8)
+        table.add_column(" ", width=500)
+        table.cursor_type = "row"
+
+        finder_input = self.query_one("#finder-input", Input)
+        finder_input.focus()
+
+        if self._finder is None:
+            self.finder_data = []
+            table.add_row("[dim]Indexing files...[/dim]", "", " ")
+            self.run_worker(self._build_finder, thread=True, name="_build_finder")
+        else:
+            self._update_finder_table(finder_input.value)
+
+    def _build_finder(self) -> FuzzyFinder:
+        """Load the filename index for the current directory in background."""
+        index = FileIndex(Path.cwd())
+        index.ensure()
+        return FuzzyFinder(index.paths)
+
+    def _update_finder_table(self, query: str) -> None:
+        """Re-rank finder results for the current query.
+
+        The finder keeps the candidates of the previous query, so each
+        keystroke only re-filters the paths that still matched.
+        """
+        if self._finder is None:
+            return
+        table = self.query_one("#data-table", DataTable)
+        table.clear()
+        self.finder_data = self._finder.search(query, limit=FINDER_LIMIT)
+        if self._finder.unscored:
+            matched = self._finder.max_scored + self._finder.unscored
+            table.border_title = f"Finder (ranked {self._finder.max_scored} of {matched} matches)"
+        else:
+            table.border_title = "Finder"
+        for score, path, positions in self.finder_data:
+            marked = set(positions)
+            label = "".join(
+                f"[bold #d77757]{escape(char)}[/]" if i in marked else escape(char)
+                for i, char in enumerate(path)
+            )
+            table.add_row(label, f"[dim]{score}[/dim]" if query.strip() else "", " ")
+        if not self.finder_data:
+            table.add_row("[dim]No matching files[/dim]", "", " ")
+
+    def on_input_changed(self, event: Input.Changed) -> None:
+        """Re-rank finder results as the query changes."""
+        if event.input.id == "finder-input" and self.current_view == "finder":
+            self._update_finder_table(event.value)
+
     def _fetch_usage(self) -> dict:
         """Fetch usage data in background thread."""
         return get_claude_usage()
@@ -615,6 +711,10 @@ class ExploreTUI(App):
             if event.worker.name == "_fetch_usage":
                 self._cached_usage = event.worker.result
                 self._update_usage_table(event.worker.result)
+            elif event.worker.name == "_build_finder":
+                self._finder = event.worker.result
+                if self.current_view == "finder":
+                    self._update_finder_table(self.query_one("#finder-input", Input).value)
             elif event.worker.name == "_fetch_latest_versions":
                 self._latest_versions = event.worker.result
                 # Refresh skills table with latest versions
@@ -728,6 +828,15 @@ class ExploreTUI(App):
         """Switch to usage view."""
         self.load_usage()
 
+    def action_show_finder(self) -> None:
+        """Switch to finder view."""
+        self._hide_period_tabs()
+        self.load_finder()
+
+    def action_focus_table(self) -> None:
+        """Move focus from the finder input back to the table."""
+        self.query_one("#data-table", DataTable).focus()
+
     def action_usage_daily(self) -> None:
         """Switch to daily usage view or delete skill."""
         if self.current_view == "usage":
@@ -751,12 +860,16 @@ class ExploreTUI(App):
             self._cached_usage = None  # Clear cache on refresh
         elif self.current_view == "skills":
             self._latest_versions = None  # Clear cache to re-fetch latest versions
+        elif self.current_view == "finder":
+            self._finder = None  # Re-validate the filename index
         if self.current_view == "agents":
             self.load_agents()
         elif self.current_view == "commands":
             self.load_commands()
         elif self.current_view == "usage":
             self.load_usage()
+        elif self.current_view == "finder":
+            self.load_finder()
         else:
             self.load_skills()
         self.notify(f"{self.current_view.capitalize()} refreshed", severity="information")
@@ -764,11 +877,13 @@ class ExploreTUI(App):
     def action_help(self) -> None:
         """Show help."""
         if self.current_view == "usage":
-            msg = "a/k/c/u: Switch view | d/w/m: Period | q: Quit | r: Refresh"
+            msg = "a/k/c/u/f: Switch view | d/w/m: Period | q: Quit | r: Refresh"
         elif self.current_view == "skills":
             msg = "Enter: Install | g: Global | l: Local | d: Delete | r: Refresh | q: Quit"
+        elif self.current_view == "finder":
+            msg = "Type to filter | Esc: Back to list | f: Search again | r: Refresh | q: Quit"
         else:
-            msg = "a/k/c/u: Switch view | q: Quit | r: Refresh"
+            msg = "a/k/c/u/f: Switch view | q: Quit | r: Refresh"
         self.notify(msg, title="Keyboard Shortcuts", severity="information")
 
     def action_install_update(self) -> None:
@@ -4,6 +4,8 @@ from pathlib import Path
 
 import click
 
+from kudosx.utils.registry import registry_freshness
+
 
 def get_items(directory: Path, pattern: str = "*") -> list[dict]:
     """Get list of items in a directory.
@@ -173,3 +175,14 @@ def list_skills(local: bool, global_only: bool, commands: bool, skills: bool):
     if show_skills:
         summary_parts.append(f"{total_skills} skill(s)")
     click.echo(f"Total: {', '.join(summary_parts)}")
+
+    if show_skills:
+        state, age = registry_freshness()
+        if state == "bundled":
+            click.secho("Registry: bundled (remote not fetched yet)", fg="yellow")
+        elif state == "offline":
+            click.secho(f"Registry: bundled (remote unreachable, tried {age})", fg="yellow")
+        elif state == "stale":
+            click.secho(f"Registry: stale (checked {age}, refreshed on next use)", fg="yellow")
+        else:
+            click.secho(f"Registry: up to date (checked {age})", fg="green")
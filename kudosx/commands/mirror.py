@@ -0,0 +1,135 @@
+"""Mirror command for Kudosx CLI - Prefetch skills for offline use."""
+
+import json
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from pathlib import Path
+
+import click
+import yaml
+
+from kudosx.commands.add import (
+    DEFAULT_INSTALL_JOBS,
+    _error_message,
+    fetch_skill_archive,
+    fetch_tags_from_git,
+    fetch_tags_from_mirror,
+    load_skills_from_local,
+    load_skills_from_remote,
+)
+from kudosx.utils.download import DownloadProgress, format_bytes
+from kudosx.utils.fs import atomic_write_bytes, replace_with_clone
+from kudosx.utils.mirror import (
+    MIRROR_INDEX,
+    MIRROR_REGISTRY,
+    MIRROR_VERSION,
+    archive_path,
+    mirror_base,
+    tags_path,
+)
+
+
+def mirror_repo(repo: str, directory: Path) -> dict:
+    """Copy a repository's archive and tag list into a mirror directory.
+
+    Args:
+        repo: GitHub repo in format "owner/repo"
+        directory: Mirror root
+
+    Returns:
+        Index entry with the archive path, its size and the tags path
+        (None if the tags could not be listed)
+    """
+    tags = fetch_tags_from_mirror(repo) if mirror_base() else fetch_tags_from_git(repo)
+    progress = DownloadProgress(label=f"Downloaded {repo}:", interactive=False)
+    archive = fetch_skill_archive(repo, progress=progress)
+
+    dest = directory / archive_path(repo)
+    dest.parent.mkdir(parents=True, exist_ok=True)
+    if not (dest.exists() and dest.samefile(archive)):
+        replace_with_clone(archive, dest)
+
+    entry = {"archive": archive_path(repo), "size": dest.stat().st_size, "tags": None}
+    if tags is not None:
+        tags_file = directory / tags_path(repo)
+        tags_file.parent.mkdir(parents=True, exist_ok=True)
+        atomic_write_bytes(tags_file, json.dumps(tags).encode("utf-8"))
+        entry["tags"] = tags_path(repo)
+    return entry
+
+
+@click.group("mirror")
+def mirror():
+    """Offline mirror commands."""
+    pass
+
+
+@mirror.command("pull")
+@click.argument("directory", type=click.Path(file_okay=False, path_type=Path))
+@click.option(
+    "--jobs",
+    "-j",
+    default=DEFAULT_INSTALL_JOBS,
+    show_default=True,
+    type=click.IntRange(min=1),
+    help="Number of repositories to download concurrently",
+)
+def pull(directory: Path, jobs: int):
+    """Download the registry and every skill into DIRECTORY.
+
+    The directory gets the merged skills registry, each skill repository's
+    archive and its tag list. Point KUDOSX_MIRROR at it (or at an HTTP
+    server serving it) to install skills without reaching GitHub.
+
+    Examples:
+
+        kudosx mirror pull ./kudosx-mirror
+
+        KUDOSX_MIRROR=./kudosx-mirror kudosx add --all
+    """
+    directory.mkdir(parents=True, exist_ok=True)
+
+    click.echo("Fetching skills registry...")
+    skills = load_skills_from_local()
+    remote_skills = load_skills_from_remote()
+    if remote_skills is None:
+        click.secho("Remote registry unreachable, mirroring the bundled registry", fg="yellow")
+    else:
+        skills.update(remote_skills)
+    text = yaml.dump({"skills": skills}, default_flow_style=False, sort_keys=False, allow_unicode=True)
+    atomic_write_bytes(directory / MIRROR_REGISTRY, text.encode("utf-8"))
+
+    repos = list(dict.fromkeys(config["repo"] for config in skills.values() if config.get("repo")))
+    click.echo(f"Mirroring {len(repos)} repositories, up to {jobs} at a time...")
+
+    entries = {}
+    failures = {}
+    with ThreadPoolExecutor(max_workers=max(1, min(jobs, len(repos)))) as pool:
+        futures = {pool.submit(mirror_repo, repo, directory): repo for repo in repos}
+        for done, future in enumerate(as_completed(futures), 1):
+            repo = futures[future]
+            try:
+                entry = future.result()
+            except Exception as e:
+                failures[repo] = _error_message(e)
+                click.secho(f"[{done}/{len(repos)}] Failed to mirror {repo}: {failures[repo]}", fg="red")
+                continue
+            entries[repo] = entry
+            tags = "tags saved" if entry["tags"] else "tags unavailable"
+            click.secho(f"[{done}/{len(repos)}] Mirrored {repo} ({format_bytes(entry['size'])}, {tags})", fg="green")
+
+    index = {
+        "version": MIRROR_VERSION,
+        "pulled_at": time.time(),
+        "registry": MIRROR_REGISTRY,
+        "repos": {repo: entries[repo] for repo in repos if repo in entries},
+    }
+    atomic_write_bytes(directory / MIRROR_INDEX, json.dumps(index, indent=2).encode("utf-8"))
+
+    click.echo(f"\nMirror written to {directory}")
+    click.echo(f"Use it with: KUDOSX_MIRROR={directory.resolve()}")
+    if failures:
+        click.secho(f"\nFailed to mirror {len(failures)} of {len(repos)} repositories:", fg="red")
+        for repo, error in failures.items():
+            click.echo(f"  {repo}: {error}")
+        raise SystemExit(1)
@@ -0,0 +1,40 @@
+"""Registry command for Kudosx CLI - Browse the skills registry."""
+
+import click
+
+from kudosx.commands.add import get_skill_registry
+
+
+@click.group("registry")
+def registry():
+    """Browse the skills registry."""
+    pass
+
+
+@registry.command("search")
+@click.argument("terms", nargs=-1, required=True)
+def search(terms: tuple[str, ...]):
+    """Search skills by name, repository or description.
+
+    Every term must match; the last one also matches word prefixes.
+
+    Examples:
+
+        kudosx registry search browser
+
+        kudosx registry search aws cloud
+    """
+    query = " ".join(terms)
+    skills = get_skill_registry()
+    matches = skills.search(query)
+    if not matches:
+        click.secho(f"No skills found matching '{query}'", fg="yellow")
+        return
+
+    width = max(len(name) for name in matches)
+    for name in matches:
+        config = skills[name]
+        latest = str(config.get("latest") or "-")
+        description = config.get("description") or ""
+        click.echo(f"  {click.style(name.ljust(width), fg='cyan')}  {latest:<8}  {description}")
+    click.echo(f"\nFound {len(matches)} skill(s)")
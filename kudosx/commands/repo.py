@@ -1,13 +1,53 @@
 """Repo command for Kudosx CLI - Repository management for maintainers."""
 
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
 import click
 import yaml
 
 from kudosx.commands.add import (
     SKILLS_YAML,
-    fetch_latest_version_from_git,
+    fetch_tags,
+    latest_version_from_tags,
     load_skills_from_local,
 )
+from kudosx.utils.fs import atomic_write_bytes
+
+# Default number of repositories queried at once
+DEFAULT_SYNC_JOBS = 8
+
+# Default seconds to wait for one git ls-remote
+DEFAULT_SYNC_TIMEOUT = 10
+
+# Default extra attempts for a repository whose tags could not be fetched
+DEFAULT_SYNC_RETRIES = 2
+
+# Seconds before the first retry; doubled for each following attempt
+SYNC_BACKOFF = 0.25
+
+
+def fetch_tags_with_retry(repo: str, timeout: float, retries: int) -> list[str] | None:
+    """List the tags of a repo, retrying failures with exponential backoff.
+
+    Only failed lookups (git errors or timeouts) are retried; a repo
+    without tags is a valid answer and returns an empty list at once.
+
+    Args:
+        repo: GitHub repo in format "owner/repo"
+        timeout: Seconds to wait for each git ls-remote
+        retries: Extra attempts after the first failure
+
+    Returns:
+        Tag names, or None if every attempt failed
+    """
+    for attempt in range(retries + 1):
+        if attempt:
+            time.sleep(SYNC_BACKOFF * 2 ** (attempt - 1))
+        tags = fetch_tags(repo, use_cache=False, timeout=timeout)
+        if tags is not None:
+            return tags
+    return None
 
 
 @click.group("repo")
@@ -17,14 +57,37 @@ def repo():
 
 
 @repo.command("sync")
-def sync():
+@click.option(
+    "--jobs", "-j",
+    type=click.IntRange(min=1),
+    default=DEFAULT_SYNC_JOBS,
+    show_default=True,
+    help="Number of repositories to query at once",
+)
+@click.option(
+    "--timeout",
+    type=click.FloatRange(min=0, min_open=True),
+    default=DEFAULT_SYNC_TIMEOUT,
+    show_default=True,
+    help="Seconds to wait for each repository",
+)
+@click.option(
+    "--retries",
+    type=click.IntRange(min=0),
+    default=DEFAULT_SYNC_RETRIES,
+    show_default=True,
+    help="Extra attempts for a repository that fails",
+)
+def sync(jobs: int, timeout: float, retries: int):
     """Sync skill versions from GitHub tags to skills.yaml.
 
     Fetches the latest version tag from each skill's GitHub repository
-    and updates the local skills.yaml registry.
+    in parallel, printing each result as it arrives, and then updates
+    the local skills.yaml registry in a single atomic write.
 
     Example:
         kudosx repo sync
+        kudosx repo sync --jobs 16 --timeout 5
     """
     click.echo("Syncing skill versions...")
 
@@ -36,45 +99,54 @@ def sync():
 
     # Track changes
     changes = []
-    updated_skills = {}
+    updated_skills = dict(skills)
 
+    pending = {}
     for skill_name, config in skills.items():
-        repo = config.get("repo")
-        if not repo:
+        if not config.get("repo"):
             click.secho(f"  {skill_name}: no repo configured", fg="yellow")
-            updated_skills[skill_name] = config
-            continue
-
-        current_version = config.get("latest", "")
-        click.echo(f"  Fetching {skill_name}...", nl=False)
-
-        # Fetch latest version from git tags
-        new_version = fetch_latest_version_from_git(repo)
-
-        if new_version is None:
-            click.secho(" failed to fetch", fg="red")
-            updated_skills[skill_name] = config
-            continue
-
-        if new_version != current_version:
-            if current_version:
-                click.secho(f" {current_version} → {new_version}", fg="green")
-            else:
-                click.secho(f" {new_version} (new)", fg="green")
-            changes.append((skill_name, current_version, new_version))
         else:
-            click.echo(f" {new_version} (unchanged)")
+            pending[skill_name] = config["repo"]
+
+    with ThreadPoolExecutor(max_workers=min(jobs, len(pending) or 1)) as executor:
+        futures = {
+            executor.submit(fetch_tags_with_retry, repo, timeout, retries): skill_name
+            for skill_name, repo in pending.items()
+        }
+        for done, future in enumerate(as_completed(futures), 1):
+            skill_name = futures[future]
+            config = skills[skill_name]
+            current_version = config.get("latest", "")
+            tags = future.result()
+            prefix = f"  [{done}/{len(futures)}] {skill_name}:"
+
+            if tags is None:
+                click.secho(f"{prefix} failed to fetch", fg="red")
+                continue
+            new_version = latest_version_from_tags(tags)
+            if new_version is None:
+                click.secho(f"{prefix} no version tags", fg="yellow")
+                continue
+
+            if new_version != current_version:
+                if current_version:
+                    click.secho(f"{prefix} {current_version} → {new_version}", fg="green")
+                else:
+                    click.secho(f"{prefix} {new_version} (new)", fg="green")
+                changes.append((skill_name, current_version, new_version))
+            else:
+                click.echo(f"{prefix} {new_version} (unchanged)")
 
-        # Update config with new version
-        updated_config = dict(config)
-        updated_config["latest"] = new_version
-        updated_skills[skill_name] = updated_config
+            # Update config with new version
+            updated_config = dict(config)
+            updated_config["latest"] = new_version
+            updated_skills[skill_name] = updated_config
 
     # Write updated skills.yaml
     if changes:
         data = {"skills": updated_skills}
-        with open(SKILLS_YAML, "w") as f:
-            yaml.dump(data, f, default_flow_style=False, sort_keys=False, allow_unicode=True)
+        text = yaml.dump(data, default_flow_style=False, sort_keys=False, allow_unicode=True)
+        atomic_write_bytes(SKILLS_YAML, text.encode("utf-8"))
         click.secho(f"\nUpdated {SKILLS_YAML}", fg="green")
         click.echo("Don't forget to commit and push the changes!")
     else:
@@ -1,14 +1,39 @@
 """Search command for Kudosx CLI."""
 
+import gzip
 import os
 import re
+import time
+import zipfile
+import zlib
+from collections import Counter, deque
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 import click
 
+from kudosx.utils.file_index import FileIndex
+from kudosx.utils.fs import atomic_write_bytes
+from kudosx.utils.fuzzy import MAX_SCORED, FuzzyFinder
+from kudosx.utils.ignore import walk
+from kudosx.utils.matcher import build_matcher
+from kudosx.utils.search_cache import SearchCache, lookup, make_key
+from kudosx.utils.transcript_index import TranscriptIndex
+
+# Files are read in line-aligned blocks of this size
+CHUNK_SIZE = 1024 * 1024
+
+# Archive suffixes searched with --search-zip
+ARCHIVE_SUFFIXES = (".zip", ".gz")
+
 
 @click.command()
-@click.argument("query")
+@click.argument("queries", nargs=-1)
+@click.option(
+    "-f", "--patterns-file",
+    type=click.File("r"),
+    help="Read additional patterns from a file, one per line",
+)
 @click.option(
     "-p", "--path",
     default=".",
@@ -18,9 +43,10 @@ import click
 @click.option(
     "-t", "--type",
     "search_type",
-    type=click.Choice(["file", "content", "all"]),
+    type=click.Choice(["file", "content", "all", "session"]),
     default="all",
-    help="Search type: file (filename), content (file content), or all",
+    help="Search type: file (filename), content (file content), all, "
+    "or session (Claude Code session transcripts)",
 )
 @click.option(
     "-e", "--extension",
@@ -44,10 +70,122 @@ import click
     default=False,
     help="Include hidden files and directories",
 )
-def search(query, path, search_type, extension, ignore_case, max_results, hidden):
+@click.option(
+    "--no-ignore",
+    is_flag=True,
+    default=False,
+    help="Do not respect .gitignore/.ignore files",
+)
+@click.option(
+    "-l", "--files-with-matches",
+    is_flag=True,
+    default=False,
+    help="Only list files with content matches (stops reading each file at its first hit)",
+)
+@click.option(
+    "-c", "--count",
+    is_flag=True,
+    default=False,
+    help="Only show the number of matching lines per file",
+)
+@click.option(
+    "-j", "--jobs",
+    default=1,
+    help="Number of files to scan concurrently (default: 1)",
+)
+@click.option(
+    "--no-index",
+    is_flag=True,
+    default=False,
+    help="Walk the tree instead of using the filename index (-t file)",
+)
+@click.option(
+    "--no-cache",
+    is_flag=True,
+    default=False,
+    help="Rescan every file instead of reusing results for unchanged files",
+)
+@click.option(
+    "-w", "--watch",
+    is_flag=True,
+    default=False,
+    help="Keep running and print match changes as files are modified",
+)
+@click.option(
+    "--interval",
+    default=2.0,
+    help="Seconds between change checks in --watch mode (default: 2)",
+)
+@click.option(
+    "-r", "--replace",
+    "replacement",
+    help="Replace content matches with this text (supports \\1 backreferences)",
+)
+@click.option(
+    "--dry-run",
+    is_flag=True,
+    default=False,
+    help="With --replace, show what would change without writing files",
+)
+@click.option(
+    "-z", "--search-zip",
+    is_flag=True,
+    default=False,
+    help="Search inside .zip and .gz files without extracting them",
+)
+@click.option(
+    "--max-member-size",
+    default=32,
+    help="Skip archive members larger than this many MiB (default: 32)",
+)
+@click.option(
+    "-F", "--fuzzy",
+    is_flag=True,
+    default=False,
+    help="Rank file paths by fuzzy (fzf-style) match instead of pattern match "
+    f"(at most {MAX_SCORED} matching paths are ranked per query)",
+)
+def search(
+    queries, patterns_file, path, search_type, extension, ignore_case, max_results,
+    hidden, no_ignore, files_with_matches, count, jobs, no_index, no_cache, watch, interval,
+    replacement, dry_run, search_zip, max_member_size, fuzzy,
+):
     """Search for files or content in the codebase.
 
-    QUERY is the search term (supports regex patterns).
+    QUERIES are one or more search terms (regex patterns are supported).
+    A line matches if any of them matches, and every file is scanned once
+    however many patterns are given.
+
+    Directories and files matched by .gitignore/.ignore rules are skipped
+    unless --no-ignore is given.
+
+    Filename searches (-t file) are answered from a persistent index that
+    only re-lists directories changed since the previous search. Content
+    results are cached per file, so repeating a query only rescans files
+    whose mtime or size changed.
+
+    With --watch the search keeps running after the first results and
+    prints only what changed: files are polled by mtime and size, and just
+    the modified, added or deleted ones are rescanned.
+
+    With --replace every content match is rewritten. Files are processed
+    on the --jobs pool and each modified file is written to a temporary
+    file next to it and atomically renamed into place; --dry-run only
+    prints the diff summary.
+
+    With --search-zip, members of .zip files and the contents of .gz files
+    are decompressed in memory and searched like regular files; matches are
+    reported as archive.zip!member/path:line.
+
+    With --fuzzy, QUERIES are matched against file paths as subsequences
+    (e.g. "srcmdl" finds src/models.py) and results are ranked like fzf,
+    favouring matches at word boundaries and in the filename. When very
+    many paths match, only a capped number of them (preferring those with
+    the query in the filename) are ranked, and the output says so.
+
+    Session searches (-t session) query a full-text index of Claude Code
+    transcripts in ~/.claude/projects (or --path), updated with only the
+    lines appended since the previous search.
 
     Examples:
 
@@ -56,67 +194,749 @@ def search(query, path, search_type, extension, ignore_case, max_results, hidden
         kudosx search "TODO" -t content -e py
 
         kudosx search "test_*.py" -t file
+
+        kudosx search getLogger warn_explicit -t content
+
+        kudosx search -f deprecated-apis.txt -t content
+
+        kudosx search "TODO" -t content -l
+
+        kudosx search "TODO" -t content -c -j 8
+
+        kudosx search "flaky test retry" -t session
+
+        kudosx search "TODO|FIXME" -t content --watch
+
+        kudosx search "old_name" --replace "new_name" -e py --dry-run
+
+        kudosx search "Traceback" -t content --search-zip
+
+        kudosx search cmdsrch --fuzzy
     """
+    patterns = list(queries)
+    if patterns_file:
+        patterns.extend(line.rstrip("\n") for line in patterns_file if line.strip())
+    if not patterns:
+        click.secho("Error: Specify a QUERY or --patterns-file", fg="red", err=True)
+        raise SystemExit(1)
+    if files_with_matches and count:
+        click.secho("Error: --files-with-matches and --count are mutually exclusive", fg="red", err=True)
+        raise SystemExit(1)
+
+    if watch and search_type == "session":
+        click.secho("Error: --watch is not supported with -t session", fg="red", err=True)
+        raise SystemExit(1)
+    if fuzzy and (
+        search_type in ("content", "session") or watch or replacement is not None
+        or search_zip or files_with_matches or count
+    ):
+        click.secho("Error: --fuzzy only searches file paths", fg="red", err=True)
+        raise SystemExit(1)
+    if search_zip and (watch or replacement is not None or search_type in ("file", "session")):
+        click.secho(
+            "Error: --search-zip only works on content searches without --watch or --replace",
+            fg="red", err=True,
+        )
+        raise SystemExit(1)
+    if dry_run and replacement is None:
+        click.secho("Error: --dry-run requires --replace", fg="red", err=True)
+        raise SystemExit(1)
+    if replacement is not None and (
+        search_type in ("file", "session") or files_with_matches or count or watch
+    ):
+        click.secho(
+            "Error: --replace only works on content searches without -l, -c or --watch",
+            fg="red", err=True,
+        )
+        raise SystemExit(1)
+
+    if search_type == "session":
+        _search_sessions(" ".join(patterns), path, max_results)
+        return
+
     search_path = Path(path).resolve()
+    extensions = set(ext.lstrip(".") for ext in extension) if extension else None
     results = []
-    flags = re.IGNORECASE if ignore_case else 0
+
+    if fuzzy:
+        _fuzzy_search(
+            " ".join(patterns), search_path, extensions, hidden, not no_ignore, no_index, max_results,
+        )
+        return
 
     try:
-        pattern = re.compile(query, flags)
+        matcher = build_matcher(patterns, ignore_case)
     except re.error as e:
         click.secho(f"Invalid regex pattern: {e}", fg="red", err=True)
         raise SystemExit(1)
 
-    extensions = set(ext.lstrip(".") for ext in extension) if extension else None
+    mode = "files" if files_with_matches else "count" if count else "lines"
 
-    click.echo(f"Searching for '{query}' in {search_path}...")
-    click.echo()
+    if replacement is not None:
+        _replace(
+            patterns, matcher, replacement, ignore_case, search_path, extensions,
+            hidden, not no_ignore, jobs, max_results, dry_run,
+        )
+        return
 
-    for root, dirs, files in os.walk(search_path):
-        if not hidden:
-            dirs[:] = [d for d in dirs if not d.startswith(".")]
-            files = [f for f in files if not f.startswith(".")]
+    if len(patterns) == 1:
+        click.echo(f"Searching for '{patterns[0]}' in {search_path}...")
+    else:
+        click.echo(f"Searching for {len(patterns)} patterns in {search_path}...")
+    click.echo()
 
-        for filename in files:
+    if search_type == "file" and not no_index:
+        index = FileIndex(search_path, hidden=hidden, respect_ignore=not no_ignore)
+        index.ensure()
+        for rel_path in index.find(matcher):
+            name = rel_path.rsplit("/", 1)[-1]
+            if extensions and Path(name).suffix.lstrip(".") not in extensions:
+                continue
+            results.append({"type": "file", "path": str(Path(rel_path)), "match": name})
             if len(results) >= max_results:
                 break
+        _display_results(results, max_results)
+        if watch:
+            _watch(
+                search_path, matcher, mode, search_type, extensions, hidden,
+                not no_ignore, jobs, max_results, interval, {},
+            )
+        return
 
-            file_path = Path(root) / filename
-            rel_path = file_path.relative_to(search_path)
+    cache = None if no_cache or search_type == "file" else SearchCache()
+    cache_key = make_key(
+        patterns=patterns, ignore_case=ignore_case, mode=mode, extensions=extensions,
+        path=str(search_path), hidden=hidden, respect_ignore=not no_ignore,
+        search_zip=search_zip, max_member_size=max_member_size,
+    )
+    cached_files = cache.load(cache_key) if cache else {}
+    scanned_files = {}
+    rescanned = []
 
-            if extensions and file_path.suffix.lstrip(".") not in extensions:
-                continue
+    member_limit = max_member_size * 1024 * 1024
+
+    def scan_one(file_path):
+        if search_zip and is_archive(file_path.name):
+            return scan_archive(file_path, matcher, mode, max_results, extensions, member_limit)
+        return scan_file(file_path, matcher, mode, limit=max_results)
+
+    def scan(candidate):
+        if search_type == "file":
+            return None
+        file_path, rel_path = candidate
+        try:
+            if cache is None:
+                return scan_one(file_path)
+            stat = os.stat(file_path)
+            rel = str(rel_path)
+            result = lookup(cached_files, rel, stat, max_results)
+            if result is not None:
+                scanned_files[rel] = cached_files[rel]
+                return result
+            result = scan_one(file_path)
+            scanned_files[rel] = (stat.st_mtime_ns, stat.st_size, max_results, result)
+            rescanned.append(rel)
+            return result
+        except (OSError, IOError):
+            return None
 
-            if search_type in ("file", "all"):
-                if pattern.search(filename):
+    complete = False
+    candidates = iter_candidates(search_path, extensions, hidden, not no_ignore, archives=search_zip)
+    for (file_path, rel_path), found in scan_files(candidates, scan, jobs):
+        if search_type in ("file", "all") and matcher.search(file_path.name):
+            results.append({
+                "type": "file",
+                "path": str(rel_path),
+                "match": file_path.name,
+            })
+            if len(results) >= max_results:
+                break
+
+        if not found:
+            continue
+        if search_zip and is_archive(file_path.name):
+            hits = [(f"{rel_path}!{member}", member_found) for member, member_found in found]
+        else:
+            hits = [(str(rel_path), found)]
+
+        for display_path, hit in hits:
+            if mode == "files":
+                results.append({"type": "match", "path": display_path})
+            elif mode == "count":
+                results.append({"type": "count", "path": display_path, "count": hit})
+            else:
+                for line_num, excerpt in hit:
                     results.append({
-                        "type": "file",
-                        "path": str(rel_path),
-                        "match": filename,
+                        "type": "content",
+                        "path": display_path,
+                        "line": line_num,
+                        "match": excerpt,
                     })
                     if len(results) >= max_results:
                         break
-
-            if search_type in ("content", "all"):
-                try:
-                    content = file_path.read_text(encoding="utf-8", errors="ignore")
-                    for line_num, line in enumerate(content.splitlines(), 1):
-                        if pattern.search(line):
-                            results.append({
-                                "type": "content",
-                                "path": str(rel_path),
-                                "line": line_num,
-                                "match": line.strip()[:100],
-                            })
-                            if len(results) >= max_results:
-                                break
-                except (OSError, IOError):
-                    continue
+            if len(results) >= max_results:
+                break
 
         if len(results) >= max_results:
             break
+    else:
+        complete = True
+
+    if cache is not None:
+        if complete:
+            # A full walk also drops entries for deleted files
+            changed = bool(rescanned) or scanned_files.keys() != cached_files.keys()
+            table = scanned_files
+        else:
+            changed = bool(rescanned)
+            table = {**cached_files, **scanned_files}
+        if changed:
+            cache.store(cache_key, table)
 
     _display_results(results, max_results)
+    if watch:
+        _watch(
+            search_path, matcher, mode, search_type, extensions, hidden,
+            not no_ignore, jobs, max_results, interval, {**cached_files, **scanned_files},
+        )
+
+
+def highlight(path: str, positions: list[int]) -> str:
+    """Style the matched characters of a fuzzy result."""
+    marked = set(positions)
+    return "".join(
+        click.style(char, fg="yellow", bold=True) if i in marked else char
+        for i, char in enumerate(path)
+    )
+
+
+def _fuzzy_search(query, search_path, extensions, hidden, respect_ignore, no_index, max_results):
+    """Rank indexed file paths by fuzzy match and display them."""
+    click.echo(f"Fuzzy searching for '{query}' in {search_path}...")
+    click.echo()
+
+    if no_index:
+        paths = [
+            rel_path.as_posix()
+            for _, rel_path in iter_candidates(search_path, extensions, hidden, respect_ignore)
+        ]
+    else:
+        index = FileIndex(search_path, hidden=hidden, respect_ignore=respect_ignore)
+        index.ensure()
+        paths = index.paths
+        if extensions:
+            paths = [p for p in paths if Path(p).suffix.lstrip(".") in extensions]
+
+    finder = FuzzyFinder(paths)
+    ranked = finder.search(query, limit=max_results)
+    if not ranked:
+        click.secho("No results found.", fg="yellow")
+        return
+
+    click.secho("Files:", fg="green", bold=True)
+    for _, rel_path, positions in ranked:
+        click.echo(f"  {highlight(rel_path, positions)}")
+    click.echo()
+
+    total = len(ranked)
+    click.echo(f"Found {total} result(s)", nl=False)
+    if total >= max_results:
+        click.secho(f" (limited to {max_results})", fg="yellow")
+    else:
+        click.echo()
+    if finder.unscored:
+        matched = finder.max_scored + finder.unscored
+        click.secho(
+            f"Ranked only {finder.max_scored} of {matched} matching paths; "
+            "use a longer query to rank them all",
+            fg="yellow",
+        )
+
+
+def _search_sessions(query: str, path: str, max_results: int) -> None:
+    """Search Claude Code session transcripts through the transcript index."""
+    source = click.get_current_context().get_parameter_source("path")
+    projects_dir = Path(path).resolve() if source != click.core.ParameterSource.DEFAULT else None
+
+    index = TranscriptIndex(projects_dir)
+    click.echo(f"Searching sessions for '{query}' in {index.projects_dir}...")
+    click.echo()
+
+    index.ensure()
+    results = index.search(query, limit=max_results)
+    if not results:
+        click.secho("No results found.", fg="yellow")
+        return
+
+    click.secho("Sessions:", fg="green", bold=True)
+    for r in results:
+        timestamp = r["timestamp"][:19].replace("T", " ") or "-"
+        click.echo(f"  {r['project']}/{r['session']}  {timestamp}  ({r['hits']} hit(s))")
+        click.echo(f"    {r['snippet']}")
+    click.echo()
+
+    total = len(results)
+    click.echo(f"Found {total} session(s)", nl=False)
+    if total >= max_results:
+        click.secho(f" (limited to {max_results})", fg="yellow")
+    else:
+        click.echo()
+
+
+def read_chunks(file_path: Path, chunk_size: int | None = None):
+    """Read a file in blocks that always end on a line boundary.
+
+    Args:
+        file_path: File to read
+        chunk_size: Approximate block size in bytes (default: CHUNK_SIZE)
+
+    Yields:
+        Byte blocks; only the last one may lack a trailing newline
+    """
+    with open(file_path, "rb") as f:
+        yield from read_stream_chunks(f, chunk_size)
+
+
+def read_stream_chunks(f, chunk_size: int | None = None, max_bytes: int | None = None):
+    """Read a binary stream in blocks that always end on a line boundary.
+
+    Args:
+        f: Binary file object (a regular file, zip member or gzip stream)
+        chunk_size: Approximate block size in bytes (default: CHUNK_SIZE)
+        max_bytes: Stop after reading this many bytes
+
+    Yields:
+        Byte blocks; only the last one may lack a trailing newline
+    """
+    chunk_size = chunk_size or CHUNK_SIZE
+    remaining = max_bytes
+    # Pieces of an unfinished line, joined once its newline arrives
+    pending: list[bytes] = []
+    while True:
+        size = chunk_size if remaining is None else min(chunk_size, remaining)
+        block = f.read(size) if size else b""
+        if not block:
+            if pending:
+                yield b"".join(pending)
+            return
+        if remaining is not None:
+            remaining -= len(block)
+        cut = block.rfind(b"\n") + 1
+        if cut == 0:
+            pending.append(block)
+            continue
+        pending.append(block[:cut])
+        yield b"".join(pending)
+        pending = [block[cut:]] if cut < len(block) else []
+
+def scan_file(file_path: Path, matcher, mode: str = "lines", limit: int | None = None):
+    """Scan one file with a matcher.
+
+    Args:
+        file_path: File to scan
+        matcher: Matcher from build_matcher
+        mode: "lines" for line records, "files" to stop at the first hit,
+            "count" to count matching lines
+        limit: Maximum number of line records to collect ("lines" mode)
+
+    Returns:
+        List of (line number, excerpt) tuples, a bool, or an int depending on mode
+    """
+    return scan_chunks(read_chunks(file_path), matcher, mode, limit)
+
+
+def scan_chunks(chunks, matcher, mode: str = "lines", limit: int | None = None):
+    """Scan line-aligned blocks with a matcher (see scan_file)."""
+    if mode == "files":
+        # any() stops reading at the first block containing a hit
+        return any(matcher.contains(chunk) for chunk in chunks)
+    if mode == "count":
+        return sum(matcher.count(chunk) for chunk in chunks)
+
+    matches = []
+    line_offset = 0
+    for chunk in chunks:
+        for line_num, line in matcher.scan(chunk):
+            matches.append((line_offset + line_num, line.strip()[:100]))
+            if limit is not None and len(matches) >= limit:
+                return matches
+        line_offset += chunk.count(b"\n")
+    return matches
+
+
+def is_archive(name: str) -> bool:
+    """Check whether a file name has an archive suffix searched by --search-zip."""
+    return name.lower().endswith(ARCHIVE_SUFFIXES)
+
+
+def iter_archive_members(file_path: Path, max_member_size: int):
+    """Open the members of a .zip file, or the contents of a .gz file.
+
+    Members are decompressed on the fly; nothing is written to disk.
+    Zip members whose declared size exceeds the limit are skipped, and
+    every stream is cut off at the limit in case the declared size lies.
+
+    Args:
+        file_path: Archive to open
+        max_member_size: Maximum decompressed bytes read per member
+
+    Yields:
+        Tuples of (member name, binary file object)
+    """
+    if file_path.name.lower().endswith(".gz"):
+        with gzip.open(file_path, "rb") as f:
+            yield file_path.name[:-3], f
+        return
+
+    with zipfile.ZipFile(file_path) as archive:
+        for info in archive.infolist():
+            if info.is_dir() or info.file_size > max_member_size:
+                continue
+            try:
+                member = archive.open(info)
+            except (RuntimeError, NotImplementedError, zipfile.BadZipFile):
+                # Encrypted or unsupported compression
+                continue
+            with member:
+                yield info.filename, member
+
+
+def scan_archive(
+    file_path: Path, matcher, mode: str = "lines", limit: int | None = None,
+    extensions: set | None = None, max_member_size: int = 32 * 1024 * 1024,
+):
+    """Scan every member of an archive with a matcher.
+
+    Args:
+        file_path: .zip or .gz file
+        matcher: Matcher from build_matcher
+        mode: Result mode, as for scan_file
+        limit: Maximum number of line records per member ("lines" mode)
+        extensions: Only scan members with these extensions
+        max_member_size: Maximum decompressed bytes read per member
+
+    Returns:
+        List of (member name, result) for members with a hit
+    """
+    found = []
+    try:
+        for name, member in iter_archive_members(file_path, max_member_size):
+            if extensions and Path(name).suffix.lstrip(".") not in extensions:
+                continue
+            result = scan_chunks(read_stream_chunks(member, max_bytes=max_member_size), matcher, mode, limit)
+            if result:
+                found.append((name, result))
+    except (zipfile.BadZipFile, gzip.BadGzipFile, EOFError, zlib.error):
+        # Corrupt archive: keep whatever was found before the damage
+        pass
+    return found
+
+
+def iter_candidates(
+    search_path: Path, extensions: set | None, hidden: bool, respect_ignore: bool,
+    archives: bool = False,
+):
+    """Yield (file path, path relative to search_path) for files to search.
+
+    With archives=True, .zip and .gz files pass the extension filter so
+    their members can be filtered instead.
+    """
+    for root, dirs, files in walk(search_path, hidden=hidden, respect_ignore=respect_ignore):
+        for filename in files:
+            file_path = Path(root) / filename
+            if extensions and file_path.suffix.lstrip(".") not in extensions:
+                if not (archives and is_archive(filename)):
+                    continue
+            yield file_path, file_path.relative_to(search_path)
+
+
+def scan_files(candidates, scan, jobs: int = 1):
+    """Apply scan to each candidate, preserving walk order.
+
+    With jobs > 1 up to that many files are scanned concurrently on a
+    thread pool, which overlaps file reads. Results are still yielded in
+    walk order, and pending work is cancelled when the consumer stops early.
+
+    Yields:
+        Tuples of (candidate, scan result)
+    """
+    if jobs <= 1:
+        for candidate in candidates:
+            yield candidate, scan(candidate)
+        return
+
+    pool = ThreadPoolExecutor(max_workers=jobs)
+    pending = deque()
+    try:
+        for candidate in candidates:
+            pending.append((candidate, pool.submit(scan, candidate)))
+            if len(pending) >= jobs * 4:
+                done, future = pending.popleft()
+                yield done, future.result()
+        while pending:
+            done, future = pending.popleft()
+            yield done, future.result()
+    finally:
+        pool.shutdown(wait=True, cancel_futures=True)
+
+
+def replace_in_file(file_path: Path, matcher, regex: re.Pattern, replacement: str, dry_run: bool = False):
+    """Rewrite the matches of a file in place.
+
+    The file is first scanned with the streaming matcher, so files without
+    a match are never fully loaded. Substitutions are applied line by line
+    and the result replaces the file atomically (see atomic_write_bytes:
+    pass a resolved path, and check for other hard links beforehand).
+
+    Args:
+        file_path: File to rewrite
+        matcher: Matcher from build_matcher, used to skip files without hits
+        regex: Compiled pattern used for substitution
+        replacement: Replacement template for regex.sub
+        dry_run: Compute the changes without writing the file
+
+    Returns:
+        Tuple of (list of (line number, old line, new line), occurrences replaced)
+    """
+    if not any(matcher.contains(chunk) for chunk in read_chunks(file_path)):
+        return [], 0
+
+    data = file_path.read_bytes()
+    if b"\0" in data[:8192]:
+        # Never rewrite binary files
+        return [], 0
+
+    # surrogateescape keeps undecodable bytes intact through the round trip
+    lines = data.decode("utf-8", errors="surrogateescape").split("\n")
+    changes = []
+    occurrences = 0
+    for i, line in enumerate(lines):
+        body, eol = (line[:-1], "\r") if line.endswith("\r") else (line, "")
+        new_body, n = regex.subn(replacement, body)
+        if not n or new_body == body:
+            continue
+        occurrences += n
+        lines[i] = new_body + eol
+        changes.append((i + 1, body.strip()[:100], new_body.strip()[:100]))
+
+    if changes and not dry_run:
+        atomic_write_bytes(file_path, "\n".join(lines).encode("utf-8", errors="surrogateescape"))
+    return changes, occurrences
+
+
+def _replace(
+    patterns, matcher, replacement, ignore_case, search_path, extensions,
+    hidden, respect_ignore, jobs, max_results, dry_run,
+):
+    """Run --replace over the search tree and print a diff summary."""
+    pattern = patterns[0] if len(patterns) == 1 else "|".join(f"(?:{p})" for p in patterns)
+    regex = re.compile(pattern, re.IGNORECASE if ignore_case else 0)
+    try:
+        # Surfaces invalid group references before any file is touched
+        regex.sub(replacement, "")
+    except re.error as e:
+        click.secho(f"Invalid replacement: {e}", fg="red", err=True)
+        raise SystemExit(1)
+
+    verb = "Previewing" if dry_run else "Replacing"
+    click.echo(f"{verb} {len(patterns)} pattern(s) with '{replacement}' in {search_path}...")
+    click.echo()
+
+    seen = set()
+
+    def targets():
+        # Symlinks are rewritten through to the file they point at, once
+        for file_path, rel_path in iter_candidates(search_path, extensions, hidden, respect_ignore):
+            real_path = Path(os.path.realpath(file_path))
+            if real_path in seen:
+                continue
+            seen.add(real_path)
+            try:
+                linked = real_path.stat().st_nlink > 1
+            except OSError:
+                continue
+            yield real_path, rel_path, linked
+
+    def rewrite(candidate):
+        real_path, _, linked = candidate
+        try:
+            # Replacing a hard-linked file would split it from its other links
+            return replace_in_file(real_path, matcher, regex, replacement, dry_run or linked)
+        except (OSError, IOError):
+            return [], 0
+
+    files = 0
+    total = 0
+    changed_lines = 0
+    hard_linked = []
+    for (_, rel_path, linked), (changes, occurrences) in scan_files(targets(), rewrite, jobs):
+        if not changes:
+            continue
+        if linked:
+            hard_linked.append(rel_path)
+            continue
+        if files == 0:
+            click.secho("Would change:" if dry_run else "Changed:", fg="blue", bold=True)
+        files += 1
+        total += occurrences
+        for line_num, old, new in changes:
+            changed_lines += 1
+            if changed_lines > max_results:
+                break
+            click.echo(f"  {rel_path}:{line_num}")
+            click.secho(f"    - {old}", fg="red")
+            click.secho(f"    + {new}", fg="green")
+
+    if not files and not hard_linked:
+        click.secho("No results found.", fg="yellow")
+        return
+    if files:
+        if changed_lines > max_results:
+            click.secho(f"  ... diff limited to {max_results} line(s)", fg="yellow")
+        click.echo()
+        if dry_run:
+            click.echo(f"Would replace {total} occurrence(s) in {files} file(s) (dry run)")
+        else:
+            click.echo(f"Replaced {total} occurrence(s) in {files} file(s)")
+    if hard_linked:
+        verb = "Would skip" if dry_run else "Skipped"
+        click.secho(f"{verb} {len(hard_linked)} file(s) with other hard links (rewriting would split them):", fg="yellow")
+        for rel_path in hard_linked:
+            click.echo(f"  {rel_path}")
+
+def refresh_table(search_path: Path, rel_paths, table: dict, scan, limit: int | None, jobs: int = 1):
+    """Bring a per-file match table up to date with the filesystem.
+
+    Only files whose mtime or size differs from their table entry (or that
+    have no entry yet) are rescanned; files missing from rel_paths are
+    treated as deleted.
+
+    Args:
+        search_path: Root the relative paths are based on
+        rel_paths: Relative paths of every file currently searched
+        table: Dict of relative path -> (mtime_ns, size, limit, result)
+        scan: Callable taking a file path and returning its result
+        limit: Per-file line limit the results were collected with
+        jobs: Number of files to rescan concurrently
+
+    Returns:
+        Tuple of (new table, list of (relative path, old result, new result)
+        for files whose result changed; a missing side is None)
+    """
+    current = {}
+    stale = []
+    for rel in rel_paths:
+        file_path = search_path / rel
+        try:
+            stat = os.stat(file_path)
+        except OSError:
+            continue
+        result = lookup(table, rel, stat, limit)
+        if result is None:
+            stale.append((file_path, rel, stat))
+        else:
+            current[rel] = table[rel]
+
+    changes = []
+    for (file_path, rel, stat), result in scan_files(stale, lambda c: scan(c[0]), jobs):
+        if result is None:
+            continue
+        current[rel] = (stat.st_mtime_ns, stat.st_size, limit, result)
+        old = table[rel][3] if rel in table else None
+        if old != result:
+            changes.append((rel, old, result))
+
+    for rel in table.keys() - current.keys():
+        changes.append((rel, table[rel][3], None))
+    return current, sorted(changes, key=lambda change: change[0])
+
+
+def format_change(rel: str, old, new, mode: str, name_match: bool = False) -> list[str]:
+    """Describe how one file's search result changed.
+
+    Args:
+        rel: Relative file path
+        old: Previous result (None if the file is new)
+        new: Current result (None if the file was deleted)
+        mode: Result mode the table was built with
+        name_match: Whether the filename itself matches the query
+
+    Returns:
+        Output lines, prefixed with "+" for new and "-" for gone matches
+    """
+    lines = []
+    if name_match and (old is None or new is None):
+        lines.append(f"{'+' if old is None else '-'} {rel}")
+
+    if mode == "files":
+        if bool(old) != bool(new):
+            lines.append(f"{'+' if new else '-'} {rel}")
+    elif mode == "count":
+        if (old or 0) != (new or 0):
+            lines.append(f"  {rel}: {old or 0} -> {new or 0}")
+    else:
+        old, new = old or [], new or []
+        # Compare by text so matches that only moved lines are not reported
+        added = Counter(text for _, text in new) - Counter(text for _, text in old)
+        removed = Counter(text for _, text in old) - Counter(text for _, text in new)
+        for sign, matches, wanted in (("-", old, removed), ("+", new, added)):
+            for line_num, text in matches:
+                if wanted[text] > 0:
+                    wanted[text] -= 1
+                    lines.append(f"{sign} {rel}:{line_num}: {text}")
+    return lines
+
+
+def _watch(
+    search_path, matcher, mode, search_type, extensions, hidden, respect_ignore,
+    jobs, max_results, interval, seed,
+):
+    """Poll the tree and print changes to the search results until interrupted."""
+    index = FileIndex(search_path, hidden=hidden, respect_ignore=respect_ignore)
+    index.ensure()
+
+    def rel_paths():
+        for rel_path in index.paths:
+            if extensions and Path(rel_path).suffix.lstrip(".") not in extensions:
+                continue
+            yield str(Path(rel_path))
+
+    def scan(file_path):
+        if search_type == "file":
+            # Only additions and deletions matter for filename matches
+            return False
+        try:
+            return scan_file(file_path, matcher, mode, limit=max_results)
+        except (OSError, IOError):
+            return None
+
+    # Baseline: reuse results from the first run, scan whatever it skipped
+    table, _ = refresh_table(search_path, rel_paths(), seed, scan, max_results, jobs)
+    click.secho(f"Watching {len(table)} file(s) for changes (Ctrl+C to stop)...", fg="cyan")
+
+    try:
+        while True:
+            time.sleep(interval)
+            if index.refresh():
+                index.save()
+            table, changes = refresh_table(search_path, rel_paths(), table, scan, max_results, jobs)
+
+            output = []
+            changed_files = 0
+            for rel, old, new in changes:
+                name_match = search_type in ("file", "all") and matcher.search(Path(rel).name)
+                lines = format_change(rel, old, new, mode, name_match)
+                changed_files += bool(lines)
+                output.extend(lines)
+            if output:
+                click.echo()
+                click.secho(f"[{time.strftime('%H:%M:%S')}] {changed_files} file(s) changed", bold=True)
+                for line in output:
+                    color = "green" if line.startswith("+") else "red" if line.startswith("-") else None
+                    click.secho(f"  {line}", fg=color)
+    except KeyboardInterrupt:
+        click.echo()
+        click.echo("Stopped watching.")
 
 
 def _display_results(results, max_results):
@@ -127,6 +947,8 @@ def _display_results(results, max_results):
 
     file_results = [r for r in results if r["type"] == "file"]
     content_results = [r for r in results if r["type"] == "content"]
+    match_results = [r for r in results if r["type"] == "match"]
+    count_results = [r for r in results if r["type"] == "count"]
 
     if file_results:
         click.secho("Files:", fg="green", bold=True)
@@ -140,6 +962,19 @@ def _display_results(results, max_results):
             click.echo(f"  {r['path']}:{r['line']}: {r['match']}")
         click.echo()
 
+    if match_results:
+        click.secho("Files with matches:", fg="blue", bold=True)
+        for r in match_results:
+            click.echo(f"  {r['path']}")
+        click.echo()
+
+    if count_results:
+        click.secho("Match counts:", fg="blue", bold=True)
+        for r in count_results:
+            click.echo(f"  {r['path']}: {r['count']}")
+        click.echo(f"  Total: {sum(r['count'] for r in count_results)} matching line(s)")
+        click.echo()
+
     total = len(results)
     click.echo(f"Found {total} result(s)", nl=False)
     if total >= max_results:
@@ -1,14 +1,24 @@
 """Update command for Kudosx CLI - Update installed skills."""
 
+import os
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 
 import click
 
 from kudosx.commands.add import (
+    DEFAULT_INSTALL_JOBS,
     SKILLS,
+    _error_message,
     get_latest_version,
     download_and_extract_skill,
+    fetch_skill_archive,
+    get_skill_registry,
+    install_skill_archive,
+    is_stored,
+    resolve_latest_versions,
 )
+from kudosx.utils.download import DownloadProgress
 from kudosx.utils.version import is_update_available, format_version
 
 
@@ -23,6 +33,10 @@ def get_installed_version(skill_path: Path) -> str | None:
 def get_installed_skills(local: bool = False) -> list[dict]:
     """Get list of installed skills with their versions.
 
+    Only the entries of the skills directory are examined; each one is
+    mapped to its skill through the registry's target_dir index, so the
+    cost does not grow with the size of the catalog.
+
     Args:
         local: Check local directory instead of global
 
@@ -34,19 +48,24 @@ def get_installed_skills(local: bool = False) -> list[dict]:
     else:
         skills_dir = Path.home() / ".claude" / "skills"
 
+    try:
+        entries = sorted(entry.name for entry in os.scandir(skills_dir) if entry.is_dir())
+    except OSError:
+        return []
+
+    registry = get_skill_registry()
     installed = []
-    for skill_name, config in SKILLS.items():
-        target_dir = config["target_dir"]
+    for target_dir in entries:
+        skill_name = registry.find_by_target(target_dir)
+        if skill_name is None:
+            continue
         skill_path = skills_dir / target_dir
-
-        if skill_path.exists():
-            installed_ver = get_installed_version(skill_path)
-            installed.append({
-                "name": skill_name,
-                "config": config,
-                "path": skill_path,
-                "version": installed_ver,
-            })
+        installed.append({
+            "name": skill_name,
+            "config": registry[skill_name],
+            "path": skill_path,
+            "version": get_installed_version(skill_path),
+        })
 
     return installed
 
@@ -92,7 +111,7 @@ def update_skill(
     # Perform update
     click.echo(f"  Updating to {latest_ver}...")
     try:
-        download_and_extract_skill(repo, source_path, skill_path, latest_ver)
+        download_and_extract_skill(repo, source_path, skill_path, latest_ver, force=force)
         click.secho(f"  Updated {skill_name} to {latest_ver}", fg="green")
         return True
     except Exception as e:
@@ -100,6 +119,141 @@ def update_skill(
         return False
 
 
+def plan_updates(installed: list[dict], force: bool = False) -> list[dict]:
+    """Work out which installed skills need updating.
+
+    The latest versions of all repos are resolved concurrently, so the
+    plan costs about one lookup regardless of how many skills are installed.
+
+    Args:
+        installed: Installed skills as returned by get_installed_skills
+            (optionally with a "location" key)
+        force: Reinstall skills that are already up-to-date
+
+    Returns:
+        The installed entries, each with "latest" and an "action" of
+        "update", "current" or "unknown" (latest version not found)
+    """
+    latest = resolve_latest_versions(skill["config"]["repo"] for skill in installed)
+    plan = []
+    for skill in installed:
+        latest_ver = latest.get(skill["config"]["repo"])
+        if latest_ver is None:
+            action = "unknown"
+        elif force or is_update_available(skill["version"], latest_ver):
+            action = "update"
+        else:
+            action = "current"
+        plan.append({**skill, "latest": latest_ver, "action": action})
+    return plan
+
+
+PLAN_STATUS = {
+    "update": ("update", "yellow"),
+    "current": ("up-to-date", "green"),
+    "unknown": ("unknown", "red"),
+}
+
+
+def print_plan(plan: list[dict]) -> None:
+    """Print an update plan as an installed/latest diff table."""
+    rows = [
+        (
+            entry["name"],
+            entry.get("location", ""),
+            format_version(entry["version"]),
+            format_version(entry["latest"]),
+        )
+        for entry in plan
+    ]
+    headers = ("SKILL", "LOCATION", "INSTALLED", "LATEST")
+    widths = [max(len(row[i]) for row in [headers, *rows]) for i in range(len(headers))]
+
+    def line(cells):
+        return "  ".join(cell.ljust(width) for cell, width in zip(cells, widths))
+
+    click.secho(f"{line(headers)}  STATUS", bold=True)
+    for entry, row in zip(plan, rows):
+        status, color = PLAN_STATUS[entry["action"]]
+        click.echo(f"{line(row)}  ", nl=False)
+        click.secho(status, fg=color)
+
+
+def _apply_repo_updates(
+    repo: str, entries: list[dict], force: bool = False
+) -> list[tuple[dict, str | None]]:
+    """Fetch a repo's archive once and install every planned skill from it.
+
+    With force the archive is always downloaded and each skill's stored
+    version is re-extracted from it (once, even if installed in both
+    locations).
+    """
+    zip_path = None
+    stored = all(is_stored([entry["path"].name], entry["latest"]) for entry in entries)
+    if force or not stored:
+        try:
+            progress = DownloadProgress(label=f"Downloaded {repo}:", interactive=False)
+            zip_path = fetch_skill_archive(repo, progress=progress)
+        except Exception as e:
+            return [(entry, _error_message(e)) for entry in entries]
+
+    results = []
+    refreshed = set()
+    for entry in entries:
+        skill = entry["path"].name
+        try:
+            install_skill_archive(
+                zip_path, entry["config"]["source_path"], entry["path"], entry["latest"],
+                force=force and skill not in refreshed,
+            )
+            refreshed.add(skill)
+            results.append((entry, None))
+        except Exception as e:
+            results.append((entry, _error_message(e)))
+    return results
+
+
+def apply_updates(plan: list[dict], jobs: int = DEFAULT_INSTALL_JOBS, force: bool = False) -> dict[str, str]:
+    """Apply the "update" entries of a plan on a bounded worker pool.
+
+    Each repo is downloaded once, by one of up to ``jobs`` workers, which
+    then installs every skill planned from it (in any location). Results
+    are printed as each skill finishes.
+
+    Args:
+        plan: Plan as returned by plan_updates
+        jobs: Maximum number of concurrent downloads
+        force: Download again even versions already in the SkillStore
+
+    Returns:
+        Dict of "name (location)" -> error message for skills that failed
+    """
+    by_repo: dict[str, list[dict]] = {}
+    for entry in plan:
+        if entry["action"] == "update":
+            by_repo.setdefault(entry["config"]["repo"], []).append(entry)
+
+    total = sum(len(entries) for entries in by_repo.values())
+    failures: dict[str, str] = {}
+    done = 0
+
+    with ThreadPoolExecutor(max_workers=max(1, min(jobs, len(by_repo)))) as pool:
+        futures = [pool.submit(_apply_repo_updates, repo, entries, force) for repo, entries in by_repo.items()]
+        for future in as_completed(futures):
+            for entry, error in future.result():
+                done += 1
+                label = entry["name"]
+                if entry.get("location"):
+                    label += f" ({entry['location']})"
+                if error is None:
+                    click.secho(f"[{done}/{total}] Updated {label} to {entry['latest']}", fg="green")
+                else:
+                    failures[label] = error
+                    click.secho(f"[{done}/{total}] Failed to update {label}: {error}", fg="red")
+
+    return failures
+
+
 @click.command("update")
 @click.argument("name", required=False)
 @click.option(
@@ -115,17 +269,34 @@ def update_skill(
     is_flag=True,
     help="Update local skills (./.claude/skills) instead of global (~/.claude/skills)",
 )
+@click.option(
+    "--global",
+    "-g",
+    "global_only",
+    is_flag=True,
+    help="With --all, update only global skills (~/.claude/skills)",
+)
 @click.option(
     "--force",
     "-f",
     is_flag=True,
     help="Force update even if already up-to-date",
 )
-def update(name: str | None, update_all: bool, local: bool, force: bool):
+@click.option(
+    "--jobs",
+    "-j",
+    default=DEFAULT_INSTALL_JOBS,
+    show_default=True,
+    type=click.IntRange(min=1),
+    help="With --all, number of skills to download concurrently",
+)
+def update(name: str | None, update_all: bool, local: bool, global_only: bool, force: bool, jobs: int):
     """Update installed skills to latest version.
 
     Updates skills by fetching the latest release from GitHub and
-    replacing the installed version.
+    replacing the installed version. With --all, global and project
+    skills are checked together: a plan of installed and latest versions
+    is printed first, then the updates are downloaded concurrently.
 
     Examples:
 
@@ -147,31 +318,51 @@ def update(name: str | None, update_all: bool, local: bool, force: bool):
     )
 
     if update_all:
-        # Update all installed skills
-        installed = get_installed_skills(local=local)
+        # Plan: check global and project skills together
+        if local:
+            scopes = [(True, "project")]
+        elif global_only:
+            scopes = [(False, "global")]
+        else:
+            scopes = [(False, "global"), (True, "project")]
+
+        installed = []
+        seen_paths = set()
+        for scope_local, scope_name in scopes:
+            for skill in get_installed_skills(local=scope_local):
+                # The project directory is the global one when run from ~
+                if skill["path"] in seen_paths:
+                    continue
+                seen_paths.add(skill["path"])
+                installed.append({**skill, "location": scope_name})
 
         if not installed:
+            location = "/".join(scope_name for _, scope_name in scopes)
             click.secho(f"No skills installed ({location})", fg="yellow")
             return
 
-        click.echo(f"Checking {len(installed)} installed skill(s) ({location})...\n")
+        click.echo(f"Checking {len(installed)} installed skill(s)...\n")
+        plan = plan_updates(installed, force=force)
+        print_plan(plan)
+        click.echo()
+
+        pending = [entry for entry in plan if entry["action"] == "update"]
+        if not pending:
+            click.secho("All skills are up-to-date", fg="green")
+            return
 
-        updated_count = 0
-        for skill in installed:
-            if update_skill(
-                skill["name"],
-                skill["config"],
-                skill["path"],
-                skill["version"],
-                force=force,
-            ):
-                updated_count += 1
-            click.echo()
+        # Apply: download and install on a bounded pool
+        click.echo(f"Updating {len(pending)} skill(s), up to {jobs} downloads at a time...")
+        failures = apply_updates(plan, jobs, force=force)
+        updated_count = len(pending) - len(failures)
 
         if updated_count > 0:
-            click.secho(f"Updated {updated_count} skill(s)", fg="green")
-        else:
-            click.secho("All skills are up-to-date", fg="green")
+            click.secho(f"\nUpdated {updated_count} skill(s)", fg="green")
+        if failures:
+            click.secho(f"\nFailed to update {len(failures)} of {len(pending)} skills:", fg="red")
+            for label, error in failures.items():
+                click.echo(f"  {label}: {error}")
+            raise SystemExit(1)
 
     else:
         # Update specific skill
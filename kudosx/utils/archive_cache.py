@@ -0,0 +1,205 @@
+"""Content-addressed cache of downloaded skill archives.
+
+Archives are stored once under their sha256 (``<sha256>.zip``) and an
+index maps each ``repo@ref`` (suffixed with the mirror URL for archives
+fetched from a KUDOSX_MIRROR) to the blob it last resolved to, together
+with the server's ETag. Installing the same skill again, or into another
+location, is then served from disk after at most a conditional request.
+Blobs are evicted least-recently-used first once the cache grows past its
+size budget (``KUDOSX_ARCHIVE_CACHE_MB``, default 512).
+"""
+
+import json
+import os
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+from kudosx.utils.cache import get_cache_dir
+from kudosx.utils.fs import atomic_write_bytes, file_sha256
+
+# Bump when the index layout changes
+INDEX_VERSION = 1
+
+# Default size budget in MiB, overridable with KUDOSX_ARCHIVE_CACHE_MB
+DEFAULT_MAX_MB = 512
+
+# Archives used within this many seconds are never evicted, since another
+# kudosx process may still be extracting them (the index lock only covers
+# this process)
+EVICT_GRACE_SECONDS = 600
+
+# Serializes index updates between concurrent installs in one process
+_index_lock = threading.Lock()
+
+
+def archive_cache_limit() -> int:
+    """Return the archive cache size budget in bytes."""
+    try:
+        megabytes = int(os.environ.get("KUDOSX_ARCHIVE_CACHE_MB", DEFAULT_MAX_MB))
+    except ValueError:
+        megabytes = DEFAULT_MAX_MB
+    return max(megabytes, 0) * 1024 * 1024
+
+
+class ArchiveCache:
+    """Index of repo@ref -> cached archive blob."""
+
+    def __init__(self, cache_dir: Path | None = None, max_bytes: int | None = None):
+        self.cache_dir = cache_dir or get_cache_dir("archives")
+        self.max_bytes = archive_cache_limit() if max_bytes is None else max_bytes
+        self.index_path = self.cache_dir / "index.json"
+
+    @staticmethod
+    def key(repo: str, ref: str, source: str | None = None) -> str:
+        """Build the index key for a repository ref.
+
+        Args:
+            repo: GitHub repo in format "owner/repo"
+            ref: Branch or tag
+            source: Mirror URL the archive comes from (None for GitHub)
+        """
+        key = f"{repo}@{ref}"
+        return key if source is None else f"{key} {source}"
+
+    def blob_path(self, sha256: str) -> Path:
+        """Path of the archive with the given content hash."""
+        return self.cache_dir / f"{sha256}.zip"
+
+    def _load_index(self) -> dict:
+        try:
+            data = json.loads(self.index_path.read_text())
+        except (OSError, ValueError):
+            return {}
+        if not isinstance(data, dict) or data.get("version") != INDEX_VERSION:
+            return {}
+        return data.get("entries", {})
+
+    def _save_index(self, entries: dict) -> None:
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        payload = json.dumps({"version": INDEX_VERSION, "entries": entries}, indent=2, sort_keys=True)
+        atomic_write_bytes(self.index_path, payload.encode("utf-8"))
+
+    def lookup(self, repo: str, ref: str, source: str | None = None) -> dict | None:
+        """Find the cached archive for a repository ref.
+
+        The blob is re-hashed so a truncated or modified file is never
+        used; such entries are dropped. Hashing happens outside the index
+        lock so concurrent installs are not serialized behind it.
+
+        Returns:
+            Index entry (etag, sha256, size, checked_at) plus "path", or None
+        """
+        key = self.key(repo, ref, source)
+        with _index_lock:
+            entry = self._load_index().get(key)
+        if entry is None:
+            return None
+
+        path = self.blob_path(entry["sha256"])
+        try:
+            valid = path.stat().st_size == entry["size"] and file_sha256(path) == entry["sha256"]
+        except OSError:
+            valid = False
+        if not valid:
+            with _index_lock:
+                entries = self._load_index()
+                # Keep the entry if it was re-stored while we were hashing
+                if entries.get(key, {}).get("sha256") == entry["sha256"]:
+                    del entries[key]
+                    self._save_index(entries)
+            return None
+
+        try:
+            # Reads count as use for LRU eviction
+            os.utime(path)
+        except OSError:
+            pass
+        return {**entry, "path": path}
+
+    def touch(self, repo: str, ref: str, source: str | None = None) -> None:
+        """Record that a cached entry was just revalidated with the server."""
+        key = self.key(repo, ref, source)
+        with _index_lock:
+            entries = self._load_index()
+            if key in entries:
+                entries[key]["checked_at"] = time.time()
+                self._save_index(entries)
+
+    def temp_file(self) -> Path:
+        """Create an empty temporary file in the cache directory for a download."""
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        fd, name = tempfile.mkstemp(dir=self.cache_dir, prefix=".download-", suffix=".tmp")
+        os.close(fd)
+        return Path(name)
+
+    def store(
+        self, repo: str, ref: str, download: Path, sha256: str, etag: str | None, source: str | None = None
+    ) -> Path:
+        """Move a finished download into the cache and index it.
+
+        Args:
+            repo: GitHub repo in format "owner/repo"
+            ref: Branch or tag the archive was downloaded for
+            download: Temporary file from temp_file() holding the archive
+            sha256: Hex digest of the archive
+            etag: ETag returned by the server, if any
+            source: Mirror URL it was downloaded from (None for GitHub)
+
+        Returns:
+            Path of the cached archive
+        """
+        path = self.blob_path(sha256)
+        size = download.stat().st_size
+        os.replace(download, path)
+        with _index_lock:
+            entries = self._load_index()
+            entries[self.key(repo, ref, source)] = {
+                "etag": etag,
+                "sha256": sha256,
+                "size": size,
+                "checked_at": time.time(),
+            }
+            self._save_index(entries)
+        self.evict(keep=path)
+        return path
+
+    def evict(self, keep: Path | None = None) -> None:
+        """Delete least recently used archives until under the size budget.
+
+        Archives stored or looked up within EVICT_GRACE_SECONDS are kept
+        even if that leaves the cache over budget, so a concurrent install
+        in another process never loses the archive it is reading.
+
+        Args:
+            keep: Archive that must survive (the one about to be used)
+        """
+        recent = time.time_ns() - EVICT_GRACE_SECONDS * 1_000_000_000
+        blobs = []
+        for path in self.cache_dir.glob("*.zip"):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            blobs.append((stat.st_mtime_ns, stat.st_size, path))
+
+        total = sum(size for _, size, _ in blobs)
+        removed = set()
+        for mtime, size, path in sorted(blobs):
+            if total <= self.max_bytes:
+                break
+            if path == keep or mtime > recent:
+                continue
+            try:
+                path.unlink()
+            except OSError:
+                continue
+            total -= size
+            removed.add(path.stem)
+
+        if removed:
+            with _index_lock:
+                entries = self._load_index()
+                kept = {k: e for k, e in entries.items() if e["sha256"] not in removed}
+                self._save_index(kept)
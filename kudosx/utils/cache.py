@@ -0,0 +1,28 @@
+"""Local cache directory helpers for Kudosx."""
+
+import os
+from pathlib import Path
+
+
+def get_cache_dir(*parts: str) -> Path:
+    """Get (and create) a directory under the Kudosx cache root.
+
+    The root is ``$KUDOSX_CACHE_DIR`` if set, otherwise
+    ``$XDG_CACHE_HOME/kudosx`` or ``~/.cache/kudosx``.
+
+    Args:
+        parts: Sub-directory names below the cache root
+
+    Returns:
+        Path to the cache directory
+    """
+    root = os.environ.get("KUDOSX_CACHE_DIR")
+    if root:
+        path = Path(root)
+    else:
+        xdg = os.environ.get("XDG_CACHE_HOME")
+        path = (Path(xdg) if xdg else Path.home() / ".cache") / "kudosx"
+
+    path = path.joinpath(*parts)
+    path.mkdir(parents=True, exist_ok=True)
+    return path
@@ -56,6 +56,56 @@ DEFAULT_PRICING = {"input": 3.0, "output": 15.0, "cache_create": 3.75, "cache_re
 UsagePeriod = Literal["daily", "weekly", "monthly"]
 
 
+def iter_session_files(projects_dir: Path = None):
+    """Yield Claude Code session transcript files.
+
+    Args:
+        projects_dir: Claude projects directory (default: ~/.claude/projects)
+
+    Yields:
+        Paths of <project>/<session>.jsonl files
+    """
+    if projects_dir is None:
+        projects_dir = Path.home() / ".claude" / "projects"
+    if not projects_dir.is_dir():
+        return
+
+    for project_dir in projects_dir.iterdir():
+        if not project_dir.is_dir():
+            continue
+        yield from project_dir.glob("*.jsonl")
+
+
+def read_session_entries(session_file: Path, offset: int = 0):
+    """Read JSON entries from a session file, starting at a byte offset.
+
+    Offsets let callers checkpoint how far a transcript has been read and
+    later resume with only the appended lines. A trailing line that does
+    not parse yet (e.g. still being written) is left for the next read.
+
+    Args:
+        session_file: Session JSONL file
+        offset: Byte offset to start reading at
+
+    Yields:
+        Tuples of (offset just past the entry, parsed entry dict)
+    """
+    with open(session_file, "rb") as f:
+        f.seek(offset)
+        for line in f:
+            offset += len(line)
+            if not line.strip():
+                continue
+            try:
+                data = json.loads(line)
+            except (json.JSONDecodeError, UnicodeDecodeError):
+                if not line.endswith(b"\n"):
+                    return
+                continue
+            if isinstance(data, dict):
+                yield offset, data
+
+
 def get_claude_usage(projects_dir: Path = None) -> dict:
     """Parse all Claude Code session files and calculate token usage.
 
@@ -63,9 +113,6 @@ def get_claude_usage(projects_dir: Path = None) -> dict:
     - Deduplication using message.id + requestId (matching ccusage behavior)
     - Local timezone for date grouping (matching ccusage behavior)
     """
-    if projects_dir is None:
-        projects_dir = Path.home() / ".claude" / "projects"
-
     usage = {
         "total_input_tokens": 0,
         "total_output_tokens": 0,
@@ -93,87 +140,74 @@ def get_claude_usage(projects_dir: Path = None) -> dict:
     # Track processed entries for deduplication
     processed_hashes: set[str] = set()
 
-    for project_dir in projects_dir.iterdir():
-        if not project_dir.is_dir():
-            continue
-
-        for session_file in project_dir.glob("*.jsonl"):
-            usage["sessions"] += 1
-
-            try:
-                with open(session_file, "r") as f:
-                    for line in f:
-                        if not line.strip():
-                            continue
-
-                        try:
-                            data = json.loads(line)
-                        except json.JSONDecodeError:
-                            continue
-
-                        # Validate required fields (matching ccusage schema)
-                        msg = data.get("message")
-                        if not isinstance(msg, dict):
-                            continue
-
-                        msg_usage = msg.get("usage")
-                        if not isinstance(msg_usage, dict):
-                            continue
-
-                        # Require both input_tokens and output_tokens
-                        input_tokens = msg_usage.get("input_tokens")
-                        output_tokens = msg_usage.get("output_tokens")
-                        if not isinstance(input_tokens, (int, float)):
-                            continue
-                        if not isinstance(output_tokens, (int, float)):
-                            continue
-
-                        # Deduplication: skip if we've seen this message+request combo
-                        unique_hash = _create_unique_hash(data)
-                        if unique_hash is not None:
-                            if unique_hash in processed_hashes:
-                                usage["duplicates_skipped"] += 1
-                                continue
-                            processed_hashes.add(unique_hash)
-
-                        # Convert tokens to int
-                        input_tokens = int(input_tokens)
-                        output_tokens = int(output_tokens)
-                        cache_creation = int(msg_usage.get("cache_creation_input_tokens", 0) or 0)
-                        cache_read = int(msg_usage.get("cache_read_input_tokens", 0) or 0)
-
-                        usage["messages"] += 1
-                        usage["total_input_tokens"] += input_tokens
-                        usage["total_output_tokens"] += output_tokens
-                        usage["cache_creation_tokens"] += cache_creation
-                        usage["cache_read_tokens"] += cache_read
-
-                        # Track by model (skip synthetic)
-                        model = msg.get("model", "unknown")
-                        if model and model != "<synthetic>":
-                            usage["by_model"][model]["input"] += input_tokens
-                            usage["by_model"][model]["output"] += output_tokens
-
-                        # Track by date using LOCAL timezone
-                        timestamp = data.get("timestamp", "")
-                        date = _parse_timestamp_to_local_date(timestamp)
-                        if date:
-                            usage["by_date"][date]["input"] += input_tokens
-                            usage["by_date"][date]["output"] += output_tokens
-                            usage["by_date"][date]["cache_create"] += cache_creation
-                            usage["by_date"][date]["cache_read"] += cache_read
-                            # Normalize model name (skip synthetic models)
-                            model_short = normalize_model_name(model)
-                            if model_short:
-                                usage["by_date"][date]["models"].add(model_short)
-                                # Track per-model tokens for accurate cost calculation
-                                usage["by_date"][date]["by_model"][model_short]["input"] += input_tokens
-                                usage["by_date"][date]["by_model"][model_short]["output"] += output_tokens
-                                usage["by_date"][date]["by_model"][model_short]["cache_create"] += cache_creation
-                                usage["by_date"][date]["by_model"][model_short]["cache_read"] += cache_read
-
-            except Exception as e:
-                print(f"Error reading {session_file}: {e}")
+    for session_file in iter_session_files(projects_dir):
+        usage["sessions"] += 1
+
+        try:
+            for _, data in read_session_entries(session_file):
+                # Validate required fields (matching ccusage schema)
+                msg = data.get("message")
+                if not isinstance(msg, dict):
+                    continue
+
+                msg_usage = msg.get("usage")
+                if not isinstance(msg_usage, dict):
+                    continue
+
+                # Require both input_tokens and output_tokens
+                input_tokens = msg_usage.get("input_tokens")
+                output_tokens = msg_usage.get("output_tokens")
+                if not isinstance(input_tokens, (int, float)):
+                    continue
+                if not isinstance(output_tokens, (int, float)):
+                    continue
+
+                # Deduplication: skip if we've seen this message+request combo
+                unique_hash = _create_unique_hash(data)
+                if unique_hash is not None:
+                    if unique_hash in processed_hashes:
+                        usage["duplicates_skipped"] += 1
+                        continue
+                    processed_hashes.add(unique_hash)
+
+                # Convert tokens to int
+                input_tokens = int(input_tokens)
+                output_tokens = int(output_tokens)
+                cache_creation = int(msg_usage.get("cache_creation_input_tokens", 0) or 0)
+                cache_read = int(msg_usage.get("cache_read_input_tokens", 0) or 0)
+
+                usage["messages"] += 1
+                usage["total_input_tokens"] += input_tokens
+                usage["total_output_tokens"] += output_tokens
+                usage["cache_creation_tokens"] += cache_creation
+                usage["cache_read_tokens"] += cache_read
+
+                # Track by model (skip synthetic)
+                model = msg.get("model", "unknown")
+                if model and model != "<synthetic>":
+                    usage["by_model"][model]["input"] += input_tokens
+                    usage["by_model"][model]["output"] += output_tokens
+
+                # Track by date using LOCAL timezone
+                timestamp = data.get("timestamp", "")
+                date = _parse_timestamp_to_local_date(timestamp)
+                if date:
+                    usage["by_date"][date]["input"] += input_tokens
+                    usage["by_date"][date]["output"] += output_tokens
+                    usage["by_date"][date]["cache_create"] += cache_creation
+                    usage["by_date"][date]["cache_read"] += cache_read
+                    # Normalize model name (skip synthetic models)
+                    model_short = normalize_model_name(model)
+                    if model_short:
+                        usage["by_date"][date]["models"].add(model_short)
+                        # Track per-model tokens for accurate cost calculation
+                        usage["by_date"][date]["by_model"][model_short]["input"] += input_tokens
+                        usage["by_date"][date]["by_model"][model_short]["output"] += output_tokens
+                        usage["by_date"][date]["by_model"][model_short]["cache_create"] += cache_creation
+                        usage["by_date"][date]["by_model"][model_short]["cache_read"] += cache_read
+
+        except Exception as e:
+            print(f"Error reading {session_file}: {e}")
 
     return usage
 
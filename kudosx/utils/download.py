@@ -0,0 +1,116 @@
+"""Chunked download helpers shared by the commands that fetch over HTTP.
+
+Responses are copied to their destination in fixed-size chunks through a
+reused buffer, so memory use does not grow with the download, and each
+chunk is hashed on the way through.
+"""
+
+import hashlib
+import sys
+import time
+from typing import BinaryIO, Callable
+
+import click
+
+# Bytes read from the response per chunk
+CHUNK_SIZE = 256 * 1024
+
+# Minimum seconds between interactive progress updates
+PROGRESS_INTERVAL = 0.5
+
+
+def format_bytes(size: float) -> str:
+    """Format a byte count for display (e.g. "1.5 MiB")."""
+    for unit in ("B", "KiB", "MiB"):
+        if size < 1024:
+            return f"{size:.0f} {unit}" if unit == "B" else f"{size:.1f} {unit}"
+        size /= 1024
+    return f"{size:.1f} GiB"
+
+
+def content_length(response) -> int | None:
+    """Return the declared Content-Length of a response, if any."""
+    try:
+        return int(response.headers.get("Content-Length"))
+    except (AttributeError, TypeError, ValueError):
+        return None
+
+
+def stream_to_file(
+    response,
+    dest: BinaryIO,
+    chunk_size: int = CHUNK_SIZE,
+    progress: Callable[[int, int | None], None] | None = None,
+) -> tuple[str, int]:
+    """Copy a response body to a file in chunks.
+
+    Args:
+        response: File-like HTTP response (anything with readinto or read)
+        dest: Binary file to write to
+        chunk_size: Bytes per chunk
+        progress: Called with (bytes so far, total or None) after each chunk
+
+    Returns:
+        Tuple of (sha256 hex digest, number of bytes written)
+    """
+    total = content_length(response)
+    digest = hashlib.sha256()
+    written = 0
+    buffer = bytearray(chunk_size)
+    view = memoryview(buffer)
+    readinto = getattr(response, "readinto", None)
+
+    while True:
+        if readinto is not None:
+            n = readinto(buffer)
+            chunk = view[:n]
+        else:
+            chunk = response.read(chunk_size)
+            n = len(chunk)
+        if not n:
+            break
+        dest.write(chunk)
+        digest.update(chunk)
+        written += n
+        if progress is not None:
+            progress(written, total)
+
+    return digest.hexdigest(), written
+
+
+class DownloadProgress:
+    """Progress callback for stream_to_file that reports throughput.
+
+    On a terminal the running total is redrawn in place at most every
+    PROGRESS_INTERVAL seconds; finish() always prints a summary line.
+    """
+
+    def __init__(self, label: str = "Downloaded", interactive: bool | None = None):
+        self.label = label
+        self.interactive = sys.stdout.isatty() if interactive is None else interactive
+        self.started = time.monotonic()
+        self._last_draw = 0.0
+        self._drawn_width = 0
+
+    def __call__(self, done: int, total: int | None) -> None:
+        if not self.interactive:
+            return
+        now = time.monotonic()
+        if now - self._last_draw < PROGRESS_INTERVAL:
+            return
+        self._last_draw = now
+        line = f"{self.label} {format_bytes(done)}"
+        if total:
+            line += f" / {format_bytes(total)} ({done * 100 // total}%)"
+        click.echo(f"\r{line.ljust(self._drawn_width)}", nl=False)
+        self._drawn_width = len(line)
+
+    def finish(self, done: int) -> None:
+        """Print the final size, elapsed time and throughput."""
+        elapsed = max(time.monotonic() - self.started, 1e-6)
+        if self._drawn_width:
+            click.echo("\r" + " " * self._drawn_width + "\r", nl=False)
+        click.echo(
+            f"{self.label} {format_bytes(done)} in {elapsed:.1f}s "
+            f"({format_bytes(done / elapsed)}/s)"
+        )
@@ -0,0 +1,228 @@
+"""Persistent filename index for fast ``search -t file`` lookups.
+
+The index keeps a sorted list of relative file paths plus, for every
+directory, the mtime stamp it was listed at. Refreshing stats each indexed
+directory and re-lists only those whose stamp changed, so repeated lookups
+on an unchanged tree never list a directory. Filename queries run the
+search matchers over a newline-joined blob of basenames held in memory.
+"""
+
+import hashlib
+import marshal
+import os
+from pathlib import Path
+
+from kudosx.utils.cache import get_cache_dir
+from kudosx.utils.fs import atomic_write_bytes
+from kudosx.utils.ignore import IGNORE_FILENAMES, ancestor_chain, walk
+
+# Bump when the on-disk layout changes
+INDEX_VERSION = 1
+
+
+def _ignore_stamp(directory: str) -> tuple:
+    """Return (name, mtime_ns) pairs for the ignore files in a directory."""
+    stamp = []
+    for name in IGNORE_FILENAMES:
+        try:
+            stamp.append((name, os.stat(os.path.join(directory, name)).st_mtime_ns))
+        except OSError:
+            continue
+    return tuple(stamp)
+
+
+class FileIndex:
+    """Filename index of one directory tree.
+
+    Attributes:
+        root: Absolute path of the indexed tree
+        dirs: Relative directory ("" for root) -> (mtime_ns, ignore stamp,
+            file names, sub-directory names)
+        paths: Sorted relative file paths using "/" separators
+    """
+
+    def __init__(
+        self,
+        root,
+        hidden: bool = False,
+        respect_ignore: bool = True,
+        cache_dir: Path | None = None,
+    ):
+        self.root = os.path.abspath(root)
+        self.hidden = hidden
+        self.respect_ignore = respect_ignore
+        key = hashlib.sha1(f"{self.root}\0{hidden}\0{respect_ignore}".encode()).hexdigest()[:16]
+        self.index_path = (cache_dir or get_cache_dir("index")) / f"{key}.idx"
+        self.dirs: dict[str, tuple[int, tuple, list[str], list[str]]] = {}
+        self.paths: list[str] = []
+        self._blob = b""
+
+    def _abs(self, rel_dir: str) -> str:
+        return os.path.join(self.root, rel_dir) if rel_dir else self.root
+
+    @staticmethod
+    def _join(rel_dir: str, name: str) -> str:
+        return f"{rel_dir}/{name}" if rel_dir else name
+
+    def load(self) -> bool:
+        """Load the index from disk.
+
+        Returns:
+            True if a compatible index was loaded
+        """
+        try:
+            data = marshal.loads(self.index_path.read_bytes())
+        except (OSError, EOFError, ValueError, TypeError):
+            return False
+        if not isinstance(data, dict) or data.get("version") != INDEX_VERSION:
+            return False
+        if data.get("root") != self.root:
+            return False
+        self.dirs = data["dirs"]
+        self.paths = data["paths"]
+        self._blob = data["blob"]
+        return True
+
+    def save(self) -> None:
+        """Persist the index to disk atomically."""
+        data = {
+            "version": INDEX_VERSION,
+            "root": self.root,
+            "dirs": self.dirs,
+            "paths": self.paths,
+            "blob": self._blob,
+        }
+        self.index_path.parent.mkdir(parents=True, exist_ok=True)
+        atomic_write_bytes(self.index_path, marshal.dumps(data))
+
+    def _scan_subtree(self, rel_dir: str, chain) -> None:
+        """Walk a subtree and record every directory in it."""
+        for dirpath, dirs, files in walk(
+            self._abs(rel_dir), hidden=self.hidden,
+            respect_ignore=self.respect_ignore, base_chain=chain,
+        ):
+            rel = os.path.relpath(dirpath, self.root)
+            rel = "" if rel == "." else rel.replace(os.sep, "/")
+            try:
+                mtime = os.stat(dirpath).st_mtime_ns
+            except OSError:
+                continue
+            self.dirs[rel] = (mtime, _ignore_stamp(dirpath), sorted(files), sorted(dirs))
+
+    def _drop_subtree(self, rel_dir: str) -> None:
+        prefix = rel_dir + "/" if rel_dir else ""
+        for key in [k for k in self.dirs if k == rel_dir or k.startswith(prefix)]:
+            del self.dirs[key]
+
+    def _parent_chain(self, rel_dir: str):
+        """Matchers inherited by a directory from its ancestors."""
+        if not self.respect_ignore:
+            return ()
+        if not rel_dir:
+            return None
+        return ancestor_chain(self.root, os.path.dirname(self._abs(rel_dir)))
+
+    def _relist(self, rel_dir: str) -> None:
+        """Re-list one directory whose mtime changed."""
+        abs_dir = self._abs(rel_dir)
+        old = self.dirs[rel_dir]
+        if _ignore_stamp(abs_dir) != old[1]:
+            # New or edited ignore rules can change the whole subtree
+            self._drop_subtree(rel_dir)
+            self._scan_subtree(rel_dir, self._parent_chain(rel_dir))
+            return
+
+        # Stat before listing so a change made during the listing is seen next time
+        mtime = os.stat(abs_dir).st_mtime_ns
+        walker = walk(
+            abs_dir, hidden=self.hidden, respect_ignore=self.respect_ignore,
+            base_chain=self._parent_chain(rel_dir),
+        )
+        _, dirs, files = next(walker)
+        walker.close()
+        self.dirs[rel_dir] = (mtime, old[1], sorted(files), sorted(dirs))
+
+        for name in set(old[3]) - set(dirs):
+            self._drop_subtree(self._join(rel_dir, name))
+        added = set(dirs) - set(old[3])
+        if added:
+            chain = ancestor_chain(self.root, abs_dir) if self.respect_ignore else ()
+            for name in added:
+                self._scan_subtree(self._join(rel_dir, name), chain)
+
+    def rebuild(self) -> None:
+        """Index the whole tree from scratch."""
+        self.dirs = {}
+        self._scan_subtree("", None if self.respect_ignore else ())
+        self._materialize()
+
+    def refresh(self) -> int:
+        """Revalidate the index against the filesystem.
+
+        Returns:
+            Number of directories that had to be re-listed
+        """
+        stale = []
+        for rel_dir, (mtime, ignore_stamp, _, _) in self.dirs.items():
+            abs_dir = self._abs(rel_dir)
+            try:
+                if os.stat(abs_dir).st_mtime_ns != mtime:
+                    stale.append(rel_dir)
+                    continue
+                for name, ignore_mtime in ignore_stamp:
+                    if os.stat(os.path.join(abs_dir, name)).st_mtime_ns != ignore_mtime:
+                        stale.append(rel_dir)
+                        break
+            except OSError:
+                stale.append(rel_dir)
+
+        # Parents first, so a re-listed parent can drop or re-scan children
+        for rel_dir in sorted(stale, key=lambda d: d.count("/") if d else -1):
+            if rel_dir not in self.dirs:
+                continue
+            if not os.path.isdir(self._abs(rel_dir)):
+                self._drop_subtree(rel_dir)
+                continue
+            self._relist(rel_dir)
+
+        if stale:
+            self._materialize()
+        return len(stale)
+
+    def _materialize(self) -> None:
+        """Rebuild the sorted path list and the basename blob."""
+        self.paths = sorted(
+            self._join(rel_dir, name)
+            for rel_dir, entry in self.dirs.items()
+            for name in entry[2]
+        )
+        names = (p.rsplit("/", 1)[-1].replace("\n", "?") for p in self.paths)
+        self._blob = "\n".join(names).encode("utf-8", errors="surrogateescape")
+
+    def ensure(self) -> int:
+        """Load, revalidate and persist the index as needed.
+
+        Returns:
+            Number of directories re-listed (-1 after a full rebuild)
+        """
+        if not self.load():
+            self.rebuild()
+            self.save()
+            return -1
+        changed = self.refresh()
+        if changed:
+            self.save()
+        return changed
+
+    def find(self, matcher) -> list[str]:
+        """Return indexed paths whose filename matches.
+
+        Args:
+            matcher: Matcher from kudosx.utils.matcher.build_matcher
+
+        Returns:
+            Matching relative paths in sorted order
+        """
+        if not self.paths:
+            return []
+        return [self.paths[line_num - 1] for line_num, _ in matcher.scan(self._blob)]
@@ -0,0 +1,259 @@
+"""Filesystem helpers for Kudosx."""
+
+import hashlib
+import os
+import secrets
+import shutil
+import tempfile
+from contextlib import contextmanager
+from pathlib import Path
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+# ioctl that makes a file share another file's blocks (copy-on-write), Linux
+FICLONE = 0x40049409
+
+# How clone_file materializes files, overridable with KUDOSX_LINK_MODE:
+# "clone" (reflink, then copy), "hardlink" (reflink, hardlink, then copy) or "copy"
+LINK_MODES = ("clone", "hardlink", "copy")
+
+
+def atomic_write_bytes(path: Path, data: bytes) -> None:
+    """Write a file atomically.
+
+    The data is written to a temporary file in the same directory and then
+    moved over the target with ``os.replace``, so readers never see a
+    partially written file. An existing file's permissions, and its owner
+    and group where the process may set them, are preserved; new files are
+    created with mode 0644. The directory entry is replaced, so callers
+    must resolve symlinks first, and other hard links to the file keep the
+    old contents.
+
+    Args:
+        path: Target file path
+        data: File contents
+    """
+    path = Path(path)
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        try:
+            stat = os.stat(path)
+        except FileNotFoundError:
+            os.chmod(tmp_name, 0o644)
+        else:
+            if hasattr(os, "chown"):
+                try:
+                    os.chown(tmp_name, stat.st_uid, stat.st_gid)
+                except OSError:
+                    pass
+            os.chmod(tmp_name, stat.st_mode & 0o7777)
+        os.replace(tmp_name, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_name)
+        except FileNotFoundError:
+            pass
+        raise
+
+
+def file_sha256(path: Path) -> str:
+    """Hash a file in blocks."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def fsync_dir(path: Path) -> None:
+    """Flush a directory's entries (new names, renames) to disk."""
+    try:
+        fd = os.open(path, os.O_RDONLY | getattr(os, "O_DIRECTORY", 0))
+    except OSError:
+        # Directories cannot be opened on some platforms (Windows)
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+def fsync_tree(path: Path) -> None:
+    """Flush every file and directory under path to disk."""
+    for dirpath, _, filenames in os.walk(path):
+        for name in filenames:
+            file_path = os.path.join(dirpath, name)
+            if os.path.islink(file_path):
+                continue
+            with open(file_path, "rb") as f:
+                os.fsync(f.fileno())
+        fsync_dir(Path(dirpath))
+
+
+def replace_directory(source: Path, target: Path) -> None:
+    """Move a directory over another one, keeping the old one until it succeeds.
+
+    The existing target is first renamed aside, then source is renamed
+    into place. If that fails the old directory is renamed back, so the
+    target is never left missing or half-written; it only disappears for
+    the instant between the two renames. Both paths must be on the same
+    filesystem.
+
+    Args:
+        source: Fully written directory to install
+        target: Directory to replace (may not exist)
+    """
+    source, target = Path(source), Path(target)
+    backup = None
+    if target.exists():
+        backup = Path(tempfile.mkdtemp(dir=target.parent, prefix=f".{target.name}.", suffix=".old"))
+        os.rmdir(backup)
+        os.rename(target, backup)
+    try:
+        os.rename(source, target)
+    except BaseException:
+        if backup is not None:
+            os.rename(backup, target)
+        raise
+    fsync_dir(target.parent)
+    if backup is not None:
+        shutil.rmtree(backup, ignore_errors=True)
+
+
+@contextmanager
+def staged_directory(target: Path):
+    """Build a directory next to target and swap it in atomically on success.
+
+    Yields an empty staging directory on the same filesystem as target.
+    When the block completes, the staged tree is fsynced and moved over
+    target with replace_directory; if the block raises (including Ctrl-C)
+    the staging directory is removed and target is left untouched.
+
+    Args:
+        target: Directory to create or replace
+
+    Yields:
+        Path of the staging directory
+    """
+    target = Path(target)
+    target.parent.mkdir(parents=True, exist_ok=True)
+    staging = Path(tempfile.mkdtemp(dir=target.parent, prefix=f".{target.name}.", suffix=".staging"))
+    try:
+        # mkdtemp creates the directory private to the user
+        staging.chmod(0o755)
+        yield staging
+        fsync_tree(staging)
+        replace_directory(staging, target)
+    finally:
+        if staging.exists():
+            shutil.rmtree(staging, ignore_errors=True)
+
+
+def link_mode() -> str:
+    """Return the configured KUDOSX_LINK_MODE (default "clone")."""
+    mode = os.environ.get("KUDOSX_LINK_MODE", "clone").lower()
+    return mode if mode in LINK_MODES else "clone"
+
+
+def _reflink(source: Path, target: Path) -> bool:
+    if fcntl is None:
+        return False
+    try:
+        with open(source, "rb") as src, open(target, "xb") as dst:
+            fcntl.ioctl(dst.fileno(), FICLONE, src.fileno())
+        return True
+    except OSError:
+        try:
+            os.unlink(target)
+        except FileNotFoundError:
+            pass
+        return False
+
+
+def _copy_file(source: Path, target: Path) -> None:
+    copy_file_range = getattr(os, "copy_file_range", None)
+    if copy_file_range is not None:
+        try:
+            with open(source, "rb") as src, open(target, "xb") as dst:
+                remaining = os.fstat(src.fileno()).st_size
+                while remaining > 0:
+                    copied = copy_file_range(src.fileno(), dst.fileno(), remaining)
+                    if copied == 0:
+                        break
+                    remaining -= copied
+            if remaining <= 0:
+                return
+        except OSError:
+            pass
+        try:
+            os.unlink(target)
+        except FileNotFoundError:
+            pass
+    shutil.copyfile(source, target)
+
+
+def clone_file(source: Path, target: Path, mode: str | None = None) -> str:
+    """Create target with the contents of source, sharing storage when possible.
+
+    A reflink (FICLONE) shares the blocks copy-on-write, so both files stay
+    independent; otherwise the data is copied with copy_file_range (which
+    the kernel may still do without moving data) or a plain copy. Only in
+    "hardlink" mode is the inode itself shared, so that an in-place edit of
+    either file changes both. Reflinked and copied files get source's
+    permission bits (plus owner write).
+
+    Args:
+        source: Existing file
+        target: Path to create (must not exist)
+        mode: "clone", "hardlink" or "copy" (default: KUDOSX_LINK_MODE)
+
+    Returns:
+        "reflink", "hardlink" or "copy"
+    """
+    mode = mode or link_mode()
+    if mode != "copy" and _reflink(source, target):
+        method = "reflink"
+    else:
+        if mode == "hardlink":
+            try:
+                os.link(source, target)
+                return "hardlink"
+            except OSError:
+                pass
+        _copy_file(source, target)
+        method = "copy"
+    os.chmod(target, (os.stat(source).st_mode & 0o7777) | 0o200)
+    return method
+
+
+def replace_with_clone(source: Path, target: Path, mode: str | None = None) -> str:
+    """Atomically replace target with a clone_file of source.
+
+    The clone is made under a temporary name next to target and renamed
+    over it, so a file that was hardlinked before is unlinked rather than
+    written through.
+
+    Returns:
+        How the file was materialized (see clone_file)
+    """
+    target = Path(target)
+    tmp = target.parent / f".{target.name}.{secrets.token_hex(4)}.tmp"
+    try:
+        method = clone_file(source, tmp, mode)
+        os.replace(tmp, target)
+    except BaseException:
+        try:
+            os.unlink(tmp)
+        except FileNotFoundError:
+            pass
+        raise
+    return method
@@ -0,0 +1,208 @@
+"""fzf-style fuzzy matching of file paths.
+
+A path matches when the query characters appear in it in order. Matches
+are scored like fzf's v1 algorithm: characters at word boundaries (after
+``/``, ``_``, ``-``, ``.`` or a space), camelCase humps and consecutive
+runs earn bonuses, gaps cost a penalty, and hits inside the basename rank
+above hits spread over directory names.
+
+Candidate filtering runs inside the regex engine over a newline-joined
+blob of paths: a query like ``abc`` becomes ``^[^a]*a[^b]*b[^c]*c``.
+Each class excludes the character that follows it, so there is only one
+way to match and nothing to backtrack into; only surviving paths are
+scored in Python.
+"""
+
+import heapq
+import re
+from itertools import islice
+
+SCORE_MATCH = 16
+BONUS_BOUNDARY = 8
+BONUS_CAMEL = 7
+BONUS_CONSECUTIVE = 5
+BONUS_FIRST_CHAR_MULTIPLIER = 2
+BONUS_BASENAME = 12
+PENALTY_GAP_START = 3
+PENALTY_GAP_EXTENSION = 1
+
+BOUNDARY_CHARS = frozenset("/_-. \\")
+
+# Maximum number of candidates scored per query
+MAX_SCORED = 5000
+
+
+def is_case_sensitive(query: str) -> bool:
+    """Smart case: only queries containing uppercase letters match case."""
+    return query != query.lower()
+
+
+def compile_query(query: str) -> re.Pattern:
+    """Compile a subsequence filter regex for a lowercase query.
+
+    The pattern runs over a newline-joined blob of lowercased paths and
+    ``findall`` returns every line containing the query as a subsequence.
+    Each ``[^c\\n]*c`` step can only stop at the first ``c``, so matching
+    is linear without possessive quantifiers (which need Python 3.11).
+    """
+    parts = "".join(f"[^{re.escape(c)}\\n]*{re.escape(c)}" for c in query)
+    return re.compile(f"^{parts}[^\\n]*", re.MULTILINE)
+
+
+def fuzzy_match(query: str, path: str, case_sensitive: bool | None = None):
+    """Score a path against a fuzzy query.
+
+    After finding the first occurrence of the whole subsequence, the match
+    is shrunk backwards to the shortest window ending at the same place,
+    as fzf does, and the characters in that window are scored.
+
+    Args:
+        query: Fuzzy query (no whitespace)
+        path: Candidate path
+        case_sensitive: Match case exactly (default: smart case)
+
+    Returns:
+        Tuple of (score, matched character positions), or None if the path
+        does not contain the query as a subsequence
+    """
+    if case_sensitive is None:
+        case_sensitive = is_case_sensitive(query)
+    text = path if case_sensitive else path.lower()
+    if not case_sensitive:
+        query = query.lower()
+    if not query:
+        return 0, []
+
+    pos = 0
+    for char in query:
+        pos = text.find(char, pos) + 1
+        if pos == 0:
+            return None
+    end = pos
+
+    positions = []
+    for char in reversed(query):
+        end = text.rfind(char, 0, end)
+        positions.append(end)
+    positions.reverse()
+
+    basename_start = path.rfind("/") + 1
+    score = 0
+    prev = -2
+    for k, p in enumerate(positions):
+        before = path[p - 1] if p else "/"
+        if before in BOUNDARY_CHARS:
+            bonus = BONUS_BOUNDARY
+        elif before.islower() and path[p].isupper():
+            bonus = BONUS_CAMEL
+        else:
+            bonus = 0
+        if k == 0:
+            bonus *= BONUS_FIRST_CHAR_MULTIPLIER
+        elif p == prev + 1:
+            bonus = max(bonus, BONUS_CONSECUTIVE)
+        else:
+            score -= PENALTY_GAP_START + PENALTY_GAP_EXTENSION * (p - prev - 2)
+        score += SCORE_MATCH + bonus
+        prev = p
+
+    if positions[0] >= basename_start:
+        score += BONUS_BASENAME
+    return score, positions
+
+
+class FuzzyFinder:
+    """Incremental fuzzy finder over a fixed list of paths.
+
+    Candidates are filtered case-insensitively on lowercased paths (the
+    regex engine is much faster without IGNORECASE); smart case is applied
+    when scoring. Each query remembers its candidates, and when the next
+    query extends a previous one (the user typed another character) only
+    that candidate set is filtered again; deleting characters falls back
+    to the longest remembered prefix.
+
+    Scoring runs in Python, so at most ``max_scored`` candidates are
+    scored per query. When more paths match (typically for one or two
+    character queries) the ones containing the query verbatim in their
+    basename are scored first, and ``unscored`` records how many matching
+    paths the last search left out so callers can say the ranking is
+    partial.
+    """
+
+    def __init__(self, paths: list[str], max_scored: int = MAX_SCORED):
+        self.paths = paths
+        self.max_scored = max_scored
+        self._blob = "\n".join(paths).lower()
+        self._originals: dict[str, str] | None = None
+        # (lowercase query, lowercased matching paths), each extending the previous
+        self._history: list[tuple[str, list[str]]] = []
+        # Matching paths the last search did not score
+        self.unscored = 0
+
+    def candidates(self, query: str) -> list[str]:
+        """Return lowercased paths containing the query as a subsequence, ignoring case."""
+        query = query.lower()
+        while self._history and not query.startswith(self._history[-1][0]):
+            self._history.pop()
+        if self._history and self._history[-1][0] == query:
+            return self._history[-1][1]
+
+        blob = "\n".join(self._history[-1][1]) if self._history else self._blob
+        found = compile_query(query).findall(blob)
+        self._history.append((query, found))
+        return found
+
+    def _shortlist(self, query: str, found: list[str]) -> list[str]:
+        if len(found) <= self.max_scored:
+            return found
+        query = query.lower()
+        preferred = [f for f in found if query in f[f.rfind("/") + 1:]]
+        if len(preferred) < self.max_scored:
+            chosen = set(preferred)
+            preferred.extend(islice((f for f in found if f not in chosen), self.max_scored - len(preferred)))
+        return preferred[:self.max_scored]
+
+    def _original_paths(self, folded: list[str]):
+        if self._originals is None:
+            keys = self._blob.split("\n")
+            self._originals = dict(zip(keys, self.paths))
+            self._case_variants: dict[str, list[str]] = {}
+            if len(self._originals) < len(self.paths):
+                # Paths differing only in case share a lowercase key
+                for key, path in zip(keys, self.paths):
+                    if self._originals[key] != path:
+                        self._case_variants.setdefault(key, [self._originals[key]]).append(path)
+        for key in dict.fromkeys(folded):
+            if key in self._case_variants:
+                yield from self._case_variants[key]
+            elif key in self._originals:
+                yield self._originals[key]
+
+    def search(self, query: str, limit: int = 50) -> list[tuple[int, str, list[int]]]:
+        """Rank paths matching a query.
+
+        Args:
+            query: Fuzzy query; whitespace is ignored
+            limit: Maximum number of results
+
+        Returns:
+            List of (score, path, matched positions), best first; ties go
+            to shorter paths, then alphabetical order
+        """
+        query = "".join(query.split())
+        self.unscored = 0
+        if not query:
+            return [(0, path, []) for path in self.paths[:limit]]
+
+        case_sensitive = is_case_sensitive(query)
+        scored = []
+        found = self.candidates(query)
+        shortlist = self._shortlist(query, found)
+        self.unscored = len(found) - len(shortlist)
+        for path in self._original_paths(shortlist):
+            result = fuzzy_match(query, path, case_sensitive)
+            if result is not None:
+                scored.append((-result[0], len(path), path, result[1]))
+
+        best = heapq.nsmallest(limit, scored, key=lambda item: item[:3])
+        return [(-neg_score, path, positions) for neg_score, _, path, positions in best]
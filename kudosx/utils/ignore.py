@@ -0,0 +1,269 @@
+"""Gitignore-style path filtering and directory walking for Kudosx."""
+
+import os
+import re
+
+# Ignore files read from every directory, in order of increasing precedence
+# (a repository's .git/info/exclude is read before these)
+IGNORE_FILENAMES = (".gitignore", ".ignore")
+
+
+def _translate(pattern: str) -> str:
+    """Translate a single gitignore glob into a regex body.
+
+    Args:
+        pattern: Glob with leading "/" and trailing "/" already removed
+
+    Returns:
+        Regex source matching a "/"-separated relative path
+    """
+    out = []
+    i = 0
+    n = len(pattern)
+    while i < n:
+        c = pattern[i]
+        if c == "*":
+            if pattern.startswith("**", i) and (i == 0 or pattern[i - 1] == "/"):
+                if i + 2 == n:
+                    out.append(".*")
+                    i += 2
+                    continue
+                if pattern[i + 2] == "/":
+                    out.append("(?:.*/)?")
+                    i += 3
+                    continue
+            out.append("[^/]*")
+            while i < n and pattern[i] == "*":
+                i += 1
+            continue
+        if c == "?":
+            out.append("[^/]")
+        elif c == "[":
+            end = pattern.find("]", i + 2 if pattern.startswith("[!", i) else i + 1)
+            if end == -1:
+                out.append(re.escape(c))
+            else:
+                body = pattern[i + 1:end]
+                if body.startswith("!"):
+                    body = "^" + body[1:]
+                out.append("[" + body.replace("\\", "\\\\") + "]")
+                i = end
+        elif c == "\\" and i + 1 < n:
+            i += 1
+            out.append(re.escape(pattern[i]))
+        else:
+            out.append(re.escape(c))
+        i += 1
+    return "".join(out)
+
+
+class IgnoreMatcher:
+    """Compiled rules from the ignore files of a single directory.
+
+    Rules follow gitignore semantics: the last matching rule wins, "!"
+    re-includes a path, a trailing "/" only matches directories, and a
+    pattern containing "/" is anchored to the directory it was read from.
+    """
+
+    def __init__(self, base: str, lines: list[str]):
+        self.base = base
+        self.rules: list[tuple[re.Pattern, bool, bool]] = []
+
+        for raw in lines:
+            line = raw.rstrip("\n").rstrip("\r")
+            if not line.endswith("\\ "):
+                line = line.rstrip(" ")
+            if not line or line.startswith("#"):
+                continue
+
+            negate = line.startswith("!")
+            if negate:
+                line = line[1:]
+            elif line.startswith("\\"):
+                line = line[1:]
+
+            dir_only = line.endswith("/")
+            line = line.rstrip("/")
+            if not line:
+                continue
+
+            anchored = "/" in line
+            line = line.lstrip("/")
+            body = _translate(line)
+            if not anchored:
+                body = "(?:.*/)?" + body
+            self.rules.append((re.compile(body + r"\Z", re.DOTALL), negate, dir_only))
+
+        # Without negations the rule order is irrelevant, so every rule can be
+        # folded into a single alternation per entry kind.
+        self._has_negation = any(negate for _, negate, _ in self.rules)
+        if not self._has_negation:
+            self._file_re = self._combine(r for r, _, dir_only in self.rules if not dir_only)
+            self._dir_re = self._combine(r for r, _, _ in self.rules)
+
+    @staticmethod
+    def _combine(regexes) -> re.Pattern | None:
+        sources = [r.pattern for r in regexes]
+        if not sources:
+            return None
+        return re.compile("|".join(f"(?:{s})" for s in sources), re.DOTALL)
+
+    def __bool__(self) -> bool:
+        return bool(self.rules)
+
+    def match(self, rel_path: str, is_dir: bool) -> bool | None:
+        """Check a path relative to this matcher's base directory.
+
+        Returns:
+            True if ignored, False if explicitly re-included, None if no rule matches
+        """
+        if not self._has_negation:
+            regex = self._dir_re if is_dir else self._file_re
+            if regex is not None and regex.match(rel_path):
+                return True
+            return None
+
+        for regex, negate, dir_only in reversed(self.rules):
+            if dir_only and not is_dir:
+                continue
+            if regex.match(rel_path):
+                return not negate
+        return None
+
+
+def load_ignore_matcher(directory: str) -> IgnoreMatcher | None:
+    """Load and compile the ignore files found in a directory.
+
+    Args:
+        directory: Absolute directory path
+
+    Returns:
+        Matcher for the directory, or None if it has no ignore rules
+    """
+    lines = []
+    for name in (os.path.join(".git", "info", "exclude"),) + IGNORE_FILENAMES:
+        try:
+            with open(os.path.join(directory, name), encoding="utf-8", errors="ignore") as f:
+                lines.extend(f.readlines())
+        except OSError:
+            continue
+
+    matcher = IgnoreMatcher(directory, lines)
+    return matcher if matcher else None
+
+
+def is_ignored(chain: tuple[IgnoreMatcher, ...], path: str, is_dir: bool) -> bool:
+    """Check a path against a chain of matchers, deepest directory first.
+
+    Args:
+        chain: Matchers from the outermost to the innermost directory
+        path: Absolute path to check
+        is_dir: Whether the path is a directory
+    """
+    for matcher in reversed(chain):
+        rel_path = path[len(matcher.base):].lstrip(os.sep)
+        if os.sep != "/":
+            rel_path = rel_path.replace(os.sep, "/")
+        result = matcher.match(rel_path, is_dir)
+        if result is not None:
+            return result
+    return False
+
+
+def _parent_chain(root: str) -> tuple[IgnoreMatcher, ...]:
+    """Collect matchers from the enclosing repository above a search root."""
+    parents = []
+    current = os.path.dirname(root)
+    if os.path.exists(os.path.join(root, ".git")):
+        return ()
+    while current and current != os.path.dirname(current):
+        parents.append(current)
+        if os.path.exists(os.path.join(current, ".git")):
+            break
+        current = os.path.dirname(current)
+    else:
+        # Not inside a repository: ancestor ignore files do not apply
+        return ()
+
+    chain = []
+    for directory in reversed(parents):
+        matcher = load_ignore_matcher(directory)
+        if matcher:
+            chain.append(matcher)
+    return tuple(chain)
+
+
+def ancestor_chain(root, directory) -> tuple[IgnoreMatcher, ...]:
+    """Collect the matchers that apply to the entries of a directory.
+
+    Args:
+        root: Walk root the directory belongs to
+        directory: Directory at or below root
+
+    Returns:
+        Matchers from the enclosing repository down to the directory itself
+    """
+    root = os.path.abspath(root)
+    directory = os.path.abspath(directory)
+    rel_parts = [] if directory == root else os.path.relpath(directory, root).split(os.sep)
+
+    chain = list(_parent_chain(root))
+    current = root
+    for part in [None] + rel_parts:
+        if part is not None:
+            current = os.path.join(current, part)
+        matcher = load_ignore_matcher(current)
+        if matcher:
+            chain.append(matcher)
+    return tuple(chain)
+
+
+def walk(root, hidden: bool = False, respect_ignore: bool = True, base_chain=None):
+    """Walk a directory tree, pruning hidden and ignored entries.
+
+    Works like ``os.walk`` (top-down), except that ignored directories are
+    removed before they are descended into, so their contents are never
+    listed. Ignore files are read once per directory.
+
+    Args:
+        root: Directory to walk
+        hidden: Include hidden files and directories
+        respect_ignore: Apply .gitignore/.ignore rules
+        base_chain: Matchers inherited from above root (default: those of
+            the enclosing repository); root's own ignore files are added
+
+    Yields:
+        Tuples of (dirpath, dirnames, filenames)
+    """
+    root = os.path.abspath(root)
+    chains: dict[str, tuple[IgnoreMatcher, ...]] = {}
+    if respect_ignore:
+        chains[root] = _parent_chain(root) if base_chain is None else tuple(base_chain)
+
+    for dirpath, dirs, files in os.walk(root):
+        if not hidden:
+            dirs[:] = [d for d in dirs if not d.startswith(".")]
+            files = [f for f in files if not f.startswith(".")]
+
+        if respect_ignore:
+            chain = chains.pop(dirpath, ())
+            matcher = load_ignore_matcher(dirpath)
+            if matcher:
+                chain = chain + (matcher,)
+
+            if chain:
+                dirs[:] = [
+                    d for d in dirs
+                    if d != ".git" and not is_ignored(chain, os.path.join(dirpath, d), True)
+                ]
+                files = [
+                    f for f in files
+                    if not is_ignored(chain, os.path.join(dirpath, f), False)
+                ]
+            else:
+                dirs[:] = [d for d in dirs if d != ".git"]
+
+            for d in dirs:
+                chains[os.path.join(dirpath, d)] = chain
+
+        yield dirpath, dirs, files
@@ -0,0 +1,78 @@
+"""Per-file manifest of an installed skill.
+
+Every install writes a manifest next to the skill's ``VERSION`` file,
+listing each file with its sha256 and the size and mtime it had on disk.
+Updates compare a new archive against it so only added or changed files
+are written and removed ones deleted. A file whose size or mtime no
+longer matches the manifest (e.g. edited by hand) is re-hashed rather
+than trusted.
+"""
+
+import json
+import os
+from pathlib import Path
+
+from kudosx.utils.fs import atomic_write_bytes, file_sha256
+
+# File name of the manifest inside a skill directory
+MANIFEST_NAME = ".manifest.json"
+
+# Bump when the manifest layout changes
+MANIFEST_VERSION = 1
+
+# Files kudosx writes itself, which are never listed in the manifest
+UNTRACKED_FILES = frozenset({"VERSION", MANIFEST_NAME})
+
+
+def manifest_entry(path: Path, sha256: str) -> dict:
+    """Build the manifest entry of a file that was just written."""
+    stat = os.stat(path)
+    return {"sha256": sha256, "size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+
+
+def read_manifest(skill_path: Path) -> dict[str, dict] | None:
+    """Read the manifest of an installed skill.
+
+    Returns:
+        Dict of relative POSIX path -> entry, or None if there is no
+        usable manifest
+    """
+    try:
+        data = json.loads((Path(skill_path) / MANIFEST_NAME).read_text())
+    except (OSError, ValueError):
+        return None
+    if not isinstance(data, dict) or data.get("version") != MANIFEST_VERSION:
+        return None
+    return data.get("files")
+
+
+def write_manifest(skill_path: Path, files: dict[str, dict]) -> None:
+    """Write the manifest of an installed skill atomically."""
+    payload = json.dumps({"version": MANIFEST_VERSION, "files": files}, sort_keys=True)
+    atomic_write_bytes(Path(skill_path) / MANIFEST_NAME, payload.encode("utf-8"))
+
+
+def installed_sha256(skill_path: Path, relative: str, entry: dict | None) -> str | None:
+    """Current sha256 of an installed file.
+
+    The manifest's hash is used while the file's size and mtime still match
+    it; otherwise the file is hashed again.
+
+    Args:
+        skill_path: Skill directory
+        relative: File path relative to skill_path (POSIX separators)
+        entry: Manifest entry of the file, if any
+
+    Returns:
+        Hex digest, or None if the file does not exist
+    """
+    path = Path(skill_path, *relative.split("/"))
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    if not path.is_file():
+        return None
+    if entry and entry["size"] == stat.st_size and entry["mtime_ns"] == stat.st_mtime_ns:
+        return entry["sha256"]
+    return file_sha256(path)
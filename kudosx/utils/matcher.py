@@ -0,0 +1,241 @@
+"""Line matchers used by the search command.
+
+Queries without regex metacharacters are matched with ``bytes.find`` over
+the raw file buffer instead of running a regex on every decoded line.
+Several literal queries are merged into one prefix-trie regex so a file is
+scanned in a single pass no matter how many patterns are given.
+"""
+
+import re
+from abc import ABC, abstractmethod
+from typing import Iterator
+
+# Characters that give a query regex meaning
+REGEX_METACHARACTERS = frozenset(".^$*+?{}[]\\|()")
+
+
+def is_literal(query: str) -> bool:
+    """Check whether a query contains no regex metacharacters."""
+    return not any(c in REGEX_METACHARACTERS for c in query)
+
+
+def _line_bounds(data: bytes, index: int) -> tuple[int, int]:
+    """Return the start and end offsets of the line containing index."""
+    start = data.rfind(b"\n", 0, index) + 1
+    end = data.find(b"\n", index)
+    if end == -1:
+        end = len(data)
+    return start, end
+
+
+class _BufferMatcher(ABC):
+    """Base for matchers that locate hits directly in the raw file buffer."""
+
+    def _prepare(self, data: bytes) -> bytes:
+        return data
+
+    @abstractmethod
+    def _find(self, data: bytes, pos: int) -> int:
+        """Return the offset of the next hit at or after pos, or -1."""
+
+    def scan(self, data: bytes) -> Iterator[tuple[int, str]]:
+        """Yield (line number, line text) for each matching line."""
+        haystack = self._prepare(data)
+        line_num = 1
+        counted_to = 0
+        pos = 0
+        while True:
+            index = self._find(haystack, pos)
+            if index == -1 or index >= len(haystack):
+                return
+            start, end = _line_bounds(haystack, index)
+            line_num += haystack.count(b"\n", counted_to, start)
+            counted_to = start
+            yield line_num, data[start:end].decode("utf-8", errors="ignore")
+            pos = end + 1
+
+    def contains(self, data: bytes) -> bool:
+        """Check whether any line matches, stopping at the first hit."""
+        haystack = self._prepare(data)
+        index = self._find(haystack, 0)
+        return index != -1 and index < len(haystack)
+
+    def count(self, data: bytes) -> int:
+        """Count matching lines without decoding or numbering them."""
+        haystack = self._prepare(data)
+        total = 0
+        pos = 0
+        while True:
+            index = self._find(haystack, pos)
+            if index == -1 or index >= len(haystack):
+                return total
+            total += 1
+            end = haystack.find(b"\n", index)
+            if end == -1:
+                return total
+            pos = end + 1
+
+
+class LiteralMatcher(_BufferMatcher):
+    """Plain substring matcher backed by ``bytes.find``."""
+
+    def __init__(self, needle: str, ignore_case: bool = False):
+        self.ignore_case = ignore_case
+        self.text = needle.lower() if ignore_case else needle
+        self.needle = self.text.encode("utf-8")
+
+    def _prepare(self, data: bytes) -> bytes:
+        # bytes.lower() only folds ASCII, so offsets still line up with data
+        return data.lower() if self.ignore_case else data
+
+    def _find(self, data: bytes, pos: int) -> int:
+        return data.find(self.needle, pos)
+
+    def search(self, text: str) -> bool:
+        """Check whether text (e.g. a filename) contains the needle."""
+        return self.text in (text.lower() if self.ignore_case else text)
+
+
+def _trie_regex(node: dict) -> bytes:
+    """Render a byte trie as a regex that shares common prefixes."""
+    branches = [
+        re.escape(bytes([byte])) + _trie_regex(child)
+        for byte, child in sorted((k, v) for k, v in node.items() if k is not None)
+    ]
+    if not branches:
+        return b""
+    terminal = None in node
+    if len(branches) == 1 and not terminal:
+        return branches[0]
+    group = b"(?:" + b"|".join(branches) + b")"
+    return group + b"?" if terminal else group
+
+
+class MultiLiteralMatcher(_BufferMatcher):
+    """Matcher for a set of literal strings in a single pass.
+
+    The literals are inserted into a byte trie which is rendered as one
+    regex alternation sharing common prefixes, so the scan runs inside the
+    regex engine rather than a per-byte Python loop. This is not an
+    Aho-Corasick automaton: there are no failure links, and the backtracking
+    engine retries the trie at each start position, so the worst case is
+    O(len(data) * longest needle) rather than linear.
+    """
+
+    def __init__(self, needles: list[str], ignore_case: bool = False):
+        self.needles = needles
+        trie: dict = {}
+        for needle in needles:
+            node = trie
+            for byte in needle.encode("utf-8"):
+                node = node.setdefault(byte, {})
+            node[None] = True
+
+        flags = re.IGNORECASE if ignore_case else 0
+        self.regex = re.compile(_trie_regex(trie), flags)
+        self.text_regex = re.compile("|".join(re.escape(n) for n in needles), flags)
+
+    def _find(self, data: bytes, pos: int) -> int:
+        match = self.regex.search(data, pos)
+        return match.start() if match else -1
+
+    def search(self, text: str) -> bool:
+        """Check whether text contains any of the needles."""
+        return self.text_regex.search(text) is not None
+
+
+# Regex constructs whose result can depend on where the subject string ends
+_LINE_SENSITIVE = ("^", "$", "\\A", "\\Z", "\\z", "(?=", "(?!", "(?<")
+
+
+class RegexMatcher:
+    """Regex matcher with per-line semantics.
+
+    Patterns without anchors or lookarounds are searched over the whole
+    decoded buffer, so the regex engine skips non-matching text in C; each
+    candidate line is then re-checked on its own to keep line semantics.
+    Other patterns are applied line by line.
+    """
+
+    def __init__(self, pattern: str, ignore_case: bool = False):
+        self.regex = re.compile(pattern, re.IGNORECASE if ignore_case else 0)
+        self._whole_buffer = not any(token in pattern for token in _LINE_SENSITIVE)
+
+    @staticmethod
+    def _lines(data: bytes) -> list[str]:
+        # Split on "\n" only so line numbers agree with the buffer matchers
+        lines = data.decode("utf-8", errors="ignore").split("\n")
+        if lines[-1] == "":
+            lines.pop()
+        return [line[:-1] if line.endswith("\r") else line for line in lines]
+
+    def scan(self, data: bytes) -> Iterator[tuple[int, str]]:
+        """Yield (line number, line text) for each matching line."""
+        if not self._whole_buffer:
+            for line_num, line in enumerate(self._lines(data), 1):
+                if self.regex.search(line):
+                    yield line_num, line
+            return
+
+        content = data.decode("utf-8", errors="ignore")
+        search = self.regex.search
+        line_num = 1
+        counted_to = 0
+        pos = 0
+        while pos <= len(content):
+            match = search(content, pos)
+            if match is None:
+                return
+            start = content.rfind("\n", 0, match.start()) + 1
+            if start == len(content):
+                return
+            end = content.find("\n", start)
+            if end == -1:
+                end = len(content)
+            line = content[start:end]
+            if line.endswith("\r"):
+                line = line[:-1]
+            line_num += content.count("\n", counted_to, start)
+            counted_to = start
+            if search(line):
+                yield line_num, line
+            pos = end + 1
+
+    def contains(self, data: bytes) -> bool:
+        """Check whether any line matches, stopping at the first hit."""
+        return next(self.scan(data), None) is not None
+
+    def count(self, data: bytes) -> int:
+        """Count matching lines."""
+        return sum(1 for _ in self.scan(data))
+
+    def search(self, text: str) -> bool:
+        """Check whether text matches the pattern."""
+        return self.regex.search(text) is not None
+
+
+def build_matcher(patterns: list[str], ignore_case: bool = False):
+    """Pick the fastest matcher able to handle the given patterns.
+
+    Args:
+        patterns: One or more search patterns (regex or literal)
+        ignore_case: Case insensitive matching
+
+    Returns:
+        LiteralMatcher, MultiLiteralMatcher or RegexMatcher
+
+    Raises:
+        re.error: If a regex pattern is invalid
+    """
+    # Non-ASCII case folding needs the regex engine; bytes.lower() is ASCII only
+    literal = all(is_literal(p) for p in patterns) and not (
+        ignore_case and not all(p.isascii() for p in patterns)
+    )
+
+    if literal and len(patterns) == 1:
+        return LiteralMatcher(patterns[0], ignore_case)
+    if literal:
+        return MultiLiteralMatcher(patterns, ignore_case)
+    if len(patterns) == 1:
+        return RegexMatcher(patterns[0], ignore_case)
+    return RegexMatcher("|".join(f"(?:{p})" for p in patterns), ignore_case)
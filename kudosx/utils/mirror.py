@@ -0,0 +1,64 @@
+"""Offline mirror of the skills registry, repository archives and tag lists.
+
+``kudosx mirror pull DIR`` writes a mirror laid out as::
+
+    DIR/skills.yaml                      merged skills registry
+    DIR/archives/<owner>/<repo>/<ref>.zip
+    DIR/tags/<owner>/<repo>.json         list of tag names
+    DIR/mirror.json                      what was mirrored and when
+
+Setting ``KUDOSX_MIRROR`` to that directory (a path or ``file://`` URL) or
+to an HTTP server exposing it makes the registry, version lookups and
+skill downloads read from the mirror instead of GitHub.
+"""
+
+import os
+from pathlib import Path
+from urllib.parse import quote, urlparse
+from urllib.request import url2pathname
+
+# Registry file inside a mirror
+MIRROR_REGISTRY = "skills.yaml"
+
+# Index file describing a mirror
+MIRROR_INDEX = "mirror.json"
+
+# Bump when the mirror layout changes
+MIRROR_VERSION = 1
+
+
+def mirror_base() -> str | None:
+    """Return the configured KUDOSX_MIRROR as a URL, or None if unset.
+
+    Plain paths are turned into ``file://`` URLs.
+    """
+    value = os.environ.get("KUDOSX_MIRROR", "").strip()
+    if not value:
+        return None
+    if "://" not in value:
+        return Path(value).expanduser().resolve().as_uri()
+    return value.rstrip("/")
+
+
+def archive_path(repo: str, ref: str = "main") -> str:
+    """Relative path of a repository archive within a mirror."""
+    return f"archives/{repo}/{ref}.zip"
+
+
+def tags_path(repo: str) -> str:
+    """Relative path of a repository's tag list within a mirror."""
+    return f"tags/{repo}.json"
+
+
+def mirror_url(relative: str, base: str | None = None) -> str:
+    """URL of a file in the mirror."""
+    base = base or mirror_base()
+    return f"{base}/{quote(relative)}"
+
+
+def mirror_local_path(relative: str, base: str | None = None) -> Path | None:
+    """Local path of a file in a ``file://`` mirror (None for HTTP mirrors)."""
+    parsed = urlparse(base or mirror_base())
+    if parsed.scheme != "file":
+        return None
+    return Path(url2pathname(parsed.path)) / relative
@@ -0,0 +1,265 @@
+"""On-disk cache of the remote skills registry.
+
+The remote ``skills.yaml`` is stored after each successful fetch together
+with the time it was fetched and the response's ETag/Last-Modified, so
+later runs can use it without waiting on the network and revalidate it
+with a conditional request in the background once it is older than the
+TTL. A failed fetch is recorded too (with no skills), which keeps offline
+runs from retrying synchronously every time.
+
+YAML is parsed with libyaml's ``CSafeLoader`` when available, and parsed
+documents are kept as marshal snapshots named by the sha256 of their
+source, so an unchanged registry is never parsed twice. SkillRegistry
+wraps the loaded skills with indexes for lookups and search.
+"""
+
+import hashlib
+import json
+import marshal
+import re
+import time
+from bisect import bisect_left
+from collections.abc import Mapping
+from pathlib import Path
+
+import yaml
+
+from kudosx.utils.cache import get_cache_dir
+from kudosx.utils.fs import atomic_write_bytes
+
+try:
+    from yaml import CSafeLoader as YamlLoader
+except ImportError:
+    from yaml import SafeLoader as YamlLoader
+
+# Bump when the cache layout changes
+REGISTRY_CACHE_VERSION = 3
+
+# Seconds the cached remote registry is used before it is revalidated
+REGISTRY_TTL = 3600
+
+
+def parse_registry_yaml(source: bytes | str) -> dict:
+    """Parse a skills.yaml document (with libyaml when available).
+
+    Returns:
+        Parsed document, or an empty dict for an empty document
+    """
+    return yaml.load(source, Loader=YamlLoader) or {}
+
+
+def load_yaml_snapshot(path: Path) -> dict:
+    """Load a YAML file through a precompiled marshal snapshot.
+
+    The snapshot is named by the sha256 of the file's bytes, so it is
+    reused until the YAML changes; older snapshots of the same file are
+    removed when a new one is written.
+
+    Args:
+        path: YAML file to load
+
+    Returns:
+        Parsed document
+    """
+    source = Path(path).read_bytes()
+    digest = hashlib.sha256(source).hexdigest()
+    snapshots = get_cache_dir("registry", "snapshots")
+    snapshot = snapshots / f"{Path(path).stem}-{digest[:32]}.marshal"
+    try:
+        return marshal.loads(snapshot.read_bytes())
+    except (OSError, EOFError, ValueError, TypeError):
+        pass
+
+    data = parse_registry_yaml(source)
+    try:
+        payload = marshal.dumps(data)
+    except ValueError:
+        # Values marshal cannot store (e.g. YAML dates): skip the snapshot
+        return data
+    try:
+        for stale in snapshots.glob(f"{Path(path).stem}-*.marshal"):
+            stale.unlink(missing_ok=True)
+        atomic_write_bytes(snapshot, payload)
+    except OSError:
+        pass
+    return data
+
+
+def registry_cache_path() -> Path:
+    """Path of the cached remote registry."""
+    return get_cache_dir("registry") / "remote.json"
+
+
+def read_registry_cache() -> dict | None:
+    """Read the cached remote registry.
+
+    Returns:
+        Dict with "skills" (None if the last fetch failed) and "fetched_at",
+        or None if nothing usable is cached
+    """
+    try:
+        data = json.loads(registry_cache_path().read_text())
+    except (OSError, ValueError):
+        return None
+    if not isinstance(data, dict) or data.get("version") != REGISTRY_CACHE_VERSION:
+        return None
+    return data
+
+
+def write_registry_cache(
+    skills: dict | None,
+    etag: str | None = None,
+    last_modified: str | None = None,
+    sha256: str | None = None,
+) -> None:
+    """Persist the remote registry (or a failed fetch when skills is None).
+
+    Args:
+        skills: Remote skills dict, or None if the fetch failed
+        etag: ETag header of the response the skills came from
+        last_modified: Last-Modified header of that response
+        sha256: Hash of the YAML source the skills were parsed from
+    """
+    data = {
+        "version": REGISTRY_CACHE_VERSION,
+        "fetched_at": time.time(),
+        "skills": skills,
+        "etag": etag,
+        "last_modified": last_modified,
+        "sha256": sha256,
+    }
+    atomic_write_bytes(registry_cache_path(), json.dumps(data).encode("utf-8"))
+
+
+def format_age(seconds: float) -> str:
+    """Format an age in seconds as e.g. "just now", "5m ago" or "2d ago"."""
+    if seconds < 60:
+        return "just now"
+    for unit, size in (("d", 86400), ("h", 3600), ("m", 60)):
+        if seconds >= size:
+            return f"{int(seconds // size)}{unit} ago"
+
+
+def registry_freshness(ttl: float = REGISTRY_TTL) -> tuple[str, str | None]:
+    """Describe how current the cached remote registry is.
+
+    Only the on-disk cache is read; this never touches the network.
+
+    Args:
+        ttl: Seconds after which the cache counts as stale
+
+    Returns:
+        Tuple of (state, age) where state is "fresh", "stale", "offline"
+        (last fetch failed) or "bundled" (nothing cached yet) and age is
+        the time since the last check (e.g. "5m ago"), or None if never checked
+    """
+    cached = read_registry_cache()
+    if cached is None:
+        return "bundled", None
+    elapsed = time.time() - cached["fetched_at"]
+    age = format_age(elapsed)
+    if cached["skills"] is None:
+        return "offline", age
+    if elapsed > ttl:
+        return "stale", age
+    return "fresh", age
+
+
+REGISTRY_TOKEN_RE = re.compile(r"[a-z0-9]+")
+
+
+def registry_tokens(text: str) -> list[str]:
+    """Split registry text (names, repos, descriptions) into lowercase tokens."""
+    return REGISTRY_TOKEN_RE.findall(text.lower())
+
+
+class SkillRegistry(Mapping):
+    """Skills registry with lookup indexes.
+
+    Behaves as a read-only mapping of skill name -> config, and indexes
+    skills by repo and target_dir plus an inverted index of the tokens in
+    their names, repos and descriptions, so lookups and searches cost
+    O(matches) rather than a scan of the whole catalog.
+    """
+
+    def __init__(self, skills: dict):
+        self.skills = skills
+        self._by_repo: dict[str, list[str]] = {}
+        self._by_target: dict[str, str] = {}
+        self._postings: dict[str, set[str]] = {}
+
+        for name, config in skills.items():
+            repo = config.get("repo")
+            if repo:
+                self._by_repo.setdefault(repo, []).append(name)
+            target_dir = config.get("target_dir")
+            if target_dir:
+                self._by_target.setdefault(target_dir, name)
+            text = " ".join(str(config.get(key) or "") for key in ("repo", "description"))
+            for token in registry_tokens(f"{name} {text}"):
+                self._postings.setdefault(token, set()).add(name)
+
+        # Sorted vocabulary for prefix lookups
+        self._vocabulary = sorted(self._postings)
+
+    def __getitem__(self, name: str) -> dict:
+        return self.skills[name]
+
+    def __iter__(self):
+        return iter(self.skills)
+
+    def __len__(self) -> int:
+        return len(self.skills)
+
+    def __contains__(self, name) -> bool:
+        return name in self.skills
+
+    def find_by_repo(self, repo: str) -> list[str]:
+        """Names of the skills published from a repository."""
+        return self._by_repo.get(repo, [])
+
+    def find_by_target(self, target_dir: str) -> str | None:
+        """Name of the skill installed into a target directory."""
+        return self._by_target.get(target_dir)
+
+    def _prefix_matches(self, prefix: str) -> set[str]:
+        start = bisect_left(self._vocabulary, prefix)
+        names: set[str] = set()
+        for token in self._vocabulary[start:]:
+            if not token.startswith(prefix):
+                break
+            names |= self._postings[token]
+        return names
+
+    def search(self, query: str) -> list[str]:
+        """Find skills whose name, repo or description contains every query term.
+
+        The last term also matches as a prefix, so partially typed words
+        find results. Skills whose name contains a term are ranked first.
+
+        Args:
+            query: Free-text query
+
+        Returns:
+            Matching skill names, best first
+        """
+        terms = registry_tokens(query)
+        if not terms:
+            return []
+
+        matches: set[str] | None = None
+        for i, term in enumerate(terms):
+            if i == len(terms) - 1:
+                names = self._prefix_matches(term)
+            else:
+                names = self._postings.get(term, set())
+            matches = names if matches is None else matches & names
+            if not matches:
+                return []
+
+        def rank(name: str):
+            name_tokens = registry_tokens(name)
+            in_name = sum(any(t.startswith(term) for t in name_tokens) for term in terms)
+            return -in_name, name
+
+        return sorted(matches, key=rank)
@@ -0,0 +1,127 @@
+"""On-disk LRU cache of per-file search results.
+
+Each query (patterns, flags, extensions and search path) gets one cache
+entry holding the matches of every scanned file together with that file's
+mtime and size. A repeated query only rescans files whose fingerprint
+changed; everything else is served from the entry. Entries are evicted
+least-recently-used first once the cache grows past its size budget.
+"""
+
+import hashlib
+import json
+import marshal
+import os
+from pathlib import Path
+
+from kudosx.utils.cache import get_cache_dir
+from kudosx.utils.fs import atomic_write_bytes
+
+# Bump when the on-disk layout changes
+CACHE_VERSION = 1
+
+# Total size budget for all cached queries
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
+
+def make_key(**query) -> str:
+    """Build a stable cache key from query parameters."""
+    encoded = json.dumps(query, sort_keys=True, default=sorted)
+    return hashlib.sha1(encoded.encode("utf-8")).hexdigest()
+
+
+class SearchCache:
+    """Per-query tables of file fingerprint -> search result."""
+
+    def __init__(self, cache_dir: Path | None = None, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.cache_dir = cache_dir or get_cache_dir("search")
+        self.max_bytes = max_bytes
+
+    def _entry_path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.cache"
+
+    def load(self, key: str) -> dict:
+        """Load the file table for a query.
+
+        Returns:
+            Dict of relative path -> (mtime_ns, size, limit, result), empty if missing
+        """
+        path = self._entry_path(key)
+        try:
+            data = marshal.loads(path.read_bytes())
+        except (OSError, EOFError, ValueError, TypeError):
+            return {}
+        if not isinstance(data, dict) or data.get("version") != CACHE_VERSION:
+            return {}
+        try:
+            # Reads count as use for LRU eviction
+            os.utime(path)
+        except OSError:
+            pass
+        return data["files"]
+
+    def store(self, key: str, files: dict) -> None:
+        """Persist the file table for a query and enforce the size budget."""
+        payload = marshal.dumps({"version": CACHE_VERSION, "files": files})
+        if len(payload) > self.max_bytes:
+            return
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        atomic_write_bytes(self._entry_path(key), payload)
+        self.evict()
+
+    def evict(self) -> None:
+        """Delete least recently used entries until under the size budget."""
+        entries = []
+        for path in self.cache_dir.glob("*.cache"):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime_ns, stat.st_size, path))
+
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            try:
+                path.unlink()
+            except OSError:
+                continue
+            total -= size
+
+
+def lookup(files: dict, rel_path: str, stat: os.stat_result, limit: int | None):
+    """Return a cached result if it is still valid for a file.
+
+    Args:
+        files: Table returned by SearchCache.load
+        rel_path: File path relative to the search root
+        stat: Current stat of the file
+        limit: Result limit the caller needs
+
+    Returns:
+        Cached result, or None if the file must be rescanned
+    """
+    entry = files.get(rel_path)
+    if entry is None:
+        return None
+    mtime, size, cached_limit, result = entry
+    if mtime != stat.st_mtime_ns or size != stat.st_size:
+        return None
+    # A truncated list only serves callers that need no more than it holds
+    if is_truncated(result, cached_limit) and (limit is None or limit > cached_limit):
+        return None
+    return result
+
+
+def is_truncated(result, limit: int | None) -> bool:
+    """Check whether a scan result may have been cut off at limit.
+
+    Line results are lists of (line number, excerpt); archive results are
+    lists of (member name, member result) where each member's lines were
+    limited separately, so any full member makes the whole result partial.
+    """
+    if limit is None or not isinstance(result, list):
+        return False
+    if result and isinstance(result[0][0], str):
+        return any(is_truncated(member_result, limit) for _, member_result in result)
+    return len(result) >= limit
@@ -0,0 +1,122 @@
+"""Shared content store of extracted skills.
+
+Each skill version is extracted once into ``<cache>/store/<skill>/<version>``
+together with its manifest. Installs, global or in any number of projects,
+are materialized from there with clone_file (a copy-on-write reflink where
+the filesystem supports it, otherwise a copy; hardlinks only when
+KUDOSX_LINK_MODE=hardlink), so installing a version that is already stored
+needs no download. Stored files are made read-only, and a stored file that
+no longer hashes to its manifest entry invalidates the version. Only the
+most recently used STORE_KEEP_VERSIONS versions of a skill are kept;
+removing a version does not affect installs made from it.
+"""
+
+import os
+import re
+import shutil
+from pathlib import Path
+from typing import Callable
+
+from kudosx.utils.cache import get_cache_dir
+from kudosx.utils.fs import file_sha256, staged_directory
+from kudosx.utils.manifest import manifest_entry, read_manifest, write_manifest
+
+# Versions of each skill kept in the store
+STORE_KEEP_VERSIONS = 3
+
+_UNSAFE_CHARS_RE = re.compile(r"[^A-Za-z0-9._+-]")
+
+
+def _safe_name(name: str) -> str:
+    name = _UNSAFE_CHARS_RE.sub("_", name)
+    return "_" + name if name.startswith(".") else name
+
+
+class SkillStore:
+    """Directory of skill versions keyed by skill (target_dir) and version."""
+
+    def __init__(self, root: Path | None = None, keep: int = STORE_KEEP_VERSIONS):
+        self.root = root or get_cache_dir("store")
+        self.keep = keep
+
+    def path(self, skill: str, version: str) -> Path:
+        """Directory of a stored skill version."""
+        return self.root / _safe_name(skill) / _safe_name(version)
+
+    def lookup(self, skill: str, version: str) -> dict[str, dict] | None:
+        """Return the manifest of a stored version if it is complete and intact.
+
+        Files whose size or mtime differ from the manifest are re-hashed;
+        a version with a file that no longer matches (e.g. edited through a
+        hardlinked install) is removed and reported as missing, so it is
+        extracted again.
+
+        Returns:
+            Manifest of the stored version, or None
+        """
+        path = self.path(skill, version)
+        manifest = read_manifest(path)
+        if manifest is None:
+            return None
+        refreshed = False
+        for relative, entry in manifest.items():
+            file_path = path.joinpath(*relative.split("/"))
+            try:
+                stat = file_path.stat()
+                if stat.st_size == entry["size"] and stat.st_mtime_ns == entry["mtime_ns"]:
+                    continue
+                intact = file_sha256(file_path) == entry["sha256"]
+            except OSError:
+                intact = False
+            if not intact:
+                shutil.rmtree(path, ignore_errors=True)
+                return None
+            manifest[relative] = manifest_entry(file_path, entry["sha256"])
+            refreshed = True
+        if refreshed:
+            try:
+                write_manifest(path, manifest)
+            except OSError:
+                pass
+        try:
+            # Directory mtime records last use for pruning
+            os.utime(path)
+        except OSError:
+            pass
+        return manifest
+
+    def add(self, skill: str, version: str, fill: Callable[[Path, dict], object]) -> dict[str, dict]:
+        """Store a skill version.
+
+        Args:
+            skill: Skill key (its target_dir)
+            version: Version string
+            fill: Called with (directory, manifest) to write the skill's files
+                into directory and record each of them in manifest
+
+        Returns:
+            Manifest of the stored version
+        """
+        manifest: dict[str, dict] = {}
+        with staged_directory(self.path(skill, version)) as staging:
+            fill(staging, manifest)
+            # Read-only, so a hardlinked install cannot be edited in place
+            for relative in manifest:
+                file_path = staging.joinpath(*relative.split("/"))
+                file_path.chmod(file_path.stat().st_mode & ~0o222)
+            write_manifest(staging, manifest)
+        self.prune(skill)
+        return manifest
+
+    def prune(self, skill: str) -> None:
+        """Remove all but the most recently used versions of a skill."""
+        versions = []
+        for path in (self.root / _safe_name(skill)).iterdir():
+            if path.name.startswith("."):
+                continue
+            try:
+                versions.append((path.stat().st_mtime_ns, path))
+            except OSError:
+                continue
+        for _, path in sorted(versions, reverse=True)[self.keep:]:
+            shutil.rmtree(path, ignore_errors=True)
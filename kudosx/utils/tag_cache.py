@@ -0,0 +1,72 @@
+"""Persistent cache of repository tag lists.
+
+``git ls-remote --tags`` costs a network round trip (and up to a 10 second
+timeout) per repository, so the tags it returns are kept on disk with the
+time they were fetched. Failed lookups and repositories without tags are
+cached too, for a shorter time, so an unreachable repo is not retried on
+every refresh.
+"""
+
+import json
+import threading
+import time
+from pathlib import Path
+
+from kudosx.utils.cache import get_cache_dir
+from kudosx.utils.fs import atomic_write_bytes
+
+# Bump when the cache layout changes
+TAG_CACHE_VERSION = 1
+
+# Seconds tag lists are reused
+TAG_TTL = 3600
+
+# Seconds failed or empty lookups are reused
+NEGATIVE_TAG_TTL = 300
+
+# Serializes read-modify-write of the cache file between threads
+_cache_lock = threading.Lock()
+
+
+class TagCache:
+    """On-disk map of repo -> (tags, fetched_at)."""
+
+    def __init__(self, path: Path | None = None, ttl: float = TAG_TTL, negative_ttl: float = NEGATIVE_TAG_TTL):
+        self.path = path or get_cache_dir("tags") / "tags.json"
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+
+    def _load(self) -> dict:
+        try:
+            data = json.loads(self.path.read_text())
+        except (OSError, ValueError):
+            return {}
+        if not isinstance(data, dict) or data.get("version") != TAG_CACHE_VERSION:
+            return {}
+        return data.get("repos", {})
+
+    def get(self, repo: str) -> tuple[bool, list[str] | None]:
+        """Look up the cached tags of a repository.
+
+        Returns:
+            Tuple of (hit, tags); tags is None or empty for a cached failure
+        """
+        entry = self._load().get(repo)
+        if entry is None:
+            return False, None
+        ttl = self.ttl if entry["tags"] else self.negative_ttl
+        if time.time() - entry["fetched_at"] > ttl:
+            return False, None
+        return True, entry["tags"]
+
+    def put(self, repo: str, tags: list[str] | None) -> None:
+        """Store the tags of a repository (None when the lookup failed)."""
+        with _cache_lock:
+            repos = self._load()
+            repos[repo] = {"tags": tags, "fetched_at": time.time()}
+            payload = json.dumps({"version": TAG_CACHE_VERSION, "repos": repos}, sort_keys=True)
+            try:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                atomic_write_bytes(self.path, payload.encode("utf-8"))
+            except OSError:
+                pass
@@ -0,0 +1,372 @@
+"""Incremental full-text index over Claude Code session transcripts.
+
+Each user/assistant message becomes a document made of its text, the
+names of the tools it called and the file paths those tools touched.
+Tool results are not indexed: they mostly repeat file contents and would
+dominate the index. Every transcript has a byte-offset checkpoint, so an
+update only parses lines appended since the previous one; a hash of the
+indexed part's first and last block detects transcripts that were
+rewritten rather than appended to. Documents keep the byte offset of
+their line instead of a copy of the text, and result snippets are read
+back from the transcript.
+"""
+
+import hashlib
+import json
+import marshal
+import math
+import re
+from array import array
+from collections import Counter, defaultdict
+from pathlib import Path
+
+from kudosx.utils.cache import get_cache_dir
+from kudosx.utils.claude_usage import iter_session_files, read_session_entries
+from kudosx.utils.fs import atomic_write_bytes
+
+# Bump when the on-disk layout changes
+INDEX_VERSION = 2
+
+# Characters of message text used for result snippets
+SNIPPET_SOURCE_CHARS = 2000
+
+# Bytes hashed at each end of a transcript's indexed part
+FINGERPRINT_BYTES = 4096
+
+# Tool input keys that hold file paths
+PATH_KEYS = ("file_path", "path", "notebook_path")
+
+# BM25 parameters
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+TOKEN_RE = re.compile(r"[a-z0-9_]+")
+
+
+def tokenize(text: str) -> list[str]:
+    """Split text into lowercase word tokens."""
+    return TOKEN_RE.findall(text.lower())
+
+
+def extract_document(data: dict) -> tuple[str, list[str], list[str]] | None:
+    """Extract indexable fields from a transcript entry.
+
+    Args:
+        data: Parsed JSONL entry
+
+    Returns:
+        Tuple of (text, tool names, file paths), or None if nothing to index
+    """
+    if data.get("type") == "summary":
+        summary = data.get("summary")
+        return (summary, [], []) if isinstance(summary, str) and summary else None
+
+    msg = data.get("message")
+    if not isinstance(msg, dict) or data.get("type") not in ("user", "assistant"):
+        return None
+
+    content = msg.get("content")
+    texts, tools, paths = [], [], []
+    if isinstance(content, str):
+        texts.append(content)
+    elif isinstance(content, list):
+        for block in content:
+            if not isinstance(block, dict):
+                continue
+            if block.get("type") == "text" and isinstance(block.get("text"), str):
+                texts.append(block["text"])
+            elif block.get("type") == "tool_use":
+                if isinstance(block.get("name"), str):
+                    tools.append(block["name"])
+                tool_input = block.get("input")
+                if isinstance(tool_input, dict):
+                    paths.extend(
+                        tool_input[key] for key in PATH_KEYS
+                        if isinstance(tool_input.get(key), str)
+                    )
+
+    text = "\n".join(t for t in texts if t)
+    if not (text or tools or paths):
+        return None
+    return text, tools, paths
+
+
+def snippet_source(text: str, tools: list[str], paths: list[str]) -> str:
+    """Text of a document that result snippets are cut from."""
+    return " | ".join(filter(None, [text[:SNIPPET_SOURCE_CHARS], *tools, *paths]))
+
+
+def fingerprint(path: Path, end: int) -> str:
+    """Hash the first and last FINGERPRINT_BYTES of a file's first end bytes.
+
+    An append leaves this unchanged; a transcript rewritten to the same or
+    a larger size almost never does.
+    """
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        digest.update(f.read(min(end, FINGERPRINT_BYTES)))
+        if end > FINGERPRINT_BYTES:
+            f.seek(max(FINGERPRINT_BYTES, end - FINGERPRINT_BYTES))
+            digest.update(f.read(end - f.tell()))
+    return digest.hexdigest()
+
+
+class TranscriptIndex:
+    """Inverted index of session transcript messages.
+
+    Documents are stored column-wise (session, byte offset, timestamp,
+    length) and postings as packed ``array("I")`` pairs of (doc id, term
+    frequency), which keeps loading the index close to a single read.
+    """
+
+    def __init__(self, projects_dir: Path | None = None, cache_dir: Path | None = None):
+        self.projects_dir = projects_dir or Path.home() / ".claude" / "projects"
+        self.index_path = (cache_dir or get_cache_dir("transcripts")) / "index.marshal"
+        self._reset()
+
+    def _reset(self) -> None:
+        self.sessions: list[str] = []
+        # Path -> (size, mtime_ns, indexed offset, fingerprint of the indexed part)
+        self.checkpoints: dict[str, tuple[int, int, int, str]] = {}
+        self.doc_session = array("I")
+        self.doc_offset = array("Q")
+        self.doc_length = array("I")
+        self.doc_time: list[str] = []
+        self.deleted: set[int] = set()
+        self.postings: dict[str, array | bytes] = {}
+
+    def load(self) -> bool:
+        """Load the index from disk.
+
+        Returns:
+            True if a compatible index was loaded
+        """
+        try:
+            data = marshal.loads(self.index_path.read_bytes())
+        except (OSError, EOFError, ValueError, TypeError):
+            return False
+        if not isinstance(data, dict) or data.get("version") != INDEX_VERSION:
+            return False
+        if data.get("projects_dir") != str(self.projects_dir):
+            return False
+
+        self.sessions = data["sessions"]
+        self.checkpoints = data["checkpoints"]
+        self.doc_session = array("I", data["doc_session"])
+        self.doc_offset = array("Q", data["doc_offset"])
+        self.doc_length = array("I", data["doc_length"])
+        self.doc_time = data["doc_time"]
+        self.deleted = set(data["deleted"])
+        # Postings stay packed until a query or update touches them
+        self.postings = data["postings"]
+        return True
+
+    def save(self) -> None:
+        """Persist the index to disk atomically."""
+        data = {
+            "version": INDEX_VERSION,
+            "projects_dir": str(self.projects_dir),
+            "sessions": self.sessions,
+            "checkpoints": self.checkpoints,
+            "doc_session": self.doc_session.tobytes(),
+            "doc_offset": self.doc_offset.tobytes(),
+            "doc_length": self.doc_length.tobytes(),
+            "doc_time": self.doc_time,
+            "deleted": list(self.deleted),
+            "postings": {
+                token: p.tobytes() if isinstance(p, array) else p
+                for token, p in self.postings.items()
+            },
+        }
+        self.index_path.parent.mkdir(parents=True, exist_ok=True)
+        atomic_write_bytes(self.index_path, marshal.dumps(data))
+
+    def _posting(self, token: str) -> array | None:
+        posting = self.postings.get(token)
+        if isinstance(posting, bytes):
+            posting = array("I", posting)
+            self.postings[token] = posting
+        return posting
+
+    def _drop_session(self, session_idx: int) -> None:
+        for doc_id, owner in enumerate(self.doc_session):
+            if owner == session_idx:
+                self.deleted.add(doc_id)
+
+    def _add_document(self, session_idx: int, offset: int, timestamp: str, text: str, tools, paths) -> None:
+        tokens = tokenize(text)
+        for name in tools:
+            tokens.extend(tokenize(name))
+        for path in paths:
+            tokens.extend(tokenize(path))
+        if not tokens:
+            return
+
+        doc_id = len(self.doc_session)
+        self.doc_session.append(session_idx)
+        self.doc_offset.append(offset)
+        self.doc_length.append(len(tokens))
+        self.doc_time.append(timestamp)
+
+        for token, tf in Counter(tokens).items():
+            posting = self._posting(token)
+            if posting is None:
+                posting = self.postings[token] = array("I")
+            posting.append(doc_id)
+            posting.append(tf)
+
+    def update(self) -> int:
+        """Index lines appended to transcripts since the last update.
+
+        Returns:
+            Number of transcript files that were (re)read
+        """
+        session_ids = {name: i for i, name in enumerate(self.sessions)}
+        seen = set()
+        touched = 0
+
+        for session_file in iter_session_files(self.projects_dir):
+            key = str(session_file)
+            seen.add(key)
+            try:
+                stat = session_file.stat()
+            except OSError:
+                continue
+
+            checkpoint = self.checkpoints.get(key)
+            if checkpoint and checkpoint[:2] == (stat.st_size, stat.st_mtime_ns):
+                continue
+
+            if key not in session_ids:
+                session_ids[key] = len(self.sessions)
+                self.sessions.append(key)
+            session_idx = session_ids[key]
+
+            offset = checkpoint[2] if checkpoint else 0
+            try:
+                if offset and (stat.st_size < offset or fingerprint(session_file, offset) != checkpoint[3]):
+                    # Rewritten or truncated: re-index from the start
+                    self._drop_session(session_idx)
+                    offset = 0
+
+                start = offset
+                for offset, data in read_session_entries(session_file, offset):
+                    doc = extract_document(data)
+                    if doc is not None:
+                        timestamp = data.get("timestamp")
+                        self._add_document(
+                            session_idx, start, timestamp if isinstance(timestamp, str) else "", *doc
+                        )
+                    start = offset
+                checkpoint = (stat.st_size, stat.st_mtime_ns, offset, fingerprint(session_file, offset))
+            except OSError:
+                continue
+            self.checkpoints[key] = checkpoint
+            touched += 1
+
+        for key in set(self.checkpoints) - seen:
+            del self.checkpoints[key]
+            self._drop_session(session_ids[key])
+            touched += 1
+
+        if self.deleted and len(self.deleted) * 2 > len(self.doc_session):
+            # Mostly tombstones: rebuilding is cheaper than carrying them
+            self._reset()
+            return self.update()
+        return touched
+
+    def ensure(self) -> None:
+        """Load the index, bring it up to date and persist any changes."""
+        if not self.load():
+            self._reset()
+        if self.update():
+            self.save()
+
+    def _snippet_source(self, doc_id: int) -> str:
+        """Read a document's message back from its transcript."""
+        try:
+            with open(self.sessions[self.doc_session[doc_id]], "rb") as f:
+                f.seek(self.doc_offset[doc_id])
+                data = json.loads(f.readline())
+        except (OSError, ValueError):
+            return ""
+        doc = extract_document(data) if isinstance(data, dict) else None
+        return snippet_source(*doc) if doc else ""
+
+    def _snippet(self, text: str, terms: list[str], width: int = 160) -> str:
+        lower = text.lower()
+        hits = [i for i in (lower.find(t) for t in terms) if i != -1]
+        start = max(0, min(hits) - width // 4) if hits else 0
+        snippet = " ".join(text[start:start + width].split())
+        return ("…" if start else "") + snippet
+
+    def search(self, query: str, limit: int = 20) -> list[dict]:
+        """Rank sessions by their best matching message.
+
+        All query terms must occur in a message for it to match; messages
+        are scored with BM25 and each session is represented by its
+        highest scoring message.
+
+        Args:
+            query: Free-text query
+            limit: Maximum number of sessions to return
+
+        Returns:
+            List of dicts with session, project, timestamp, snippet, hits and score
+        """
+        terms = list(dict.fromkeys(tokenize(query)))
+        if not terms:
+            return []
+
+        postings = []
+        for term in terms:
+            posting = self._posting(term)
+            if posting is None:
+                return []
+            postings.append((term, posting))
+        # Intersect starting from the rarest term
+        postings.sort(key=lambda item: len(item[1]))
+
+        total_docs = len(self.doc_session) - len(self.deleted) or 1
+        avg_length = (sum(self.doc_length) / len(self.doc_length)) if self.doc_length else 1.0
+
+        scores: dict[int, float] | None = None
+        for _, posting in postings:
+            doc_freq = len(posting) // 2
+            idf = math.log(1 + (total_docs - doc_freq + 0.5) / (doc_freq + 0.5))
+            term_scores = {}
+            for i in range(0, len(posting), 2):
+                doc_id = posting[i]
+                if doc_id in self.deleted or (scores is not None and doc_id not in scores):
+                    continue
+                tf = posting[i + 1]
+                norm = BM25_K1 * (1 - BM25_B + BM25_B * self.doc_length[doc_id] / avg_length)
+                term_scores[doc_id] = idf * tf * (BM25_K1 + 1) / (tf + norm)
+            if scores is None:
+                scores = term_scores
+            else:
+                scores = {d: scores[d] + s for d, s in term_scores.items()}
+            if not scores:
+                return []
+
+        best: dict[int, tuple[float, int]] = {}
+        hits: defaultdict[int, int] = defaultdict(int)
+        for doc_id, score in scores.items():
+            session_idx = self.doc_session[doc_id]
+            hits[session_idx] += 1
+            if session_idx not in best or score > best[session_idx][0]:
+                best[session_idx] = (score, doc_id)
+
+        ranked = sorted(best.items(), key=lambda item: item[1][0], reverse=True)[:limit]
+        results = []
+        for session_idx, (score, doc_id) in ranked:
+            session_path = Path(self.sessions[session_idx])
+            results.append({
+                "session": session_path.stem,
+                "project": session_path.parent.name,
+                "timestamp": self.doc_time[doc_id],
+                "snippet": self._snippet(self._snippet_source(doc_id), terms),
+                "hits": hits[session_idx],
+                "score": score,
+            })
+        return results
@@ -0,0 +1,20 @@
+"""Shared pytest fixtures."""
+
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def isolated_cache_dir(tmp_path_factory, monkeypatch):
+    """Keep indexes and caches written by tests out of the user's cache."""
+    monkeypatch.setenv("KUDOSX_CACHE_DIR", str(tmp_path_factory.mktemp("kudosx-cache")))
+
+
+@pytest.fixture(autouse=True)
+def bundled_skills_registry():
+    """Serve the bundled registry so tests never fetch the remote one."""
+    from kudosx.commands import add
+
+    saved = add._skills_cache
+    add._skills_cache = add.load_skills_from_local()
+    yield
+    add._skills_cache = saved
@@ -0,0 +1,209 @@
+"""Tests for the skill archive download cache."""
+
+import hashlib
+import io
+import os
+import time
+from unittest.mock import patch
+from urllib.error import HTTPError, URLError
+
+import click
+import pytest
+
+from kudosx.commands.add import ARCHIVE_FRESH_SECONDS, fetch_skill_archive
+from kudosx.utils.archive_cache import EVICT_GRACE_SECONDS, ArchiveCache
+
+
+class FakeResponse(io.BytesIO):
+    """Minimal stand-in for an HTTP response."""
+
+    def __init__(self, data: bytes, etag: str | None = None):
+        super().__init__(data)
+        self.headers = {"ETag": etag} if etag else {}
+
+
+def _store(cache, repo, data, etag=None, ref="main"):
+    download = cache.temp_file()
+    download.write_bytes(data)
+    return cache.store(repo, ref, download, hashlib.sha256(data).hexdigest(), etag)
+
+
+def _age(cache, repo, seconds, ref="main"):
+    entries = cache._load_index()
+    entries[cache.key(repo, ref)]["checked_at"] -= seconds
+    cache._save_index(entries)
+
+
+class TestArchiveCache:
+    """Tests for ArchiveCache."""
+
+    def test_store_and_lookup(self, tmp_path):
+        """Test a stored archive is found under its content hash."""
+        cache = ArchiveCache(tmp_path)
+        path = _store(cache, "owner/repo", b"zip bytes", etag='"abc"')
+
+        entry = cache.lookup("owner/repo", "main")
+
+        assert entry["path"] == path
+        assert path.name == hashlib.sha256(b"zip bytes").hexdigest() + ".zip"
+        assert entry["etag"] == '"abc"'
+        assert cache.lookup("owner/repo", "dev") is None
+
+    def test_identical_archives_share_a_blob(self, tmp_path):
+        """Test two refs with the same content are stored once."""
+        cache = ArchiveCache(tmp_path)
+        first = _store(cache, "owner/repo", b"same", ref="main")
+        second = _store(cache, "owner/repo", b"same", ref="v1")
+
+        assert first == second
+        assert len(list(tmp_path.glob("*.zip"))) == 1
+
+    def test_corrupted_blob_is_dropped(self, tmp_path):
+        """Test an archive whose hash no longer matches is not used."""
+        cache = ArchiveCache(tmp_path)
+        path = _store(cache, "owner/repo", b"original")
+        path.write_bytes(b"tampered")
+
+        assert cache.lookup("owner/repo", "main") is None
+        assert cache._load_index() == {}
+
+    def test_lookup_hashes_outside_index_lock(self, tmp_path):
+        """Test validating a blob does not hold the lock other installs need."""
+        from kudosx.utils import archive_cache
+
+        cache = ArchiveCache(tmp_path)
+        _store(cache, "owner/repo", b"zip bytes")
+        locked = []
+
+        def sha256(path):
+            locked.append(archive_cache._index_lock.locked())
+            return hashlib.sha256(path.read_bytes()).hexdigest()
+
+        with patch("kudosx.utils.archive_cache.file_sha256", side_effect=sha256):
+            assert cache.lookup("owner/repo", "main") is not None
+
+        assert locked == [False]
+
+    def test_corrupted_blob_keeps_entry_restored_meanwhile(self, tmp_path):
+        """Test a corrupt lookup does not drop an entry re-stored while it was hashing."""
+        cache = ArchiveCache(tmp_path)
+        path = _store(cache, "owner/repo", b"original")
+        path.write_bytes(b"tampered")
+
+        def sha256(path):
+            _store(cache, "owner/repo", b"fresh")
+            return "mismatch"
+
+        with patch("kudosx.utils.archive_cache.file_sha256", side_effect=sha256):
+            assert cache.lookup("owner/repo", "main") is None
+
+        assert cache.lookup("owner/repo", "main")["sha256"] == hashlib.sha256(b"fresh").hexdigest()
+
+    def test_evicts_least_recently_used(self, tmp_path):
+        """Test the oldest archives are evicted once over budget."""
+        cache = ArchiveCache(tmp_path, max_bytes=25)
+        old = _store(cache, "owner/old", b"a" * 10)
+        aged = time.time() - EVICT_GRACE_SECONDS - 100
+        os.utime(old, (aged, aged))
+        _store(cache, "owner/mid", b"b" * 10)
+
+        _store(cache, "owner/new", b"c" * 10)
+
+        assert not old.exists()
+        assert cache.lookup("owner/old", "main") is None
+        assert cache.lookup("owner/mid", "main") is not None
+        assert cache.lookup("owner/new", "main") is not None
+
+    def test_recently_used_archives_survive_eviction(self, tmp_path):
+        """Test archives another process may still be reading are not evicted."""
+        cache = ArchiveCache(tmp_path, max_bytes=15)
+        first = _store(cache, "owner/first", b"a" * 10)
+
+        _store(cache, "owner/second", b"b" * 10)
+
+        assert first.exists()
+        assert cache.lookup("owner/first", "main") is not None
+
+    def test_size_limit_from_environment(self, tmp_path, monkeypatch):
+        """Test KUDOSX_ARCHIVE_CACHE_MB sets the budget."""
+        monkeypatch.setenv("KUDOSX_ARCHIVE_CACHE_MB", "3")
+
+        assert ArchiveCache(tmp_path).max_bytes == 3 * 1024 * 1024
+
+
+class TestFetchSkillArchive:
+    """Tests for fetch_skill_archive."""
+
+    @patch("kudosx.commands.add.urlopen")
+    def test_downloads_once_then_serves_from_disk(self, mock_urlopen):
+        """Test a second fetch within the freshness window skips the network."""
+        mock_urlopen.return_value = FakeResponse(b"archive", etag='"v1"')
+
+        first = fetch_skill_archive("owner/repo")
+        second = fetch_skill_archive("owner/repo")
+
+        assert first == second
+        assert first.read_bytes() == b"archive"
+        assert mock_urlopen.call_count == 1
+
+    @patch("kudosx.commands.add.urlopen")
+    def test_mirror_and_github_copies_are_cached_separately(self, mock_urlopen, monkeypatch):
+        """Test an archive cached from a mirror is not served once the mirror is unset."""
+        monkeypatch.setenv("KUDOSX_MIRROR", "https://mirror.example")
+        mock_urlopen.return_value = FakeResponse(b"from mirror")
+        mirrored = fetch_skill_archive("owner/repo")
+
+        monkeypatch.delenv("KUDOSX_MIRROR")
+        mock_urlopen.return_value = FakeResponse(b"from github")
+        direct = fetch_skill_archive("owner/repo")
+
+        assert mirrored.read_bytes() == b"from mirror"
+        assert direct.read_bytes() == b"from github"
+        assert mock_urlopen.call_count == 2
+        assert mock_urlopen.call_args[0][0].full_url.startswith("https://github.com/")
+
+    @patch("kudosx.commands.add.urlopen")
+    def test_revalidates_with_etag(self, mock_urlopen):
+        """Test a stale entry sends If-None-Match and is reused on 304."""
+        mock_urlopen.return_value = FakeResponse(b"archive", etag='"v1"')
+        path = fetch_skill_archive("owner/repo")
+        _age(ArchiveCache(), "owner/repo", ARCHIVE_FRESH_SECONDS + 1)
+
+        mock_urlopen.side_effect = HTTPError("url", 304, "Not Modified", {}, None)
+        assert fetch_skill_archive("owner/repo") == path
+
+        request = mock_urlopen.call_args[0][0]
+        assert request.get_header("If-none-match") == '"v1"'
+
+    @patch("kudosx.commands.add.urlopen")
+    def test_changed_archive_is_replaced(self, mock_urlopen):
+        """Test a new archive is stored when the ETag changed."""
+        mock_urlopen.return_value = FakeResponse(b"old", etag='"v1"')
+        fetch_skill_archive("owner/repo")
+        _age(ArchiveCache(), "owner/repo", ARCHIVE_FRESH_SECONDS + 1)
+
+        mock_urlopen.return_value = FakeResponse(b"new", etag='"v2"')
+        path = fetch_skill_archive("owner/repo")
+
+        assert path.read_bytes() == b"new"
+        assert ArchiveCache().lookup("owner/repo", "main")["etag"] == '"v2"'
+
+    @patch("kudosx.commands.add.urlopen")
+    def test_offline_uses_cached_copy(self, mock_urlopen):
+        """Test a network failure falls back to the cached archive."""
+        mock_urlopen.return_value = FakeResponse(b"archive")
+        path = fetch_skill_archive("owner/repo")
+        _age(ArchiveCache(), "owner/repo", ARCHIVE_FRESH_SECONDS + 1)
+
+        mock_urlopen.side_effect = URLError("offline")
+
+        assert fetch_skill_archive("owner/repo") == path
+
+    @patch("kudosx.commands.add.urlopen")
+    def test_failure_without_cache_raises(self, mock_urlopen):
+        """Test a failed download with nothing cached is an error."""
+        mock_urlopen.side_effect = HTTPError("url", 404, "Not Found", {}, None)
+
+        with pytest.raises(click.ClickException, match="HTTP 404"):
+            fetch_skill_archive("owner/missing")
+        assert list(ArchiveCache().cache_dir.glob(".download-*")) == []
@@ -1,11 +1,17 @@
 """Tests for Kudosx CLI."""
 
+import json
+import os
+import threading
+import zipfile
 from unittest.mock import MagicMock, patch
 
+import yaml
 from click.testing import CliRunner
 
 from kudosx.cli import cli
 from kudosx import __version__
+from kudosx.utils.fs import atomic_write_bytes
 
 
 def test_cli_version():
@@ -174,6 +180,121 @@ class TestSoftwareCommand:
         assert "Template not found" in result.output
 
 
+def _skills_archive(path):
+    """Build a repository zip holding every registry skill's folder."""
+    from kudosx.commands.add import SKILLS
+
+    with zipfile.ZipFile(path, "w") as zf:
+        for config in SKILLS.values():
+            zf.writestr(f"repo-main/{config['source_path']}/SKILL.md", config["target_dir"])
+    return path
+
+
+class TestAddCommand:
+    """Tests for the add command."""
+
+    def test_add_requires_name_or_all(self):
+        """Test add without names or --all is an error."""
+        runner = CliRunner()
+        result = runner.invoke(cli, ["add"])
+        assert result.exit_code == 1
+        assert "Specify skill names or use --all" in result.output
+
+    def test_add_unknown_skills(self):
+        """Test every unknown name is reported."""
+        runner = CliRunner()
+        result = runner.invoke(cli, ["add", "browser-use", "nope", "nada"])
+        assert result.exit_code == 1
+        assert "Unknown skills: nope, nada" in result.output
+
+    @patch("kudosx.commands.add.get_latest_version", return_value="1.0.0")
+    @patch("kudosx.commands.add.fetch_skill_archive")
+    def test_add_multiple_skills(self, mock_fetch, mock_version, tmp_path, monkeypatch):
+        """Test several skills are fetched once each and installed."""
+        monkeypatch.chdir(tmp_path)
+        mock_fetch.return_value = _skills_archive(tmp_path / "repo.zip")
+
+        runner = CliRunner()
+        result = runner.invoke(cli, ["add", "browser-use", "cloud-aws", "--local"])
+
+        assert result.exit_code == 0, result.output
+        assert "Installing 2 skills (project)" in result.output
+        assert "[2/2] Successfully installed" in result.output
+        assert mock_fetch.call_count == 2
+        skills_dir = tmp_path / ".claude" / "skills"
+        assert (skills_dir / "browser-use" / "VERSION").read_text() == "1.0.0\n"
+        assert (skills_dir / "cloud-aws" / "SKILL.md").exists()
+
+    @patch("kudosx.commands.add.get_latest_version", return_value=None)
+    @patch("kudosx.commands.add.fetch_skill_archive")
+    def test_add_all_reports_failures(self, mock_fetch, mock_version, tmp_path, monkeypatch):
+        """Test one failed download does not stop the others and is summarized."""
+        import click
+        from kudosx.commands.add import SKILLS
+
+        monkeypatch.chdir(tmp_path)
+        archive = _skills_archive(tmp_path / "repo.zip")
+
+        def fetch(repo, progress=None):
+            if repo == SKILLS["cloud-aws"]["repo"]:
+                raise click.ClickException("Failed to download: HTTP 404 - Not Found")
+            return archive
+
+        mock_fetch.side_effect = fetch
+
+        runner = CliRunner()
+        result = runner.invoke(cli, ["add", "--all", "--local", "-j", "2"])
+
+        assert result.exit_code == 1
+        assert f"Failed to install 1 of {len(SKILLS)} skills:" in result.output
+        assert "cloud-aws: Failed to download: HTTP 404" in result.output
+        skills_dir = tmp_path / ".claude" / "skills"
+        assert (skills_dir / "browser-use" / "SKILL.md").exists()
+        assert not (skills_dir / "cloud-aws").exists()
+
+    def test_add_already_installed(self, tmp_path, monkeypatch):
+        """Test installed skills are skipped without --force."""
+        monkeypatch.chdir(tmp_path)
+        (tmp_path / ".claude" / "skills" / "browser-use").mkdir(parents=True)
+
+        runner = CliRunner()
+        result = runner.invoke(cli, ["add", "browser-use", "--local"])
+
+        assert result.exit_code == 1
+        assert "Skill already installed" in result.output
+        assert "Use --force to reinstall" in result.output
+
+
+class TestRegistryCommand:
+    """Tests for the registry command."""
+
+    def test_registry_search(self):
+        """Test matching skills are listed with their latest version."""
+        runner = CliRunner()
+        result = runner.invoke(cli, ["registry", "search", "aws"])
+
+        assert result.exit_code == 0
+        assert "cloud-aws" in result.output
+        assert "browser-use" not in result.output
+        assert "Found 1 skill(s)" in result.output
+
+    def test_registry_search_no_match(self):
+        """Test a query without matches says so."""
+        runner = CliRunner()
+        result = runner.invoke(cli, ["registry", "search", "zzzz"])
+
+        assert result.exit_code == 0
+        assert "No skills found matching 'zzzz'" in result.output
+
+    def test_get_latest_version_uses_repo_index(self):
+        """Test the registry's latest field is found by repository."""
+        from kudosx.commands.add import SKILLS, get_latest_version
+
+        config = SKILLS["browser-use"]
+
+        assert get_latest_version(config["repo"]) == str(config["latest"])
+
+
 class TestUpdateCommand:
     """Tests for the update command."""
 
@@ -200,6 +321,27 @@ class TestUpdateCommand:
         assert result.exit_code == 1
         assert "Unknown skill" in result.output
 
+    def test_get_installed_skills_maps_directories_through_registry(self, tmp_path, monkeypatch):
+        """Test installed skills are found from the skills directory entries."""
+        from kudosx.commands import add
+        from kudosx.commands.update import get_installed_skills
+
+        monkeypatch.chdir(tmp_path)
+        skills_dir = tmp_path / ".claude" / "skills"
+        (skills_dir / "scraper").mkdir(parents=True)
+        (skills_dir / "scraper" / "VERSION").write_text("1.0.0\n")
+        (skills_dir / "my-own-skill").mkdir()
+        monkeypatch.setattr(add, "_skills_cache", {
+            "web-scraper": {"repo": "acme/scrapers", "target_dir": "scraper"},
+            "other": {"repo": "acme/other", "target_dir": "other"},
+        })
+
+        installed = get_installed_skills(local=True)
+
+        assert [(s["name"], s["path"], s["version"]) for s in installed] == [
+            ("web-scraper", skills_dir / "scraper", "1.0.0"),
+        ]
+
     @patch("kudosx.commands.update.get_installed_skills")
     def test_update_all_no_skills(self, mock_get_installed):
         """Test update --all when no skills installed."""
@@ -264,6 +406,91 @@ class TestUpdateCommand:
 
         assert "up-to-date" in result.output
 
+    @patch("kudosx.commands.update.resolve_latest_versions")
+    @patch("kudosx.commands.update.fetch_skill_archive")
+    def test_update_all_plans_and_applies_both_locations(
+        self, mock_fetch, mock_resolve, tmp_path, monkeypatch
+    ):
+        """Test global and project skills are planned in one table and updated together."""
+        from kudosx.commands.add import SKILLS
+
+        home = tmp_path / "home"
+        project = tmp_path / "project"
+        project.mkdir()
+        monkeypatch.setenv("HOME", str(home))
+        monkeypatch.chdir(project)
+
+        config = SKILLS["browser-use"]
+        for base in (home, project):
+            skill_path = base / ".claude" / "skills" / config["target_dir"]
+            skill_path.mkdir(parents=True)
+            (skill_path / "VERSION").write_text("0.0.1\n")
+        mock_resolve.return_value = {config["repo"]: "9.0.0"}
+        mock_fetch.return_value = _skills_archive(tmp_path / "repo.zip")
+
+        runner = CliRunner()
+        result = runner.invoke(cli, ["update", "--all", "-j", "2"])
+
+        assert result.exit_code == 0, result.output
+        assert "SKILL" in result.output and "LATEST" in result.output
+        assert "browser-use (global)" in result.output
+        assert "browser-use (project)" in result.output
+        assert "Updated 2 skill(s)" in result.output
+        # One download serves both locations
+        assert mock_fetch.call_count == 1
+        for base in (home, project):
+            version_file = base / ".claude" / "skills" / config["target_dir"] / "VERSION"
+            assert version_file.read_text() == "9.0.0\n"
+
+    @patch("kudosx.commands.update.resolve_latest_versions")
+    @patch("kudosx.commands.update.fetch_skill_archive")
+    def test_update_all_nothing_to_apply(self, mock_fetch, mock_resolve, tmp_path, monkeypatch):
+        """Test an up-to-date plan downloads nothing."""
+        from kudosx.commands.add import SKILLS
+
+        monkeypatch.chdir(tmp_path)
+        config = SKILLS["browser-use"]
+        skill_path = tmp_path / ".claude" / "skills" / config["target_dir"]
+        skill_path.mkdir(parents=True)
+        (skill_path / "VERSION").write_text("1.0.0\n")
+        mock_resolve.return_value = {config["repo"]: "1.0.0"}
+
+        runner = CliRunner()
+        result = runner.invoke(cli, ["update", "--all", "--local"])
+
+        assert result.exit_code == 0, result.output
+        assert "up-to-date" in result.output
+        assert "All skills are up-to-date" in result.output
+        mock_fetch.assert_not_called()
+
+
+class TestMirrorCommand:
+    """Tests for the mirror command."""
+
+    @patch("kudosx.commands.mirror.load_skills_from_remote", return_value=None)
+    @patch("kudosx.commands.mirror.fetch_tags_from_git", return_value=["v0.1.0"])
+    @patch("kudosx.commands.mirror.fetch_skill_archive")
+    def test_mirror_pull(self, mock_fetch, mock_tags, mock_remote, tmp_path):
+        """Test the registry, every archive and tag list and an index are written."""
+        from kudosx.commands.add import SKILLS
+
+        mock_fetch.return_value = _skills_archive(tmp_path / "repo.zip")
+        directory = tmp_path / "mirror"
+
+        runner = CliRunner()
+        result = runner.invoke(cli, ["mirror", "pull", str(directory)])
+
+        assert result.exit_code == 0, result.output
+        assert "mirroring the bundled registry" in result.output
+        registry = yaml.safe_load((directory / "skills.yaml").read_text())
+        assert set(registry["skills"]) == set(SKILLS)
+        repos = {config["repo"] for config in SKILLS.values()}
+        index = json.loads((directory / "mirror.json").read_text())
+        assert set(index["repos"]) == repos
+        for repo in repos:
+            assert zipfile.is_zipfile(directory / "archives" / repo / "main.zip")
+            assert json.loads((directory / "tags" / f"{repo}.json").read_text()) == ["v0.1.0"]
+
 
 class TestRepoCommand:
     """Tests for the repo command."""
@@ -283,7 +510,7 @@ class TestRepoCommand:
         assert result.exit_code == 0
         assert "Sync skill versions" in result.output
 
-    @patch("kudosx.commands.repo.fetch_latest_version_from_git")
+    @patch("kudosx.commands.repo.fetch_tags")
     @patch("kudosx.commands.repo.load_skills_from_local")
     def test_repo_sync_no_changes(self, mock_load_skills, mock_fetch_version):
         """Test repo sync when versions are unchanged."""
@@ -293,7 +520,7 @@ class TestRepoCommand:
                 "latest": "0.1.0",
             }
         }
-        mock_fetch_version.return_value = "0.1.0"
+        mock_fetch_version.return_value = ["v0.1.0"]
 
         runner = CliRunner()
         result = runner.invoke(cli, ["repo", "sync"])
@@ -302,10 +529,9 @@ class TestRepoCommand:
         assert "unchanged" in result.output
         assert "No changes to sync" in result.output
 
-    @patch("kudosx.commands.repo.SKILLS_YAML")
-    @patch("kudosx.commands.repo.fetch_latest_version_from_git")
+    @patch("kudosx.commands.repo.fetch_tags")
     @patch("kudosx.commands.repo.load_skills_from_local")
-    def test_repo_sync_with_updates(self, mock_load_skills, mock_fetch_version, mock_yaml_path):
+    def test_repo_sync_with_updates(self, mock_load_skills, mock_fetch_version, tmp_path):
         """Test repo sync when new versions are available."""
         mock_load_skills.return_value = {
             "skill-test": {
@@ -313,19 +539,86 @@ class TestRepoCommand:
                 "latest": "0.1.0",
             }
         }
-        mock_fetch_version.return_value = "0.2.0"
+        mock_fetch_version.return_value = ["v0.1.0", "v0.2.0"]
+        skills_yaml = tmp_path / "skills.yaml"
+
+        runner = CliRunner()
+        with patch("kudosx.commands.repo.SKILLS_YAML", skills_yaml):
+            result = runner.invoke(cli, ["repo", "sync"])
 
-        # Mock file writing
-        import tempfile
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False) as f:
-            mock_yaml_path.__str__ = lambda self: f.name
-            mock_yaml_path.open = lambda mode: open(f.name, mode)
+        assert result.exit_code == 0
+        assert "0.1.0 → 0.2.0" in result.output
+        data = yaml.safe_load(skills_yaml.read_text())
+        assert data["skills"]["skill-test"]["latest"] == "0.2.0"
+
+    @patch("kudosx.commands.repo.fetch_tags")
+    @patch("kudosx.commands.repo.load_skills_from_local")
+    def test_repo_sync_fetches_concurrently(self, mock_load_skills, mock_fetch_version, tmp_path):
+        """Test repos are queried in parallel and written once in registry order."""
+        names = ["skill-a", "skill-b", "skill-c"]
+        mock_load_skills.return_value = {
+            name: {"repo": f"kudosx/{name}", "latest": "0.1.0"} for name in names
+        }
+        barrier = threading.Barrier(len(names), timeout=5)
+
+        def fetch(repo, use_cache=True, timeout=10):
+            # Only returns if every repo is being fetched at the same time
+            barrier.wait()
+            return ["v0.2.0"]
+
+        mock_fetch_version.side_effect = fetch
+        skills_yaml = tmp_path / "skills.yaml"
 
         runner = CliRunner()
-        result = runner.invoke(cli, ["repo", "sync"])
+        with patch("kudosx.commands.repo.SKILLS_YAML", skills_yaml), \
+                patch("kudosx.commands.repo.atomic_write_bytes", wraps=atomic_write_bytes) as mock_write:
+            result = runner.invoke(cli, ["repo", "sync", "--jobs", "3"])
+
+        assert result.exit_code == 0
+        assert result.output.count("0.1.0 → 0.2.0") == 3
+        assert "[3/3]" in result.output
+        mock_write.assert_called_once()
+        data = yaml.safe_load(skills_yaml.read_text())
+        assert list(data["skills"]) == names
+
+    @patch("kudosx.commands.repo.time.sleep")
+    @patch("kudosx.commands.repo.fetch_tags")
+    @patch("kudosx.commands.repo.load_skills_from_local")
+    def test_repo_sync_retries_with_backoff(self, mock_load_skills, mock_fetch_version, mock_sleep, tmp_path):
+        """Test a failed fetch is retried with growing delays."""
+        mock_load_skills.return_value = {
+            "skill-test": {"repo": "kudosx/test-skill", "latest": "0.1.0"}
+        }
+        mock_fetch_version.side_effect = [None, None, ["v0.2.0"]]
+
+        runner = CliRunner()
+        with patch("kudosx.commands.repo.SKILLS_YAML", tmp_path / "skills.yaml"):
+            result = runner.invoke(cli, ["repo", "sync", "--timeout", "3"])
 
         assert result.exit_code == 0
         assert "0.1.0 → 0.2.0" in result.output
+        assert mock_fetch_version.call_count == 3
+        mock_fetch_version.assert_called_with("kudosx/test-skill", use_cache=False, timeout=3.0)
+        assert [c.args[0] for c in mock_sleep.call_args_list] == [0.25, 0.5]
+
+    @patch("kudosx.commands.repo.time.sleep")
+    @patch("kudosx.commands.repo.fetch_tags")
+    @patch("kudosx.commands.repo.load_skills_from_local")
+    def test_repo_sync_does_not_retry_repo_without_tags(self, mock_load_skills, mock_fetch_tags, mock_sleep):
+        """Test an empty tag list is accepted as an answer rather than retried."""
+        mock_load_skills.return_value = {
+            "skill-test": {"repo": "kudosx/test-skill", "latest": "0.1.0"}
+        }
+        mock_fetch_tags.return_value = []
+
+        runner = CliRunner()
+        result = runner.invoke(cli, ["repo", "sync"])
+
+        assert result.exit_code == 0
+        assert "no version tags" in result.output
+        assert "No changes to sync" in result.output
+        assert mock_fetch_tags.call_count == 1
+        mock_sleep.assert_not_called()
 
     @patch("kudosx.commands.repo.load_skills_from_local")
     def test_repo_sync_no_skills(self, mock_load_skills):
@@ -338,7 +631,7 @@ class TestRepoCommand:
         assert result.exit_code == 0
         assert "No skills found" in result.output
 
-    @patch("kudosx.commands.repo.fetch_latest_version_from_git")
+    @patch("kudosx.commands.repo.fetch_tags")
     @patch("kudosx.commands.repo.load_skills_from_local")
     def test_repo_sync_fetch_failure(self, mock_load_skills, mock_fetch_version):
         """Test repo sync when git fetch fails."""
@@ -432,3 +725,500 @@ skills:
 
         assert "skill-local" in result
         mock_local.assert_called()
+
+
+    @patch("kudosx.commands.add.load_skills_from_remote")
+    def test_commands_without_registry_skip_network(self, mock_remote):
+        """Test --version and list never load the remote registry."""
+        from kudosx.commands import add
+
+        add._skills_cache = None
+        runner = CliRunner()
+        runner.invoke(cli, ["--version"])
+        runner.invoke(cli, ["list"])
+
+        mock_remote.assert_not_called()
+        assert add._skills_cache is None
+
+    @patch("kudosx.commands.add.refresh_skills_in_background")
+    @patch("kudosx.commands.add.load_skills_from_remote")
+    def test_fresh_disk_cache_is_used(self, mock_remote, mock_refresh):
+        """Test a cached registry within the TTL is used without fetching."""
+        from kudosx.commands import add
+        from kudosx.utils.registry import write_registry_cache
+
+        write_registry_cache({"skill-cached": {"repo": "test/cached"}})
+        add._skills_cache = None
+
+        assert "skill-cached" in add.SKILLS
+        mock_remote.assert_not_called()
+        mock_refresh.assert_not_called()
+
+    @patch("kudosx.commands.add.refresh_skills_in_background")
+    @patch("kudosx.commands.add.load_skills_from_remote")
+    def test_stale_disk_cache_refreshes_in_background(self, mock_remote, mock_refresh):
+        """Test an expired cache is served immediately and refreshed asynchronously."""
+        from kudosx.commands import add
+        from kudosx.utils.registry import registry_cache_path, write_registry_cache
+
+        write_registry_cache({"skill-cached": {"repo": "test/cached"}})
+        data = json.loads(registry_cache_path().read_text())
+        data["fetched_at"] -= add.REGISTRY_TTL + 1
+        registry_cache_path().write_text(json.dumps(data))
+        add._skills_cache = None
+
+        assert "skill-cached" in add.load_skills()
+        mock_remote.assert_not_called()
+        mock_refresh.assert_called_once()
+
+    def test_background_refresh_is_joined_at_exit(self):
+        """Test the exit hook waits for a running refresh to write the cache."""
+        from kudosx.commands import add
+        from kudosx.utils.registry import read_registry_cache
+
+        started = threading.Event()
+        release = threading.Event()
+
+        def fetch(cached):
+            started.set()
+            release.wait(5)
+            return {"skills": {"skill-new": {"repo": "test/new"}}, "etag": None, "last_modified": None, "sha256": "x"}
+
+        with patch("kudosx.commands.add.fetch_remote_registry", side_effect=fetch):
+            add.refresh_skills_in_background()
+            started.wait(5)
+            threading.Timer(0.1, release.set).start()
+            add.join_background_refresh()
+
+        assert not add._refresh_thread.is_alive()
+        assert "skill-new" in read_registry_cache()["skills"]
+
+    def test_background_refresh_join_is_bounded(self):
+        """Test the exit hook gives up on a refresh stuck past the timeout."""
+        from kudosx.commands import add
+
+        release = threading.Event()
+        with patch("kudosx.commands.add.refresh_remote_skills", side_effect=lambda: release.wait(5)):
+            add.refresh_skills_in_background()
+            add.join_background_refresh(timeout=0.05)
+            try:
+                assert add._refresh_thread.is_alive()
+            finally:
+                release.set()
+                add._refresh_thread.join()
+
+    @patch("kudosx.commands.add.refresh_skills_in_background")
+    @patch("kudosx.commands.add.fetch_remote_registry", return_value=None)
+    def test_failed_fetch_is_not_retried_synchronously(self, mock_remote, mock_refresh):
+        """Test an offline first run records the failure for later runs."""
+        from kudosx.commands import add
+
+        add._skills_cache = None
+        assert "browser-use" in add.load_skills()
+        add._skills_cache = None
+        assert "browser-use" in add.load_skills()
+
+        assert mock_remote.call_count == 1
+        mock_refresh.assert_called_once()
+
+    @patch("kudosx.commands.add.urlopen")
+    def test_revalidation_not_modified_skips_parse(self, mock_urlopen):
+        """Test a 304 keeps the cached skills and sends the stored validators."""
+        from urllib.error import HTTPError
+        from kudosx.commands.add import refresh_remote_skills
+        from kudosx.utils.registry import read_registry_cache, write_registry_cache
+
+        write_registry_cache({"skill-cached": {"repo": "test/cached"}}, etag='"v1"')
+        mock_urlopen.side_effect = HTTPError("url", 304, "Not Modified", {}, None)
+
+        with patch("kudosx.commands.add.parse_registry_yaml") as mock_parse:
+            result = refresh_remote_skills()
+
+        assert result == {"skill-cached": {"repo": "test/cached"}}
+        mock_parse.assert_not_called()
+        assert mock_urlopen.call_args[0][0].get_header("If-none-match") == '"v1"'
+        assert read_registry_cache()["etag"] == '"v1"'
+
+    @patch("kudosx.commands.add.urlopen")
+    def test_failed_revalidation_keeps_cached_copy(self, mock_urlopen):
+        """Test an unreachable server does not overwrite the cached registry."""
+        from urllib.error import URLError
+        from kudosx.commands.add import refresh_remote_skills
+        from kudosx.utils.registry import read_registry_cache, write_registry_cache
+
+        write_registry_cache({"skill-cached": {"repo": "test/cached"}}, etag='"v1"')
+        mock_urlopen.side_effect = URLError("offline")
+
+        assert refresh_remote_skills() is None
+        assert read_registry_cache()["skills"] == {"skill-cached": {"repo": "test/cached"}}
+
+    @patch("kudosx.commands.add.urlopen")
+    def test_unchanged_body_skips_parse(self, mock_urlopen):
+        """Test a full response identical to the cached document is not reparsed."""
+        import hashlib
+        import io
+        from kudosx.commands.add import fetch_remote_registry
+        from kudosx.utils.registry import read_registry_cache, write_registry_cache
+
+        body = b"skills:\n  skill-cached:\n    repo: test/cached\n"
+        write_registry_cache({"skill-cached": {"repo": "test/cached"}}, sha256=hashlib.sha256(body).hexdigest())
+        response = io.BytesIO(body)
+        response.headers = {}
+        mock_urlopen.return_value = response
+
+        with patch("kudosx.commands.add.parse_registry_yaml") as mock_parse:
+            record = fetch_remote_registry(read_registry_cache())
+
+        assert record["skills"] == {"skill-cached": {"repo": "test/cached"}}
+        mock_parse.assert_not_called()
+
+    def test_list_shows_registry_freshness(self, tmp_path, monkeypatch):
+        """Test kudosx list reports how current the cached registry is."""
+        from kudosx.utils.registry import write_registry_cache
+
+        monkeypatch.chdir(tmp_path)
+        write_registry_cache({})
+
+        result = CliRunner().invoke(cli, ["list", "--local"])
+
+        assert "Registry: up to date (checked just now)" in result.output
+
+class TestSearchCommand:
+    """Tests for the search command."""
+
+    def test_search_skips_gitignored_paths(self, tmp_path):
+        """Test search does not report files under ignored directories."""
+        (tmp_path / ".gitignore").write_text("dist/\n")
+        (tmp_path / "dist").mkdir()
+        (tmp_path / "dist" / "bundle.js").write_text("needle\n")
+        (tmp_path / "app.js").write_text("needle\n")
+
+        runner = CliRunner()
+        result = runner.invoke(cli, ["search", "needle", "-p", str(tmp_path), "-t", "content"])
+
+        assert result.exit_code == 0
+        assert "app.js:1: needle" in result.output
+        assert "bundle.js" not in result.output
+
+    def test_search_no_ignore(self, tmp_path):
+        """Test --no-ignore searches ignored directories."""
+        (tmp_path / ".gitignore").write_text("dist/\n")
+        (tmp_path / "dist").mkdir()
+        (tmp_path / "dist" / "bundle.js").write_text("needle\n")
+
+        runner = CliRunner()
+        result = runner.invoke(
+            cli, ["search", "needle", "-p", str(tmp_path), "-t", "content", "--no-ignore"]
+        )
+
+        assert result.exit_code == 0
+        assert "bundle.js:1: needle" in result.output
+
+    def test_search_multiple_patterns(self, tmp_path):
+        """Test several patterns are matched in one run."""
+        (tmp_path / "a.py").write_text("old_api()\nnew_api()\nlegacy_call()\n")
+
+        runner = CliRunner()
+        result = runner.invoke(
+            cli, ["search", "old_api", "legacy_call", "-p", str(tmp_path), "-t", "content"]
+        )
+
+        assert result.exit_code == 0
+        assert "a.py:1: old_api()" in result.output
+        assert "a.py:3: legacy_call()" in result.output
+        assert "new_api" not in result.output
+
+    def test_search_patterns_file(self, tmp_path):
+        """Test patterns can be read from a file."""
+        (tmp_path / "a.py").write_text("old_api()\n")
+        patterns = tmp_path / "patterns.txt"
+        patterns.write_text("old_api\n\nother\n")
+
+        runner = CliRunner()
+        result = runner.invoke(
+            cli, ["search", "-f", str(patterns), "-p", str(tmp_path), "-t", "content"]
+        )
+
+        assert result.exit_code == 0
+        assert "a.py:1: old_api()" in result.output
+
+    def test_search_requires_pattern(self):
+        """Test search fails without any pattern."""
+        runner = CliRunner()
+        result = runner.invoke(cli, ["search"])
+        assert result.exit_code == 1
+        assert "Specify a QUERY" in result.output
+
+    def test_search_files_with_matches(self, tmp_path):
+        """Test --files-with-matches lists each matching file once."""
+        (tmp_path / "a.py").write_text("TODO\nTODO\n")
+        (tmp_path / "b.py").write_text("nothing\n")
+
+        runner = CliRunner()
+        result = runner.invoke(
+            cli, ["search", "TODO", "-p", str(tmp_path), "-t", "content", "-l"]
+        )
+
+        assert result.exit_code == 0
+        assert "Files with matches:" in result.output
+        assert "a.py" in result.output
+        assert "b.py" not in result.output
+        assert "Found 1 result(s)" in result.output
+
+    def test_search_count_parallel(self, tmp_path):
+        """Test --count works with concurrent scanning."""
+        (tmp_path / "a.py").write_text("TODO\nTODO\n")
+        (tmp_path / "b.py").write_text("TODO\n")
+
+        runner = CliRunner()
+        result = runner.invoke(
+            cli, ["search", "TODO", "-p", str(tmp_path), "-t", "content", "-c", "-j", "4"]
+        )
+
+        assert result.exit_code == 0
+        assert "a.py: 2" in result.output
+        assert "b.py: 1" in result.output
+        assert "Total: 3 matching line(s)" in result.output
+
+    def test_search_count_and_files_exclusive(self, tmp_path):
+        """Test --count and --files-with-matches cannot be combined."""
+        runner = CliRunner()
+        result = runner.invoke(cli, ["search", "x", "-p", str(tmp_path), "-c", "-l"])
+        assert result.exit_code == 1
+        assert "mutually exclusive" in result.output
+
+    def test_search_file_uses_index(self, tmp_path, monkeypatch):
+        """Test filename search is answered from the persistent index."""
+        monkeypatch.setenv("KUDOSX_CACHE_DIR", str(tmp_path / "cache"))
+        tree = tmp_path / "tree"
+        tree.mkdir()
+        (tree / "test_app.py").write_text("")
+        (tree / "app.js").write_text("")
+
+        runner = CliRunner()
+        args = ["search", r"^test_.*\.py$", "-p", str(tree), "-t", "file"]
+        first = runner.invoke(cli, args)
+        second = runner.invoke(cli, args)
+
+        assert first.exit_code == 0
+        assert "test_app.py" in first.output
+        assert "app.js" not in first.output
+        assert second.output == first.output
+        assert list((tmp_path / "cache" / "index").iterdir())
+
+    def test_search_reuses_cached_results(self, tmp_path):
+        """Test a repeated query only rescans modified files."""
+        (tmp_path / "a.py").write_text("TODO a\n")
+        (tmp_path / "b.py").write_text("TODO b\n")
+        args = ["search", "TODO", "-p", str(tmp_path), "-t", "content"]
+        runner = CliRunner()
+        runner.invoke(cli, args)
+
+        (tmp_path / "b.py").write_text("TODO b changed\n")
+        stat = os.stat(tmp_path / "b.py")
+        os.utime(tmp_path / "b.py", ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+        from kudosx.commands import search as search_module
+        with patch.object(search_module, "scan_file", wraps=search_module.scan_file) as spy:
+            result = runner.invoke(cli, args)
+
+        assert "a.py:1: TODO a" in result.output
+        assert "b.py:1: TODO b changed" in result.output
+        assert [c.args[0].name for c in spy.call_args_list] == ["b.py"]
+
+    def test_search_no_cache(self, tmp_path):
+        """Test --no-cache rescans every file."""
+        (tmp_path / "a.py").write_text("TODO a\n")
+        args = ["search", "TODO", "-p", str(tmp_path), "-t", "content", "--no-cache"]
+        runner = CliRunner()
+        runner.invoke(cli, args)
+
+        from kudosx.commands import search as search_module
+        with patch.object(search_module, "scan_file", wraps=search_module.scan_file) as spy:
+            runner.invoke(cli, args)
+
+        assert spy.call_count == 1
+
+    def test_search_sessions(self, tmp_path):
+        """Test -t session searches transcripts under --path."""
+        session = tmp_path / "my-project" / "abc123.jsonl"
+        session.parent.mkdir()
+        entry = {
+            "type": "user",
+            "timestamp": "2026-01-02T03:04:05Z",
+            "message": {"role": "user", "content": "why is the webhook retry flaky"},
+        }
+        session.write_text(json.dumps(entry) + "\n")
+
+        runner = CliRunner()
+        result = runner.invoke(cli, ["search", "webhook", "-t", "session", "-p", str(tmp_path)])
+
+        assert result.exit_code == 0
+        assert "my-project/abc123  2026-01-02 03:04:05  (1 hit(s))" in result.output
+        assert "why is the webhook retry flaky" in result.output
+        assert "Found 1 session(s)" in result.output
+
+    def test_search_watch_prints_delta(self, tmp_path):
+        """Test --watch reports matches added after the first run."""
+        (tmp_path / "a.py").write_text("TODO first\n")
+        (tmp_path / "b.py").write_text("clean\n")
+        polls = []
+
+        def fake_sleep(seconds):
+            polls.append(seconds)
+            if len(polls) > 1:
+                raise KeyboardInterrupt
+            (tmp_path / "b.py").write_text("clean\nTODO second\n")
+            stat = os.stat(tmp_path / "b.py")
+            os.utime(tmp_path / "b.py", ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+        runner = CliRunner()
+        with patch("kudosx.commands.search.time.sleep", side_effect=fake_sleep):
+            result = runner.invoke(
+                cli, ["search", "TODO", "-p", str(tmp_path), "-t", "content", "--watch", "--interval", "0.5"]
+            )
+
+        assert result.exit_code == 0
+        assert "a.py:1: TODO first" in result.output
+        assert "1 file(s) changed" in result.output
+        assert "+ b.py:2: TODO second" in result.output
+        assert "a.py:1: TODO first" not in result.output.split("changed")[1]
+        assert "Stopped watching." in result.output
+        assert polls == [0.5, 0.5]
+
+    def test_search_replace(self, tmp_path):
+        """Test --replace rewrites files across the tree using a worker pool."""
+        (tmp_path / "a.py").write_text("old_name()\n")
+        (tmp_path / "b.py").write_text("x = old_name\ny = old_name\n")
+        (tmp_path / "c.py").write_text("untouched\n")
+
+        runner = CliRunner()
+        result = runner.invoke(
+            cli, ["search", "old_name", "-p", str(tmp_path), "--replace", "new_name", "-j", "4"]
+        )
+
+        assert result.exit_code == 0
+        assert "a.py:1" in result.output
+        assert "    + new_name()" in result.output
+        assert "Replaced 3 occurrence(s) in 2 file(s)" in result.output
+        assert (tmp_path / "b.py").read_text() == "x = new_name\ny = new_name\n"
+        assert (tmp_path / "c.py").read_text() == "untouched\n"
+
+    def test_search_replace_writes_through_symlinks(self, tmp_path):
+        """Test --replace rewrites a symlink's target once and keeps the link."""
+        (tmp_path / "real").mkdir()
+        (tmp_path / "real" / "a.py").write_text("old_name()\n")
+        (tmp_path / "link.py").symlink_to(tmp_path / "real" / "a.py")
+
+        runner = CliRunner()
+        result = runner.invoke(cli, ["search", "old_name", "-p", str(tmp_path), "--replace", "old_name_v2"])
+
+        assert result.exit_code == 0
+        assert (tmp_path / "link.py").is_symlink()
+        assert (tmp_path / "real" / "a.py").read_text() == "old_name_v2()\n"
+        assert "Replaced 1 occurrence(s) in 1 file(s)" in result.output
+
+    def test_search_replace_skips_hard_linked_files(self, tmp_path):
+        """Test --replace reports files with other hard links instead of splitting them."""
+        (tmp_path / "a.py").write_text("old_name()\n")
+        os.link(tmp_path / "a.py", tmp_path / "b.py")
+
+        runner = CliRunner()
+        result = runner.invoke(cli, ["search", "old_name", "-p", str(tmp_path), "--replace", "new_name"])
+
+        assert result.exit_code == 0
+        assert "Skipped 2 file(s) with other hard links" in result.output
+        assert (tmp_path / "a.py").read_text() == "old_name()\n"
+        assert os.stat(tmp_path / "a.py").st_ino == os.stat(tmp_path / "b.py").st_ino
+
+    def test_search_replace_dry_run(self, tmp_path):
+        """Test --dry-run reports changes without writing them."""
+        (tmp_path / "a.py").write_text("old_name()\n")
+
+        runner = CliRunner()
+        result = runner.invoke(
+            cli, ["search", "old_name", "-p", str(tmp_path), "--replace", "new_name", "--dry-run"]
+        )
+
+        assert result.exit_code == 0
+        assert "Would replace 1 occurrence(s) in 1 file(s) (dry run)" in result.output
+        assert (tmp_path / "a.py").read_text() == "old_name()\n"
+
+    def test_search_replace_invalid_group(self, tmp_path):
+        """Test an invalid backreference fails before touching files."""
+        (tmp_path / "a.py").write_text("old_name()\n")
+
+        runner = CliRunner()
+        result = runner.invoke(cli, ["search", "old", "-p", str(tmp_path), "--replace", r"\2"])
+
+        assert result.exit_code == 1
+        assert "Invalid replacement" in result.output
+        assert (tmp_path / "a.py").read_text() == "old_name()\n"
+
+    def test_search_zip(self, tmp_path):
+        """Test --search-zip reports matches as archive!member:line."""
+        with zipfile.ZipFile(tmp_path / "skill.zip", "w") as archive:
+            archive.writestr("skill/SKILL.md", "# Skill\nneedle here\n")
+        (tmp_path / "plain.md").write_text("needle\n")
+
+        runner = CliRunner()
+        result = runner.invoke(
+            cli, ["search", "needle", "-p", str(tmp_path), "-t", "content", "-e", "md", "--search-zip"]
+        )
+
+        assert result.exit_code == 0
+        assert "skill.zip!skill/SKILL.md:2: needle here" in result.output
+        assert "plain.md:1: needle" in result.output
+
+    def test_search_zip_cache_respects_larger_limit(self, tmp_path):
+        """Test a cached archive result truncated at a small -m is not reused for a larger one."""
+        with zipfile.ZipFile(tmp_path / "skills.zip", "w") as archive:
+            for name in ("a", "b"):
+                archive.writestr(f"{name}/SKILL.md", "needle\n" * 10)
+        args = ["search", "needle", "-p", str(tmp_path), "-t", "content", "-e", "md", "-z"]
+
+        runner = CliRunner()
+        runner.invoke(cli, args + ["-m", "3"])
+        cached = runner.invoke(cli, args + ["-m", "30"])
+        uncached = runner.invoke(cli, args + ["-m", "30", "--no-cache"])
+
+        assert cached.exit_code == 0
+        assert "skills.zip!a/SKILL.md:10: needle" in cached.output
+        assert cached.output == uncached.output
+
+    def test_search_fuzzy(self, tmp_path):
+        """Test --fuzzy ranks paths by subsequence match."""
+        (tmp_path / "src").mkdir()
+        (tmp_path / "src" / "models.py").write_text("")
+        (tmp_path / "src" / "mold.py").write_text("")
+        (tmp_path / "docs.md").write_text("")
+
+        runner = CliRunner()
+        result = runner.invoke(cli, ["search", "mdl", "-p", str(tmp_path), "--fuzzy"])
+
+        assert result.exit_code == 0
+        assert "  src/models.py" in result.output
+        assert "docs.md" not in result.output
+        assert "Found 1 result(s)" in result.output
+
+    def test_search_fuzzy_reports_capped_ranking(self, tmp_path):
+        """Test --fuzzy says when more paths matched than were ranked."""
+        from kudosx.utils.fuzzy import FuzzyFinder
+
+        for i in range(5):
+            (tmp_path / f"model{i}.py").write_text("")
+
+        runner = CliRunner()
+        with patch.object(FuzzyFinder.__init__, "__defaults__", (2,)):
+            result = runner.invoke(cli, ["search", "mdl", "-p", str(tmp_path), "--fuzzy"])
+
+        assert result.exit_code == 0
+        assert "Ranked only 2 of 5 matching paths" in result.output
+
+    def test_search_fuzzy_rejects_content(self, tmp_path):
+        """Test --fuzzy cannot be combined with content searches."""
+        runner = CliRunner()
+        result = runner.invoke(cli, ["search", "x", "-p", str(tmp_path), "--fuzzy", "-t", "content"])
+
+        assert result.exit_code == 1
+        assert "--fuzzy only searches file paths" in result.output
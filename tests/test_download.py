@@ -0,0 +1,84 @@
+"""Tests for the chunked download helpers."""
+
+import hashlib
+import io
+
+from kudosx.utils.download import DownloadProgress, format_bytes, stream_to_file
+
+
+class ChunkOnlyResponse:
+    """Response without readinto that refuses unbounded reads."""
+
+    def __init__(self, data: bytes, headers=None):
+        self._data = io.BytesIO(data)
+        self.headers = headers or {}
+        self.reads = 0
+
+    def read(self, size=-1):
+        assert size > 0, "body must not be read in one call"
+        self.reads += 1
+        return self._data.read(size)
+
+
+class TestStreamToFile:
+    """Tests for stream_to_file."""
+
+    def test_copies_and_hashes_in_chunks(self):
+        """Test the body is written in chunks and hashed incrementally."""
+        data = bytes(range(256)) * 100
+        response = ChunkOnlyResponse(data)
+        dest = io.BytesIO()
+
+        digest, size = stream_to_file(response, dest, chunk_size=1000)
+
+        assert dest.getvalue() == data
+        assert size == len(data)
+        assert digest == hashlib.sha256(data).hexdigest()
+        assert response.reads == 27
+
+    def test_uses_readinto_when_available(self):
+        """Test file-like responses are read into a reused buffer."""
+        data = b"x" * 5000
+        dest = io.BytesIO()
+
+        digest, size = stream_to_file(io.BytesIO(data), dest, chunk_size=1024)
+
+        assert dest.getvalue() == data
+        assert digest == hashlib.sha256(data).hexdigest()
+
+    def test_reports_progress_with_content_length(self):
+        """Test progress receives running totals and the declared size."""
+        response = ChunkOnlyResponse(b"a" * 2500, headers={"Content-Length": "2500"})
+        calls = []
+
+        stream_to_file(response, io.BytesIO(), chunk_size=1000, progress=lambda d, t: calls.append((d, t)))
+
+        assert calls == [(1000, 2500), (2000, 2500), (2500, 2500)]
+
+
+class TestDownloadProgress:
+    """Tests for DownloadProgress."""
+
+    def test_finish_reports_throughput(self, capsys):
+        """Test the summary line includes size and rate."""
+        progress = DownloadProgress(interactive=False)
+        progress(1024, None)
+
+        progress.finish(3 * 1024 * 1024)
+
+        out = capsys.readouterr().out
+        assert out.startswith("Downloaded 3.0 MiB in ")
+        assert "/s)" in out
+
+    def test_interactive_redraws_in_place(self, capsys):
+        """Test terminal progress is drawn with carriage returns."""
+        progress = DownloadProgress(interactive=True)
+        progress(512, 1024)
+
+        assert capsys.readouterr().out == "\rDownloaded 512 B / 1.0 KiB (50%)"
+
+    def test_format_bytes(self):
+        """Test byte counts use binary units."""
+        assert format_bytes(12) == "12 B"
+        assert format_bytes(1536) == "1.5 KiB"
+        assert format_bytes(5 * 1024 ** 3) == "5.0 GiB"
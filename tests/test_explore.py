@@ -816,3 +816,55 @@ class TestInstallAtLocation:
 
         assert len(called_with) == 1
         assert "install_test-skill" in called_with[0]
+
+
+class TestFinderView:
+    """Tests for the fuzzy finder view."""
+
+    async def test_finder_ranks_files(self, tmp_path, monkeypatch):
+        """Test typing in the finder ranks files of the current directory."""
+        (tmp_path / "src").mkdir()
+        (tmp_path / "src" / "models.py").write_text("")
+        (tmp_path / "README.md").write_text("")
+        monkeypatch.chdir(tmp_path)
+
+        app = ExploreTUI()
+        async with app.run_test() as pilot:
+            await pilot.press("f")
+            await app.workers.wait_for_complete()
+            await pilot.pause()
+            assert app.current_view == "finder"
+            assert app.query_one("#finder-input").has_focus
+
+            await pilot.press("m", "d", "l")
+            assert [path for _, path, _ in app.finder_data] == ["src/models.py"]
+
+    async def test_finder_title_shows_capped_ranking(self, tmp_path, monkeypatch):
+        """Test the finder title says when more files matched than were ranked."""
+        for i in range(5):
+            (tmp_path / f"model{i}.py").write_text("")
+        monkeypatch.chdir(tmp_path)
+
+        app = ExploreTUI()
+        async with app.run_test() as pilot:
+            await pilot.press("f")
+            await app.workers.wait_for_complete()
+            await pilot.pause()
+            app._finder.max_scored = 2
+
+            await pilot.press("m", "d", "l")
+            assert app.query_one("#data-table").border_title == "Finder (ranked 2 of 5 matches)"
+
+            await pilot.press("0")
+            assert app.query_one("#data-table").border_title == "Finder"
+
+    async def test_escape_returns_to_table(self, tmp_path, monkeypatch):
+        """Test escape moves focus from the finder input to the table."""
+        monkeypatch.chdir(tmp_path)
+        app = ExploreTUI()
+        async with app.run_test() as pilot:
+            await pilot.press("f")
+            await pilot.press("escape")
+            assert app.query_one("#data-table").has_focus
+            await pilot.press("k")
+            assert app.current_view == "skills"
@@ -0,0 +1,98 @@
+"""Tests for the persistent filename index."""
+
+import os
+
+from kudosx.utils.file_index import FileIndex
+from kudosx.utils.matcher import build_matcher
+
+
+def _touch_dir(path):
+    """Bump a directory mtime so the change is visible at any timestamp granularity."""
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+def _make_tree(root):
+    (root / "src" / "pkg").mkdir(parents=True)
+    (root / "src" / "main.py").write_text("")
+    (root / "src" / "pkg" / "util.py").write_text("")
+    (root / "README.md").write_text("")
+
+
+class TestFileIndex:
+    """Tests for FileIndex."""
+
+    def test_build_and_find(self, tmp_path):
+        """Test a fresh index finds files by name."""
+        _make_tree(tmp_path / "tree")
+        index = FileIndex(tmp_path / "tree", cache_dir=tmp_path / "cache")
+
+        assert index.ensure() == -1
+        assert index.paths == ["README.md", "src/main.py", "src/pkg/util.py"]
+        assert index.find(build_matcher([r"\.py$"])) == ["src/main.py", "src/pkg/util.py"]
+        assert index.find(build_matcher(["util"])) == ["src/pkg/util.py"]
+
+    def test_persisted_index_is_reused(self, tmp_path):
+        """Test a second index loads from disk without re-listing."""
+        _make_tree(tmp_path / "tree")
+        FileIndex(tmp_path / "tree", cache_dir=tmp_path / "cache").ensure()
+
+        index = FileIndex(tmp_path / "tree", cache_dir=tmp_path / "cache")
+
+        assert index.ensure() == 0
+        assert len(index.paths) == 3
+
+    def test_refresh_relists_only_changed_dirs(self, tmp_path):
+        """Test only directories with a new mtime are re-listed."""
+        tree = tmp_path / "tree"
+        _make_tree(tree)
+        index = FileIndex(tree, cache_dir=tmp_path / "cache")
+        index.ensure()
+
+        (tree / "src" / "pkg" / "new.py").write_text("")
+        _touch_dir(tree / "src" / "pkg")
+
+        assert index.refresh() == 1
+        assert "src/pkg/new.py" in index.paths
+
+    def test_refresh_handles_added_and_removed_dirs(self, tmp_path):
+        """Test new sub-trees are scanned and removed ones dropped."""
+        tree = tmp_path / "tree"
+        _make_tree(tree)
+        index = FileIndex(tree, cache_dir=tmp_path / "cache")
+        index.ensure()
+
+        (tree / "src" / "pkg" / "util.py").unlink()
+        (tree / "src" / "pkg").rmdir()
+        (tree / "docs" / "api").mkdir(parents=True)
+        (tree / "docs" / "api" / "index.md").write_text("")
+        _touch_dir(tree / "src")
+        _touch_dir(tree)
+
+        index.refresh()
+
+        assert index.paths == ["README.md", "docs/api/index.md", "src/main.py"]
+        assert "src/pkg" not in index.dirs
+
+    def test_refresh_applies_edited_ignore_file(self, tmp_path):
+        """Test editing a .gitignore re-scans the affected sub-tree."""
+        tree = tmp_path / "tree"
+        _make_tree(tree)
+        (tree / ".gitignore").write_text("")
+        index = FileIndex(tree, cache_dir=tmp_path / "cache")
+        index.ensure()
+
+        (tree / ".gitignore").write_text("pkg/\n")
+        stat = os.stat(tree / ".gitignore")
+        os.utime(tree / ".gitignore", ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+        index.refresh()
+
+        assert index.paths == ["README.md", "src/main.py"]
+
+    def test_empty_tree(self, tmp_path):
+        """Test an empty tree yields no matches."""
+        (tmp_path / "tree").mkdir()
+        index = FileIndex(tmp_path / "tree", cache_dir=tmp_path / "cache")
+        index.ensure()
+        assert index.find(build_matcher(["x"])) == []
@@ -0,0 +1,193 @@
+"""Tests for filesystem and cache helpers."""
+
+import os
+import stat
+
+import pytest
+
+from kudosx.utils.cache import get_cache_dir
+from kudosx.utils.fs import (
+    atomic_write_bytes,
+    clone_file,
+    replace_directory,
+    replace_with_clone,
+    staged_directory,
+)
+
+
+class TestAtomicWriteBytes:
+    """Tests for atomic_write_bytes function."""
+
+    def test_writes_new_file(self, tmp_path):
+        """Test writing a file that does not exist yet."""
+        target = tmp_path / "out.txt"
+        atomic_write_bytes(target, b"hello")
+        assert target.read_bytes() == b"hello"
+        assert os.listdir(tmp_path) == ["out.txt"]
+
+    def test_preserves_mode(self, tmp_path):
+        """Test the existing file mode is kept."""
+        target = tmp_path / "run.sh"
+        target.write_bytes(b"old")
+        target.chmod(0o755)
+        atomic_write_bytes(target, b"new")
+        assert stat.S_IMODE(target.stat().st_mode) == 0o755
+        assert target.read_bytes() == b"new"
+
+    @pytest.mark.skipif(not hasattr(os, "geteuid") or os.geteuid() != 0, reason="needs root to chown")
+    def test_preserves_owner(self, tmp_path):
+        """Test the existing file's owner and group are kept."""
+        target = tmp_path / "owned.txt"
+        target.write_bytes(b"old")
+        os.chown(target, 1234, 5678)
+        atomic_write_bytes(target, b"new")
+        assert (target.stat().st_uid, target.stat().st_gid) == (1234, 5678)
+
+    def test_cleans_up_on_failure(self, tmp_path, monkeypatch):
+        """Test the temp file is removed if the replace fails."""
+        target = tmp_path / "out.txt"
+        target.write_bytes(b"old")
+
+        def fail(*args):
+            raise OSError("boom")
+
+        monkeypatch.setattr(os, "replace", fail)
+        with pytest.raises(OSError):
+            atomic_write_bytes(target, b"new")
+        assert os.listdir(tmp_path) == ["out.txt"]
+        assert target.read_bytes() == b"old"
+
+
+
+class TestStagedDirectory:
+    """Tests for staged_directory and replace_directory."""
+
+    def test_creates_target(self, tmp_path):
+        """Test a new directory appears only after the block completes."""
+        target = tmp_path / "skill"
+        with staged_directory(target) as staging:
+            (staging / "SKILL.md").write_text("new")
+            assert not target.exists()
+
+        assert (target / "SKILL.md").read_text() == "new"
+        assert os.listdir(tmp_path) == ["skill"]
+
+    def test_replaces_existing_target(self, tmp_path):
+        """Test the old contents are swapped out and the backup removed."""
+        target = tmp_path / "skill"
+        target.mkdir()
+        (target / "old.txt").write_text("old")
+
+        with staged_directory(target) as staging:
+            (staging / "new.txt").write_text("new")
+
+        assert os.listdir(target) == ["new.txt"]
+        assert os.listdir(tmp_path) == ["skill"]
+
+    def test_failure_keeps_previous_install(self, tmp_path):
+        """Test an exception inside the block leaves the target untouched."""
+        target = tmp_path / "skill"
+        target.mkdir()
+        (target / "old.txt").write_text("old")
+
+        with pytest.raises(KeyboardInterrupt):
+            with staged_directory(target) as staging:
+                (staging / "partial.txt").write_text("x")
+                raise KeyboardInterrupt
+
+        assert os.listdir(target) == ["old.txt"]
+        assert os.listdir(tmp_path) == ["skill"]
+
+    def test_failed_rename_restores_backup(self, tmp_path, monkeypatch):
+        """Test the previous directory is renamed back if the swap fails."""
+        target = tmp_path / "skill"
+        target.mkdir()
+        (target / "old.txt").write_text("old")
+        source = tmp_path / "staged"
+        source.mkdir()
+        real_rename = os.rename
+
+        def rename(src, dst):
+            if str(src) == str(source):
+                raise OSError("boom")
+            real_rename(src, dst)
+
+        monkeypatch.setattr(os, "rename", rename)
+        with pytest.raises(OSError):
+            replace_directory(source, target)
+
+        assert (target / "old.txt").read_text() == "old"
+        assert sorted(os.listdir(tmp_path)) == ["skill", "staged"]
+
+class TestCloneFile:
+    """Tests for clone_file and replace_with_clone."""
+
+    def test_hardlinks_only_when_asked(self, tmp_path, monkeypatch):
+        """Test hardlink mode falls back to a hardlink when reflinks are unavailable."""
+        monkeypatch.setattr("kudosx.utils.fs._reflink", lambda source, target: False)
+        source = tmp_path / "a"
+        source.write_bytes(b"data")
+
+        method = clone_file(source, tmp_path / "b", "hardlink")
+
+        assert method == "hardlink"
+        assert (tmp_path / "b").stat().st_ino == source.stat().st_ino
+
+    def test_default_never_hardlinks(self, tmp_path, monkeypatch):
+        """Test the default mode copies, keeping exec bits and making the copy writable."""
+        monkeypatch.delenv("KUDOSX_LINK_MODE", raising=False)
+        monkeypatch.setattr("kudosx.utils.fs._reflink", lambda source, target: False)
+        source = tmp_path / "a"
+        source.write_bytes(b"#!/bin/sh\n")
+        source.chmod(0o555)
+
+        method = clone_file(source, tmp_path / "b")
+
+        assert method == "copy"
+        assert (tmp_path / "b").stat().st_ino != source.stat().st_ino
+        assert stat.S_IMODE((tmp_path / "b").stat().st_mode) == 0o755
+
+    def test_copy_mode_makes_an_independent_file(self, tmp_path, monkeypatch):
+        """Test KUDOSX_LINK_MODE=copy never shares the inode."""
+        monkeypatch.setenv("KUDOSX_LINK_MODE", "copy")
+        source = tmp_path / "a"
+        source.write_bytes(b"data" * 1000)
+
+        method = clone_file(source, tmp_path / "b")
+
+        assert method == "copy"
+        assert (tmp_path / "b").read_bytes() == source.read_bytes()
+        assert (tmp_path / "b").stat().st_ino != source.stat().st_ino
+
+    def test_replace_does_not_write_through_hardlinks(self, tmp_path, monkeypatch):
+        """Test replacing a hardlinked file leaves the other link untouched."""
+        monkeypatch.setattr("kudosx.utils.fs._reflink", lambda source, target: False)
+        stored = tmp_path / "stored"
+        stored.write_bytes(b"old")
+        installed = tmp_path / "installed"
+        os.link(stored, installed)
+        new = tmp_path / "new"
+        new.write_bytes(b"new")
+
+        replace_with_clone(new, installed, "copy")
+
+        assert installed.read_bytes() == b"new"
+        assert stored.read_bytes() == b"old"
+        assert sorted(os.listdir(tmp_path)) == ["installed", "new", "stored"]
+
+
+class TestGetCacheDir:
+    """Tests for get_cache_dir function."""
+
+    def test_env_override(self, tmp_path, monkeypatch):
+        """Test KUDOSX_CACHE_DIR overrides the cache root."""
+        monkeypatch.setenv("KUDOSX_CACHE_DIR", str(tmp_path / "c"))
+        path = get_cache_dir("index")
+        assert path == tmp_path / "c" / "index"
+        assert path.is_dir()
+
+    def test_xdg_cache_home(self, tmp_path, monkeypatch):
+        """Test XDG_CACHE_HOME is honoured."""
+        monkeypatch.delenv("KUDOSX_CACHE_DIR", raising=False)
+        monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+        assert get_cache_dir() == tmp_path / "kudosx"
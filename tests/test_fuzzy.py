@@ -0,0 +1,129 @@
+"""Tests for fuzzy path matching."""
+
+from kudosx.utils.fuzzy import FuzzyFinder, compile_query, fuzzy_match
+
+
+class TestCompileQuery:
+    """Tests for compile_query."""
+
+    def test_pattern_compiles_on_python_310(self):
+        """Test the filter avoids possessive quantifiers, which need Python 3.11."""
+        pattern = compile_query("a.b-c")
+
+        assert "*+" not in pattern.pattern
+
+    def test_filters_lines_by_subsequence(self):
+        """Test findall returns whole lines containing the query in order."""
+        blob = "src/models.py\nsrc/mold.py\nlib/middle.py\nsrc/ldm.py"
+
+        assert compile_query("mdl").findall(blob) == ["src/models.py", "lib/middle.py"]
+
+
+class TestFuzzyMatch:
+    """Tests for fuzzy_match function."""
+
+    def test_subsequence_required(self):
+        """Test a path matches only if it contains the query in order."""
+        assert fuzzy_match("mdl", "src/models.py") is not None
+        assert fuzzy_match("ldm", "src/models.py") is None
+
+    def test_positions_use_shortest_window(self):
+        """Test matched positions are shrunk to the tightest match."""
+        _, positions = fuzzy_match("ab", "a_x_ab")
+
+        assert positions == [4, 5]
+
+    def test_boundary_beats_middle_of_word(self):
+        """Test matches at word boundaries score higher."""
+        boundary, _ = fuzzy_match("fb", "foo_bar")
+        middle, _ = fuzzy_match("fb", "xfxxbx")
+
+        assert boundary > middle
+
+    def test_basename_bonus(self):
+        """Test matches in the filename outrank matches in directories."""
+        in_basename, _ = fuzzy_match("cli", "src/cli.py")
+        in_dirs, _ = fuzzy_match("cli", "cli/src.py")
+
+        assert in_basename > in_dirs
+
+    def test_smart_case(self):
+        """Test lowercase queries ignore case and uppercase ones do not."""
+        assert fuzzy_match("readme", "README.md") is not None
+        assert fuzzy_match("ReadMe", "README.md") is None
+        assert fuzzy_match("README", "README.md") is not None
+
+
+class TestFuzzyFinder:
+    """Tests for FuzzyFinder."""
+
+    PATHS = [
+        "docs/spec/CLI.md",
+        "kudosx/cli.py",
+        "kudosx/commands/search.py",
+        "kudosx/utils/fuzzy.py",
+        "tests/test_search.py",
+    ]
+
+    def test_ranks_best_match_first(self):
+        """Test a contiguous match in a filename outranks a scattered one."""
+        results = FuzzyFinder(self.PATHS).search("cli")
+
+        assert [path for _, path, _ in results][:2] == ["kudosx/cli.py", "docs/spec/CLI.md"]
+
+    def test_ties_prefer_shorter_paths(self):
+        """Test equally scored matches are ordered by path length."""
+        results = FuzzyFinder(self.PATHS).search("search")
+
+        assert [path for _, path, _ in results] == ["tests/test_search.py", "kudosx/commands/search.py"]
+
+    def test_incremental_filtering_reuses_candidates(self):
+        """Test an extended query only filters the previous candidate set."""
+        finder = FuzzyFinder(self.PATHS)
+        finder.search("k")
+        previous = finder.candidates("k")
+
+        finder.search("ku")
+
+        assert set(finder.candidates("ku")) <= set(previous)
+        assert [q for q, _ in finder._history] == ["k", "ku"]
+
+    def test_backspace_falls_back_to_prefix(self):
+        """Test deleting characters reuses the remembered shorter query."""
+        finder = FuzzyFinder(self.PATHS)
+        finder.search("fuz")
+
+        results = finder.search("fu")
+
+        assert [q for q, _ in finder._history] == ["fu"]
+        assert results[0][1] == "kudosx/utils/fuzzy.py"
+
+    def test_case_variants_are_kept(self):
+        """Test paths differing only in case are all returned."""
+        results = FuzzyFinder(["a/README.md", "b/readme.md", "a/Readme.md"]).search("readme")
+
+        assert sorted(path for _, path, _ in results) == ["a/README.md", "a/Readme.md", "b/readme.md"]
+
+    def test_scoring_is_capped(self):
+        """Test only max_scored candidates are scored, basename hits first."""
+        paths = [f"ab/x{i}.txt" for i in range(20)] + ["z/ab.txt"]
+
+        results = FuzzyFinder(paths, max_scored=5).search("ab", limit=50)
+
+        assert len(results) == 5
+        assert results[0][1] == "z/ab.txt"
+
+    def test_unscored_reports_capped_matches(self):
+        """Test the number of matching paths left unscored is recorded per search."""
+        paths = [f"ab/x{i}.txt" for i in range(20)] + ["z/ab.txt"]
+        finder = FuzzyFinder(paths, max_scored=5)
+
+        finder.search("ab")
+        assert finder.unscored == 16
+
+        finder.search("x19")
+        assert finder.unscored == 0
+
+    def test_empty_query_lists_paths(self):
+        """Test an empty query returns paths unranked."""
+        assert len(FuzzyFinder(self.PATHS).search("", limit=2)) == 2
@@ -0,0 +1,119 @@
+"""Tests for gitignore-style filtering utilities."""
+
+import os
+
+from kudosx.utils.ignore import IgnoreMatcher, walk
+
+
+def _walked_files(root, **kwargs) -> list[str]:
+    """Return walked files relative to root with "/" separators."""
+    found = []
+    for dirpath, _, files in walk(root, **kwargs):
+        for name in files:
+            rel = os.path.relpath(os.path.join(dirpath, name), root)
+            found.append(rel.replace(os.sep, "/"))
+    return sorted(found)
+
+
+class TestIgnoreMatcher:
+    """Tests for IgnoreMatcher rule compilation."""
+
+    def test_basename_pattern_matches_any_depth(self):
+        """Test patterns without a slash match at any depth."""
+        matcher = IgnoreMatcher("/repo", ["*.pyc\n"])
+        assert matcher.match("a.pyc", False) is True
+        assert matcher.match("pkg/sub/a.pyc", False) is True
+        assert matcher.match("a.py", False) is None
+
+    def test_anchored_pattern(self):
+        """Test patterns with a slash are relative to the ignore file."""
+        matcher = IgnoreMatcher("/repo", ["/build\n", "docs/out\n"])
+        assert matcher.match("build", True) is True
+        assert matcher.match("src/build", True) is None
+        assert matcher.match("docs/out", True) is True
+
+    def test_dir_only_pattern(self):
+        """Test trailing slash only matches directories."""
+        matcher = IgnoreMatcher("/repo", ["dist/\n"])
+        assert matcher.match("dist", True) is True
+        assert matcher.match("dist", False) is None
+
+    def test_double_star(self):
+        """Test ** matches across directories."""
+        matcher = IgnoreMatcher("/repo", ["**/cache/*.tmp\n", "logs/**\n"])
+        assert matcher.match("cache/a.tmp", False) is True
+        assert matcher.match("a/b/cache/a.tmp", False) is True
+        assert matcher.match("logs/2024/app.log", False) is True
+
+    def test_negation_last_rule_wins(self):
+        """Test ! re-includes a previously ignored path."""
+        matcher = IgnoreMatcher("/repo", ["*.log\n", "!keep.log\n"])
+        assert matcher.match("debug.log", False) is True
+        assert matcher.match("keep.log", False) is False
+
+    def test_comments_and_blank_lines(self):
+        """Test comments and blank lines are skipped."""
+        matcher = IgnoreMatcher("/repo", ["# comment\n", "\n", "   \n"])
+        assert not matcher
+
+
+class TestWalk:
+    """Tests for the pruning directory walker."""
+
+    def test_prunes_ignored_directories(self, tmp_path):
+        """Test ignored directories are never descended into."""
+        (tmp_path / ".gitignore").write_text("node_modules/\n*.log\n")
+        (tmp_path / "node_modules" / "pkg").mkdir(parents=True)
+        (tmp_path / "node_modules" / "pkg" / "index.js").write_text("x")
+        (tmp_path / "app.js").write_text("x")
+        (tmp_path / "debug.log").write_text("x")
+
+        visited = [d for d, _, _ in walk(tmp_path)]
+
+        assert _walked_files(tmp_path) == ["app.js"]
+        assert not any("node_modules" in d for d in visited)
+
+    def test_nested_ignore_files(self, tmp_path):
+        """Test nested ignore files apply to their own subtree."""
+        (tmp_path / "a").mkdir()
+        (tmp_path / "b").mkdir()
+        (tmp_path / "a" / ".ignore").write_text("*.txt\n")
+        (tmp_path / "a" / "x.txt").write_text("x")
+        (tmp_path / "b" / "x.txt").write_text("x")
+
+        assert _walked_files(tmp_path) == ["b/x.txt"]
+
+    def test_respect_ignore_disabled(self, tmp_path):
+        """Test ignore files are not applied when disabled."""
+        (tmp_path / ".gitignore").write_text("*.log\n")
+        (tmp_path / "debug.log").write_text("x")
+
+        assert _walked_files(tmp_path, respect_ignore=False) == ["debug.log"]
+
+    def test_hidden_entries_skipped(self, tmp_path):
+        """Test hidden files and directories are skipped by default."""
+        (tmp_path / ".cache").mkdir()
+        (tmp_path / ".cache" / "a.py").write_text("x")
+        (tmp_path / ".env").write_text("x")
+        (tmp_path / "main.py").write_text("x")
+
+        assert _walked_files(tmp_path) == ["main.py"]
+        assert ".env" in _walked_files(tmp_path, hidden=True)
+
+    def test_git_directory_always_pruned(self, tmp_path):
+        """Test .git is skipped even when hidden entries are included."""
+        (tmp_path / ".git").mkdir()
+        (tmp_path / ".git" / "HEAD").write_text("ref")
+        (tmp_path / "main.py").write_text("x")
+
+        assert _walked_files(tmp_path, hidden=True) == ["main.py"]
+
+    def test_parent_repository_rules_apply(self, tmp_path):
+        """Test ignore files above the search root apply inside a repo."""
+        (tmp_path / ".git").mkdir()
+        (tmp_path / ".gitignore").write_text("*.gen\n")
+        (tmp_path / "src").mkdir()
+        (tmp_path / "src" / "a.gen").write_text("x")
+        (tmp_path / "src" / "a.py").write_text("x")
+
+        assert _walked_files(tmp_path / "src") == ["a.py"]
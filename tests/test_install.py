@@ -0,0 +1,255 @@
+"""Tests for extracting and installing skills from repository archives."""
+
+import hashlib
+import io
+import zipfile
+from unittest.mock import patch
+
+import click
+import pytest
+
+from kudosx.commands.add import download_and_extract_skill, extract_zip_subtree, install_skill_archive
+from kudosx.utils.manifest import read_manifest
+from kudosx.utils.store import SkillStore
+
+
+def _make_zip(path, files, root="repo-main"):
+    with zipfile.ZipFile(path, "w") as zf:
+        zf.writestr(f"{root}/", "")
+        for name, content in files.items():
+            zf.writestr(f"{root}/{name}", content)
+    return path
+
+
+class FakeResponse(io.BytesIO):
+    """Minimal stand-in for an HTTP response."""
+
+    headers = {}
+
+
+class TestExtractZipSubtree:
+    """Tests for extract_zip_subtree."""
+
+    def test_extracts_only_the_skill_folder(self, tmp_path):
+        """Test members outside source_path are not written."""
+        archive = _make_zip(tmp_path / "repo.zip", {
+            "README.md": "readme",
+            "media/demo.mp4": "big",
+            ".claude/skills/demo/SKILL.md": "skill",
+            ".claude/skills/demo/scripts/run.py": "print()",
+            ".claude/skills/demo-other/SKILL.md": "other",
+        })
+        dest = tmp_path / "out"
+        dest.mkdir()
+
+        count = extract_zip_subtree(archive, ".claude/skills/demo", dest)
+
+        assert count == 2
+        assert sorted(str(p.relative_to(dest)) for p in dest.rglob("*") if p.is_file()) == [
+            "SKILL.md", "scripts/run.py",
+        ]
+
+    def test_missing_folder_raises(self, tmp_path):
+        """Test a source_path absent from the archive is an error."""
+        archive = _make_zip(tmp_path / "repo.zip", {"README.md": "readme"})
+
+        with pytest.raises(click.ClickException, match="Skill folder not found"):
+            extract_zip_subtree(archive, "skills/missing", tmp_path)
+
+    def test_rejects_parent_references(self, tmp_path):
+        """Test members escaping the destination are refused."""
+        archive = _make_zip(tmp_path / "repo.zip", {"skill/../../evil.txt": "x"})
+        dest = tmp_path / "out"
+        dest.mkdir()
+
+        with pytest.raises(click.ClickException, match="Unsafe path"):
+            extract_zip_subtree(archive, "skill", dest)
+        assert not (tmp_path / "evil.txt").exists()
+
+
+class TestDownloadAndExtractSkill:
+    """Tests for download_and_extract_skill."""
+
+    @patch("kudosx.commands.add.urlopen")
+    def test_installs_skill_with_version(self, mock_urlopen, tmp_path):
+        """Test the skill replaces an existing install and records its version."""
+        archive = _make_zip(tmp_path / "repo.zip", {"skills/demo/SKILL.md": "new"})
+        mock_urlopen.return_value = FakeResponse(archive.read_bytes())
+        target = tmp_path / "skills" / "demo"
+        target.mkdir(parents=True)
+        (target / "stale.txt").write_text("old")
+
+        download_and_extract_skill("owner/repo", "skills/demo", target, "1.2.0")
+
+        assert (target / "SKILL.md").read_text() == "new"
+        assert (target / "VERSION").read_text() == "1.2.0\n"
+        assert not (target / "stale.txt").exists()
+        assert [p.name for p in target.parent.iterdir()] == ["demo"]
+
+    @patch("kudosx.commands.add.urlopen")
+    def test_failed_install_keeps_previous_version(self, mock_urlopen, tmp_path):
+        """Test a skill missing from the archive leaves the old install intact."""
+        archive = _make_zip(tmp_path / "repo.zip", {"README.md": "readme"})
+        mock_urlopen.return_value = FakeResponse(archive.read_bytes())
+        target = tmp_path / "skills" / "demo"
+        target.mkdir(parents=True)
+        (target / "VERSION").write_text("1.0.0\n")
+
+        with pytest.raises(click.ClickException):
+            download_and_extract_skill("owner/repo", "skills/demo", target, "1.2.0")
+
+        assert (target / "VERSION").read_text() == "1.0.0\n"
+        assert [p.name for p in target.parent.iterdir()] == ["demo"]
+
+
+class TestDeltaUpdate:
+    """Tests for manifest-based in-place updates."""
+
+    def _install(self, tmp_path, files, version):
+        archive = _make_zip(tmp_path / f"repo-{version}.zip", {
+            f"skills/demo/{name}": content for name, content in files.items()
+        })
+        target = tmp_path / "skills" / "demo"
+        result = install_skill_archive(archive, "skills/demo", target, version)
+        return target, result
+
+    def test_install_writes_manifest(self, tmp_path):
+        """Test a fresh install records every skill file's hash."""
+        target, result = self._install(tmp_path, {"SKILL.md": "a", "lib/x.py": "x"}, "1.0.0")
+
+        manifest = read_manifest(target)
+        assert result == (2, 0)
+        assert sorted(manifest) == ["SKILL.md", "lib/x.py"]
+        assert manifest["SKILL.md"]["sha256"] == hashlib.sha256(b"a").hexdigest()
+
+    def test_update_rewrites_only_changed_files(self, tmp_path):
+        """Test unchanged files keep their inode and removed files are deleted."""
+        target, _ = self._install(
+            tmp_path, {"SKILL.md": "a", "same.txt": "same", "gone/old.txt": "old"}, "1.0.0"
+        )
+        (target / "notes.txt").write_text("mine")
+        same_inode = (target / "same.txt").stat().st_ino
+
+        _, result = self._install(
+            tmp_path, {"SKILL.md": "b", "same.txt": "same", "new.txt": "new"}, "1.1.0"
+        )
+
+        assert result == (2, 1)
+        assert (target / "SKILL.md").read_text() == "b"
+        assert (target / "new.txt").read_text() == "new"
+        assert (target / "same.txt").stat().st_ino == same_inode
+        assert not (target / "gone").exists()
+        assert (target / "notes.txt").read_text() == "mine"
+        assert (target / "VERSION").read_text() == "1.1.0\n"
+        assert sorted(read_manifest(target)) == ["SKILL.md", "new.txt", "same.txt"]
+
+    def test_update_restores_locally_modified_files(self, tmp_path):
+        """Test a file edited since install is detected by re-hashing and replaced."""
+        target, _ = self._install(tmp_path, {"SKILL.md": "a"}, "1.0.0")
+        (target / "SKILL.md").write_text("edited by hand")
+
+        _, result = self._install(tmp_path, {"SKILL.md": "a"}, "1.0.1")
+
+        assert result == (1, 0)
+        assert (target / "SKILL.md").read_text() == "a"
+
+    def test_update_keeps_executable_bits(self, tmp_path):
+        """Test files keep the permissions recorded in the archive across installs and updates."""
+        target = tmp_path / "skills" / "demo"
+        for version, content in (("1.0.0", "echo 1"), ("1.1.0", "echo 2")):
+            archive = tmp_path / f"repo-{version}.zip"
+            with zipfile.ZipFile(archive, "w") as zf:
+                info = zipfile.ZipInfo("repo-main/skills/demo/run.sh")
+                info.external_attr = 0o100755 << 16
+                zf.writestr(info, content)
+            for version_arg in (version, None):
+                install_skill_archive(archive, "skills/demo", target, version_arg)
+                assert (target / "run.sh").stat().st_mode & 0o777 == 0o755
+
+        assert (target / "run.sh").read_text() == "echo 2"
+
+    def test_bad_archive_changes_nothing(self, tmp_path):
+        """Test an archive rejected during planning leaves the install untouched."""
+        target, _ = self._install(tmp_path, {"SKILL.md": "a"}, "1.0.0")
+        archive = _make_zip(tmp_path / "bad.zip", {
+            "skills/demo/SKILL.md": "b",
+            "skills/demo/../../evil.txt": "x",
+        })
+
+        with pytest.raises(click.ClickException, match="Unsafe path"):
+            install_skill_archive(archive, "skills/demo", target, "2.0.0")
+
+        assert (target / "SKILL.md").read_text() == "a"
+        assert (target / "VERSION").read_text() == "1.0.0\n"
+
+
+class TestInstallFromStore:
+    """Tests for installing skills through the shared store."""
+
+    def test_hardlink_mode_shares_read_only_files(self, tmp_path, monkeypatch):
+        """Test KUDOSX_LINK_MODE=hardlink links installs to read-only stored files."""
+        monkeypatch.setenv("KUDOSX_LINK_MODE", "hardlink")
+        monkeypatch.setattr("kudosx.utils.fs._reflink", lambda source, target: False)
+        archive = _make_zip(tmp_path / "repo.zip", {"skills/demo/SKILL.md": "skill"})
+        global_path = tmp_path / "home" / "demo"
+        project_path = tmp_path / "project" / "demo"
+
+        install_skill_archive(archive, "skills/demo", global_path, "1.0.0")
+        # Already stored: no archive needed
+        install_skill_archive(None, "skills/demo", project_path, "1.0.0")
+
+        stored = SkillStore().path("demo", "1.0.0") / "SKILL.md"
+        assert (project_path / "SKILL.md").read_text() == "skill"
+        assert (global_path / "SKILL.md").stat().st_ino == stored.stat().st_ino
+        assert (project_path / "SKILL.md").stat().st_ino == stored.stat().st_ino
+        assert stored.stat().st_mode & 0o222 == 0
+        assert (project_path / "VERSION").read_text() == "1.0.0\n"
+
+    def test_editing_an_install_leaves_others_alone(self, tmp_path, monkeypatch):
+        """Test an in-place edit of one install reaches neither the store nor other installs."""
+        monkeypatch.delenv("KUDOSX_LINK_MODE", raising=False)
+        archive = _make_zip(tmp_path / "repo.zip", {"skills/demo/SKILL.md": "skill"})
+        install_skill_archive(archive, "skills/demo", tmp_path / "a" / "demo", "1.0.0")
+        install_skill_archive(None, "skills/demo", tmp_path / "b" / "demo", "1.0.0")
+
+        with open(tmp_path / "a" / "demo" / "SKILL.md", "w") as f:
+            f.write("EDITED")
+        install_skill_archive(None, "skills/demo", tmp_path / "c" / "demo", "1.0.0")
+
+        assert (tmp_path / "b" / "demo" / "SKILL.md").read_text() == "skill"
+        assert (tmp_path / "c" / "demo" / "SKILL.md").read_text() == "skill"
+        assert (SkillStore().path("demo", "1.0.0") / "SKILL.md").read_text() == "skill"
+
+    def test_force_refreshes_the_stored_version(self, tmp_path):
+        """Test force re-extracts a stored version from the new archive."""
+        first = _make_zip(tmp_path / "first.zip", {"skills/demo/SKILL.md": "old main"})
+        second = _make_zip(tmp_path / "second.zip", {"skills/demo/SKILL.md": "new main"})
+        target = tmp_path / "skills" / "demo"
+        install_skill_archive(first, "skills/demo", target, "1.0.0")
+
+        install_skill_archive(second, "skills/demo", target, "1.0.0", force=True)
+
+        assert (target / "SKILL.md").read_text() == "new main"
+        assert (SkillStore().path("demo", "1.0.0") / "SKILL.md").read_text() == "new main"
+
+    @patch("kudosx.commands.add.urlopen")
+    def test_stored_version_is_not_downloaded(self, mock_urlopen, tmp_path):
+        """Test a version already in the store installs without a download."""
+        archive = _make_zip(tmp_path / "repo.zip", {"skills/demo/SKILL.md": "skill"})
+        install_skill_archive(archive, "skills/demo", tmp_path / "a" / "demo", "1.0.0")
+
+        download_and_extract_skill("owner/repo", "skills/demo", tmp_path / "b" / "demo", "1.0.0")
+
+        mock_urlopen.assert_not_called()
+        assert (tmp_path / "b" / "demo" / "SKILL.md").read_text() == "skill"
+
+    @patch("kudosx.commands.add.urlopen")
+    def test_force_downloads_stored_version(self, mock_urlopen, tmp_path):
+        """Test force bypasses the store and downloads the archive again."""
+        archive = _make_zip(tmp_path / "repo.zip", {"skills/demo/SKILL.md": "skill"})
+        install_skill_archive(archive, "skills/demo", tmp_path / "a" / "demo", "1.0.0")
+        mock_urlopen.return_value = FakeResponse(archive.read_bytes())
+
+        download_and_extract_skill("owner/repo", "skills/demo", tmp_path / "b" / "demo", "1.0.0", force=True)
+
+        mock_urlopen.assert_called_once()
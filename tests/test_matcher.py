@@ -0,0 +1,94 @@
+"""Tests for search line matchers."""
+
+import pytest
+
+from kudosx.utils.matcher import (
+    LiteralMatcher,
+    MultiLiteralMatcher,
+    RegexMatcher,
+    build_matcher,
+    is_literal,
+)
+
+DATA = b"import os\nTODO: fix this\n\nprint('todo later')\nTODO again"
+
+
+class TestIsLiteral:
+    """Tests for is_literal function."""
+
+    def test_plain_word(self):
+        """Test plain words are literal."""
+        assert is_literal("def main")
+
+    def test_metacharacters(self):
+        """Test regex metacharacters disable the literal path."""
+        assert not is_literal("test_*.py")
+        assert not is_literal("a|b")
+
+
+class TestBuildMatcher:
+    """Tests for build_matcher function."""
+
+    def test_single_literal(self):
+        """Test a plain query uses the literal matcher."""
+        assert isinstance(build_matcher(["TODO"]), LiteralMatcher)
+
+    def test_multiple_literals(self):
+        """Test several plain queries use the multi-literal matcher."""
+        assert isinstance(build_matcher(["TODO", "FIXME"]), MultiLiteralMatcher)
+
+    def test_regex(self):
+        """Test regex queries use the regex matcher."""
+        assert isinstance(build_matcher(["def .*"]), RegexMatcher)
+        assert isinstance(build_matcher(["TODO", "def .*"]), RegexMatcher)
+
+    def test_non_ascii_ignore_case_uses_regex(self):
+        """Test non-ASCII case folding falls back to the regex engine."""
+        assert isinstance(build_matcher(["Ärger"], ignore_case=True), RegexMatcher)
+
+    def test_invalid_regex(self):
+        """Test invalid regex raises re.error."""
+        import re
+        with pytest.raises(re.error):
+            build_matcher(["def ("])
+
+
+class TestScan:
+    """Tests for matcher scanning of file buffers."""
+
+    def test_literal_scan_line_numbers(self):
+        """Test literal scan reports each matching line once."""
+        matches = list(LiteralMatcher("TODO").scan(DATA))
+        assert matches == [(2, "TODO: fix this"), (5, "TODO again")]
+
+    def test_literal_scan_ignore_case(self):
+        """Test literal scan folds ASCII case."""
+        lines = [n for n, _ in LiteralMatcher("todo", ignore_case=True).scan(DATA)]
+        assert lines == [2, 4, 5]
+
+    def test_literal_scan_preserves_original_text(self):
+        """Test case-folded scan returns the original line text."""
+        matches = list(LiteralMatcher("todo", ignore_case=True).scan(b"A TODO\n"))
+        assert matches == [(1, "A TODO")]
+
+    def test_multi_literal_scan(self):
+        """Test several literals are matched in one pass."""
+        matcher = MultiLiteralMatcher(["import", "again", "imp"])
+        assert [n for n, _ in matcher.scan(DATA)] == [1, 5]
+
+    def test_matchers_agree_with_regex(self):
+        """Test buffer matchers agree with the line-by-line regex path."""
+        for patterns in (["TODO"], ["o"], ["fix", "print", "xyz"]):
+            fast = list(build_matcher(patterns).scan(DATA))
+            slow = list(RegexMatcher("|".join(patterns)).scan(DATA))
+            assert fast == slow
+
+    def test_empty_buffer(self):
+        """Test scanning an empty buffer yields nothing."""
+        assert list(LiteralMatcher("x").scan(b"")) == []
+
+    def test_search_text(self):
+        """Test filename matching."""
+        assert LiteralMatcher("Main", ignore_case=True).search("main.py")
+        assert MultiLiteralMatcher(["foo", "main"]).search("main.py")
+        assert not RegexMatcher(r"\.js$").search("main.py")
@@ -0,0 +1,113 @@
+"""Tests for installing from an offline mirror (KUDOSX_MIRROR)."""
+
+import json
+import urllib.request
+import zipfile
+from unittest.mock import patch
+
+import pytest
+from click.testing import CliRunner
+
+from kudosx.cli import cli
+from kudosx.commands import add
+from kudosx.utils.mirror import archive_path, mirror_base, mirror_local_path, mirror_url, tags_path
+
+
+def _real_urlopen_file_only(request, *args, **kwargs):
+    url = getattr(request, "full_url", request)
+    assert url.startswith("file://"), f"network access to {url}"
+    return urllib.request.urlopen(request, *args, **kwargs)
+
+
+@pytest.fixture
+def mirror_dir(tmp_path, monkeypatch):
+    """A mirror holding browser-use's archive and tags, set as KUDOSX_MIRROR."""
+    config = add.SKILLS["browser-use"]
+    directory = tmp_path / "mirror"
+    directory.mkdir()
+    (directory / "skills.yaml").write_text(
+        "skills:\n"
+        "  browser-use:\n"
+        f"    repo: {config['repo']}\n"
+        f"    source_path: {config['source_path']}\n"
+        f"    target_dir: {config['target_dir']}\n"
+        "    latest: 7.7.7\n"
+    )
+    archive = directory / archive_path(config["repo"])
+    archive.parent.mkdir(parents=True)
+    with zipfile.ZipFile(archive, "w") as zf:
+        zf.writestr(f"repo-main/{config['source_path']}/SKILL.md", "mirrored")
+    tags = directory / tags_path(config["repo"])
+    tags.parent.mkdir(parents=True)
+    tags.write_text(json.dumps(["v1.0.0", "v1.2.0", "v1.10.0"]))
+
+    monkeypatch.setenv("KUDOSX_MIRROR", str(directory))
+    return directory
+
+
+class TestMirrorSettings:
+    """Tests for KUDOSX_MIRROR parsing."""
+
+    def test_unset(self, monkeypatch):
+        """Test no mirror is used by default."""
+        monkeypatch.delenv("KUDOSX_MIRROR", raising=False)
+        assert mirror_base() is None
+
+    def test_plain_path_becomes_file_url(self, tmp_path, monkeypatch):
+        """Test a directory path is read as a file:// mirror."""
+        monkeypatch.setenv("KUDOSX_MIRROR", str(tmp_path))
+
+        assert mirror_base() == tmp_path.as_uri()
+        assert mirror_local_path("skills.yaml") == tmp_path / "skills.yaml"
+
+    def test_http_mirror(self, monkeypatch):
+        """Test an HTTP mirror has URLs but no local paths."""
+        monkeypatch.setenv("KUDOSX_MIRROR", "http://localhost:8000/kudosx/")
+
+        assert mirror_url(archive_path("o/r")) == "http://localhost:8000/kudosx/archives/o/r/main.zip"
+        assert mirror_local_path("skills.yaml") is None
+
+
+class TestMirrorReads:
+    """Tests for registry, version and archive lookups through a mirror."""
+
+    def test_load_skills_reads_mirror_registry(self, mirror_dir, monkeypatch):
+        """Test the mirror's registry is merged over the bundled one."""
+        monkeypatch.setattr(add, "_skills_cache", None)
+
+        with patch("kudosx.commands.add.urlopen", side_effect=_real_urlopen_file_only):
+            skills = add.load_skills()
+
+        assert skills["browser-use"]["latest"] == "7.7.7"
+        assert "cloud-aws" in skills
+
+    def test_latest_version_from_mirror_tags(self, mirror_dir):
+        """Test tag lookups read the mirror instead of running git."""
+        repo = add.SKILLS["browser-use"]["repo"]
+
+        with patch("kudosx.commands.add.subprocess.run") as mock_run, \
+                patch("kudosx.commands.add.urlopen", side_effect=_real_urlopen_file_only):
+            version = add.fetch_latest_version_from_git(repo)
+
+        assert version == "1.10.0"
+        mock_run.assert_not_called()
+
+    def test_add_installs_from_mirror(self, mirror_dir, tmp_path, monkeypatch):
+        """Test kudosx add works with no network access."""
+        monkeypatch.chdir(tmp_path)
+
+        runner = CliRunner()
+        with patch("kudosx.commands.add.urlopen", side_effect=_real_urlopen_file_only):
+            result = runner.invoke(cli, ["add", "browser-use", "--local"])
+
+        assert result.exit_code == 0, result.output
+        assert "Using mirrored archive" in result.output
+        skill = tmp_path / ".claude" / "skills" / add.SKILLS["browser-use"]["target_dir"]
+        assert (skill / "SKILL.md").read_text() == "mirrored"
+
+    def test_missing_archive_is_an_error(self, mirror_dir):
+        """Test a repo absent from a local mirror fails instead of going online."""
+        import click
+
+        with pytest.raises(click.ClickException, match="not in the mirror"):
+            add.fetch_skill_archive("someone/elsewhere")
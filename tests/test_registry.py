@@ -0,0 +1,142 @@
+"""Tests for the skills registry cache."""
+
+import json
+from unittest.mock import patch
+
+from kudosx.utils.registry import (
+    REGISTRY_TTL,
+    SkillRegistry,
+    format_age,
+    load_yaml_snapshot,
+    parse_registry_yaml,
+    read_registry_cache,
+    registry_cache_path,
+    registry_freshness,
+    write_registry_cache,
+)
+
+
+def _age_cache(seconds):
+    data = json.loads(registry_cache_path().read_text())
+    data["fetched_at"] -= seconds
+    registry_cache_path().write_text(json.dumps(data))
+
+
+class TestRegistryCache:
+    """Tests for the on-disk remote registry cache."""
+
+    def test_round_trip_with_validators(self):
+        """Test skills and response validators are persisted."""
+        write_registry_cache({"demo": {"repo": "o/r"}}, etag='"abc"', last_modified="Mon, 01 Jan 2026")
+
+        cached = read_registry_cache()
+
+        assert cached["skills"] == {"demo": {"repo": "o/r"}}
+        assert cached["etag"] == '"abc"'
+        assert cached["last_modified"] == "Mon, 01 Jan 2026"
+
+    def test_unreadable_cache_is_ignored(self):
+        """Test a corrupt cache file reads as missing."""
+        registry_cache_path().write_text("{not json")
+
+        assert read_registry_cache() is None
+
+
+class TestRegistryFreshness:
+    """Tests for registry_freshness."""
+
+    def test_states(self):
+        """Test bundled, fresh, stale and offline states."""
+        assert registry_freshness() == ("bundled", None)
+
+        write_registry_cache({})
+        assert registry_freshness() == ("fresh", "just now")
+
+        _age_cache(REGISTRY_TTL + 7200)
+        assert registry_freshness() == ("stale", "3h ago")
+
+        write_registry_cache(None)
+        assert registry_freshness()[0] == "offline"
+
+    def test_format_age(self):
+        """Test ages use the largest whole unit."""
+        assert format_age(30) == "just now"
+        assert format_age(125) == "2m ago"
+        assert format_age(2 * 86400 + 5) == "2d ago"
+
+
+class TestYamlSnapshot:
+    """Tests for load_yaml_snapshot."""
+
+    def test_snapshot_is_reused_until_source_changes(self, tmp_path):
+        """Test the YAML is parsed once per distinct content."""
+        source = tmp_path / "skills.yaml"
+        source.write_text("skills:\n  demo:\n    repo: o/r\n")
+
+        with patch("kudosx.utils.registry.parse_registry_yaml", wraps=parse_registry_yaml) as parse:
+            first = load_yaml_snapshot(source)
+            second = load_yaml_snapshot(source)
+            source.write_text("skills:\n  other:\n    repo: o/x\n")
+            third = load_yaml_snapshot(source)
+
+        assert first == second == {"skills": {"demo": {"repo": "o/r"}}}
+        assert third == {"skills": {"other": {"repo": "o/x"}}}
+        assert parse.call_count == 2
+
+    def test_unmarshallable_values_skip_snapshot(self, tmp_path):
+        """Test documents with YAML dates are still loaded."""
+        source = tmp_path / "skills.yaml"
+        source.write_text("released: 2026-01-01\n")
+
+        assert str(load_yaml_snapshot(source)["released"]) == "2026-01-01"
+
+
+CATALOG = {
+    "browser-use": {
+        "repo": "kudosx/claude-skill-browser-use",
+        "target_dir": "browser-use",
+        "description": "Browser automation skill",
+        "latest": "0.1.1",
+    },
+    "cloud-aws": {
+        "repo": "kudosx/claude-skill-cloud-aws",
+        "target_dir": "cloud-aws",
+        "description": "AWS cloud management skill",
+    },
+    "web-scraper": {
+        "repo": "acme/scrapers",
+        "target_dir": "scraper",
+        "description": "Scrape pages with browser automation",
+    },
+}
+
+
+class TestSkillRegistry:
+    """Tests for SkillRegistry."""
+
+    def test_mapping_and_indexes(self):
+        """Test name, repo and target_dir lookups."""
+        registry = SkillRegistry(CATALOG)
+
+        assert "cloud-aws" in registry
+        assert len(registry) == 3
+        assert registry["browser-use"]["latest"] == "0.1.1"
+        assert registry.find_by_repo("acme/scrapers") == ["web-scraper"]
+        assert registry.find_by_repo("acme/missing") == []
+        assert registry.find_by_target("scraper") == "web-scraper"
+
+    def test_search_requires_every_term(self):
+        """Test all terms must match somewhere in a skill."""
+        registry = SkillRegistry(CATALOG)
+
+        assert registry.search("automation") == ["browser-use", "web-scraper"]
+        assert registry.search("automation scrape") == ["web-scraper"]
+        assert registry.search("automation kubernetes") == []
+
+    def test_search_prefix_and_ranking(self):
+        """Test the last term matches prefixes and name hits rank first."""
+        registry = SkillRegistry(CATALOG)
+
+        assert registry.search("brow") == ["browser-use", "web-scraper"]
+        assert registry.search("scr") == ["web-scraper"]
+        assert registry.search("  ") == []
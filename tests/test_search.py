@@ -0,0 +1,274 @@
+"""Tests for search command helpers."""
+
+import gzip
+import io
+import os
+import re
+import zipfile
+
+from kudosx.commands.search import (
+    format_change,
+    read_chunks,
+    read_stream_chunks,
+    refresh_table,
+    replace_in_file,
+    scan_archive,
+    scan_file,
+    scan_files,
+)
+from kudosx.utils.matcher import build_matcher
+
+
+class TestReadChunks:
+    """Tests for read_chunks function."""
+
+    def test_chunks_end_on_line_boundaries(self, tmp_path):
+        """Test every chunk but the last ends with a newline."""
+        path = tmp_path / "a.txt"
+        path.write_bytes(b"alpha\nbeta\ngamma\ndelta")
+
+        chunks = list(read_chunks(path, chunk_size=4))
+
+        assert b"".join(chunks) == b"alpha\nbeta\ngamma\ndelta"
+        assert all(c.endswith(b"\n") for c in chunks[:-1])
+
+    def test_empty_file(self, tmp_path):
+        """Test empty files yield no chunks."""
+        path = tmp_path / "empty.txt"
+        path.write_bytes(b"")
+        assert list(read_chunks(path)) == []
+
+
+class TestScanFile:
+    """Tests for scan_file function."""
+
+    def test_lines_mode_numbers_across_chunks(self, tmp_path, monkeypatch):
+        """Test line numbers stay correct when a file spans several chunks."""
+        import kudosx.commands.search as search_module
+        monkeypatch.setattr(search_module, "CHUNK_SIZE", 8)
+        path = tmp_path / "a.py"
+        path.write_text("x = 1\n# TODO one\ny = 2\n# TODO two\n")
+
+        matches = scan_file(path, build_matcher(["TODO"]))
+
+        assert matches == [(2, "# TODO one"), (4, "# TODO two")]
+
+    def test_lines_mode_limit(self, tmp_path):
+        """Test collection stops at the limit."""
+        path = tmp_path / "a.py"
+        path.write_text("TODO\n" * 10)
+        assert len(scan_file(path, build_matcher(["TODO"]), limit=3)) == 3
+
+    def test_files_mode(self, tmp_path):
+        """Test files mode returns whether the file matches."""
+        path = tmp_path / "a.py"
+        path.write_text("a\nTODO\n")
+        assert scan_file(path, build_matcher(["TODO"]), mode="files") is True
+        assert scan_file(path, build_matcher(["FIXME"]), mode="files") is False
+
+    def test_count_mode(self, tmp_path):
+        """Test count mode counts matching lines."""
+        path = tmp_path / "a.py"
+        path.write_text("TODO TODO\nnone\nTODO\n")
+        assert scan_file(path, build_matcher(["TODO"]), mode="count") == 2
+        assert scan_file(path, build_matcher(["TO.O"]), mode="count") == 2
+
+
+class TestScanFiles:
+    """Tests for scan_files function."""
+
+    def test_parallel_preserves_order(self):
+        """Test concurrent scanning yields results in input order."""
+        results = list(scan_files(iter(range(50)), lambda n: n * 2, jobs=4))
+        assert results == [(n, n * 2) for n in range(50)]
+
+    def test_sequential(self):
+        """Test jobs=1 scans inline."""
+        assert list(scan_files([1, 2], str, jobs=1)) == [(1, "1"), (2, "2")]
+
+    def test_early_stop(self):
+        """Test the consumer can stop before all candidates are scanned."""
+        gen = scan_files(iter(range(1000)), lambda n: n, jobs=2)
+        assert next(gen) == (0, 0)
+        gen.close()
+
+
+def _bump_mtime(path):
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+class TestRefreshTable:
+    """Tests for refresh_table function."""
+
+    def _scan(self, file_path):
+        return scan_file(file_path, build_matcher(["TODO"]))
+
+    def test_only_changed_files_are_rescanned(self, tmp_path):
+        """Test unchanged files are served from the table."""
+        (tmp_path / "a.py").write_text("TODO one\n")
+        (tmp_path / "b.py").write_text("nothing\n")
+        table, changes = refresh_table(tmp_path, ["a.py", "b.py"], {}, self._scan, None)
+        assert [c[0] for c in changes] == ["a.py", "b.py"]
+
+        (tmp_path / "b.py").write_text("TODO two\n")
+        _bump_mtime(tmp_path / "b.py")
+        scanned = []
+
+        def scan(file_path):
+            scanned.append(file_path.name)
+            return self._scan(file_path)
+
+        table, changes = refresh_table(tmp_path, ["a.py", "b.py"], table, scan, None)
+
+        assert scanned == ["b.py"]
+        assert changes == [("b.py", [], [(1, "TODO two")])]
+
+    def test_deleted_files_are_reported(self, tmp_path):
+        """Test files no longer listed are reported with a None result."""
+        (tmp_path / "a.py").write_text("TODO\n")
+        table, _ = refresh_table(tmp_path, ["a.py"], {}, self._scan, None)
+
+        table, changes = refresh_table(tmp_path, [], table, self._scan, None)
+
+        assert table == {}
+        assert changes == [("a.py", [(1, "TODO")], None)]
+
+
+class TestFormatChange:
+    """Tests for format_change function."""
+
+    def test_moved_lines_are_not_reported(self):
+        """Test a match that only changed line number produces no output."""
+        old = [(1, "TODO a")]
+        new = [(2, "TODO a"), (5, "TODO b")]
+
+        assert format_change("x.py", old, new, "lines") == ["+ x.py:5: TODO b"]
+
+    def test_removed_match(self):
+        """Test removed matches are reported with their old line number."""
+        assert format_change("x.py", [(3, "TODO a")], None, "lines") == ["- x.py:3: TODO a"]
+
+    def test_count_mode(self):
+        """Test count changes are reported as old -> new."""
+        assert format_change("x.py", 2, 5, "count") == ["  x.py: 2 -> 5"]
+
+    def test_name_match_added(self):
+        """Test a new file with a matching name is reported."""
+        assert format_change("todo.txt", None, False, "lines", name_match=True) == ["+ todo.txt"]
+
+
+class TestReplaceInFile:
+    """Tests for replace_in_file function."""
+
+    def test_rewrites_matching_lines(self, tmp_path):
+        """Test matches are replaced and reported per line."""
+        path = tmp_path / "a.py"
+        path.write_bytes(b"foo = 1\r\nbar = foo\nbaz\n")
+
+        changes, occurrences = replace_in_file(path, build_matcher(["foo"]), re.compile("foo"), "qux")
+
+        assert path.read_bytes() == b"qux = 1\r\nbar = qux\nbaz\n"
+        assert changes == [(1, "foo = 1", "qux = 1"), (2, "bar = foo", "bar = qux")]
+        assert occurrences == 2
+
+    def test_backreferences(self, tmp_path):
+        """Test the replacement can refer to groups of the pattern."""
+        path = tmp_path / "a.py"
+        path.write_text("get_name()\n")
+        regex = re.compile(r"get_(\w+)")
+
+        replace_in_file(path, build_matcher([r"get_(\w+)"]), regex, r"fetch_\1")
+
+        assert path.read_text() == "fetch_name()\n"
+
+    def test_dry_run_leaves_file_untouched(self, tmp_path):
+        """Test --dry-run computes changes without writing."""
+        path = tmp_path / "a.py"
+        path.write_text("foo\n")
+
+        changes, _ = replace_in_file(path, build_matcher(["foo"]), re.compile("foo"), "bar", dry_run=True)
+
+        assert changes == [(1, "foo", "bar")]
+        assert path.read_text() == "foo\n"
+
+    def test_file_without_match_is_not_rewritten(self, tmp_path):
+        """Test files without hits keep their mtime."""
+        path = tmp_path / "a.py"
+        path.write_text("nothing here\n")
+        mtime = os.stat(path).st_mtime_ns
+
+        assert replace_in_file(path, build_matcher(["foo"]), re.compile("foo"), "bar") == ([], 0)
+        assert os.stat(path).st_mtime_ns == mtime
+
+    def test_binary_files_are_skipped(self, tmp_path):
+        """Test files containing NUL bytes are never rewritten."""
+        path = tmp_path / "a.bin"
+        path.write_bytes(b"foo\0\xff")
+
+        assert replace_in_file(path, build_matcher(["foo"]), re.compile("foo"), "bar") == ([], 0)
+        assert path.read_bytes() == b"foo\0\xff"
+
+
+class TestReadStreamChunks:
+    """Tests for read_stream_chunks function."""
+
+    def test_max_bytes_cuts_off_stream(self):
+        """Test reading stops once the byte limit is reached."""
+        chunks = list(read_stream_chunks(io.BytesIO(b"aaaa\nbbbb\ncccc\n"), chunk_size=4, max_bytes=10))
+
+        assert b"".join(chunks) == b"aaaa\nbbbb\n"
+
+    def test_long_line_spans_many_reads(self):
+        """Test a line longer than many blocks is yielded whole, once."""
+        data = b"x" * 1000 + b"\nend"
+
+        chunks = list(read_stream_chunks(io.BytesIO(data), chunk_size=7))
+
+        assert chunks == [b"x" * 1000 + b"\n", b"end"]
+
+
+class TestScanArchive:
+    """Tests for scan_archive function."""
+
+    def _make_zip(self, path, members):
+        with zipfile.ZipFile(path, "w", zipfile.ZIP_DEFLATED) as archive:
+            for name, data in members.items():
+                archive.writestr(name, data)
+
+    def test_zip_members(self, tmp_path):
+        """Test matches are reported per zip member."""
+        path = tmp_path / "bundle.zip"
+        self._make_zip(path, {"a/SKILL.md": "intro\nTODO write\n", "b.txt": "nothing\n"})
+
+        assert scan_archive(path, build_matcher(["TODO"])) == [("a/SKILL.md", [(2, "TODO write")])]
+
+    def test_member_extension_filter(self, tmp_path):
+        """Test extension filters apply to member names."""
+        path = tmp_path / "bundle.zip"
+        self._make_zip(path, {"a.py": "TODO\n", "b.md": "TODO\n"})
+
+        assert scan_archive(path, build_matcher(["TODO"]), mode="count", extensions={"py"}) == [("a.py", 1)]
+
+    def test_oversized_members_are_skipped(self, tmp_path):
+        """Test members larger than the size limit are not scanned."""
+        path = tmp_path / "bundle.zip"
+        self._make_zip(path, {"big.log": "x" * 100 + "\nTODO\n", "small.log": "TODO\n"})
+
+        found = scan_archive(path, build_matcher(["TODO"]), mode="files", max_member_size=50)
+
+        assert found == [("small.log", True)]
+
+    def test_gzip_file(self, tmp_path):
+        """Test the contents of a .gz file are searched as one member."""
+        path = tmp_path / "app.log.gz"
+        path.write_bytes(gzip.compress(b"ok\nerror: boom\n"))
+
+        assert scan_archive(path, build_matcher(["error"])) == [("app.log", [(2, "error: boom")])]
+
+    def test_corrupt_archive(self, tmp_path):
+        """Test a corrupt archive yields no results instead of failing."""
+        path = tmp_path / "broken.zip"
+        path.write_bytes(b"not a zip")
+
+        assert scan_archive(path, build_matcher(["TODO"])) == []
@@ -0,0 +1,87 @@
+"""Tests for the search result cache."""
+
+import os
+import time
+
+from kudosx.utils.search_cache import SearchCache, lookup, make_key
+
+
+class TestMakeKey:
+    """Tests for make_key function."""
+
+    def test_stable_for_sets(self):
+        """Test extension sets produce the same key regardless of order."""
+        assert make_key(extensions={"py", "js"}) == make_key(extensions={"js", "py"})
+
+    def test_differs_by_query(self):
+        """Test different patterns give different keys."""
+        assert make_key(patterns=["a"]) != make_key(patterns=["b"])
+
+
+class TestLookup:
+    """Tests for lookup function."""
+
+    def test_valid_entry(self, tmp_path):
+        """Test an unchanged file is served from the table."""
+        path = tmp_path / "a.py"
+        path.write_text("x")
+        stat = os.stat(path)
+        files = {"a.py": (stat.st_mtime_ns, stat.st_size, 50, [(1, "x")])}
+        assert lookup(files, "a.py", stat, 50) == [(1, "x")]
+
+    def test_changed_file(self, tmp_path):
+        """Test a changed fingerprint invalidates the entry."""
+        path = tmp_path / "a.py"
+        path.write_text("x")
+        stat = os.stat(path)
+        files = {"a.py": (stat.st_mtime_ns, stat.st_size + 1, 50, [(1, "x")])}
+        assert lookup(files, "a.py", stat, 50) is None
+
+    def test_truncated_entry_needs_larger_limit(self, tmp_path):
+        """Test a truncated result is not reused for a larger limit."""
+        path = tmp_path / "a.py"
+        path.write_text("x")
+        stat = os.stat(path)
+        files = {"a.py": (stat.st_mtime_ns, stat.st_size, 1, [(1, "x")])}
+        assert lookup(files, "a.py", stat, 1) == [(1, "x")]
+        assert lookup(files, "a.py", stat, 10) is None
+
+    def test_truncated_archive_member_needs_larger_limit(self, tmp_path):
+        """Test an archive result counts as truncated when any member hit the limit."""
+        path = tmp_path / "a.zip"
+        path.write_text("x")
+        stat = os.stat(path)
+        result = [("a.md", [(1, "x"), (2, "x")]), ("b.md", [(1, "x")]), ("c.md", [(4, "x")])]
+        files = {"a.zip": (stat.st_mtime_ns, stat.st_size, 2, result)}
+
+        assert lookup(files, "a.zip", stat, 2) == result
+        assert lookup(files, "a.zip", stat, 30) is None
+
+
+class TestSearchCache:
+    """Tests for SearchCache class."""
+
+    def test_round_trip(self, tmp_path):
+        """Test stored tables can be loaded back."""
+        cache = SearchCache(cache_dir=tmp_path)
+        cache.store("k", {"a.py": (1, 2, None, 3)})
+        assert cache.load("k") == {"a.py": (1, 2, None, 3)}
+        assert cache.load("missing") == {}
+
+    def test_evicts_least_recently_used(self, tmp_path):
+        """Test older entries are dropped when over budget."""
+        cache = SearchCache(cache_dir=tmp_path, max_bytes=10_000)
+        cache.store("old", {"a": (1, 1, None, "x" * 4000)})
+        past = time.time() - 100
+        os.utime(tmp_path / "old.cache", (past, past))
+        cache.store("new", {"a": (1, 1, None, "y" * 4000)})
+        cache.store("newer", {"a": (1, 1, None, "z" * 4000)})
+
+        assert not (tmp_path / "old.cache").exists()
+        assert (tmp_path / "newer.cache").exists()
+
+    def test_skips_oversized_entry(self, tmp_path):
+        """Test an entry larger than the whole budget is not stored."""
+        cache = SearchCache(cache_dir=tmp_path, max_bytes=100)
+        cache.store("big", {"a": (1, 1, None, "x" * 1000)})
+        assert cache.load("big") == {}
@@ -0,0 +1,71 @@
+"""Tests for the shared skill content store."""
+
+import hashlib
+import os
+import time
+
+from kudosx.utils.manifest import manifest_entry
+from kudosx.utils.store import SkillStore
+
+
+def _fill(files):
+    def fill(directory, manifest):
+        for name, content in files.items():
+            path = directory / name
+            path.write_text(content)
+            manifest[name] = manifest_entry(path, "sha-" + name)
+    return fill
+
+
+def _fill_hashed(directory, manifest):
+    path = directory / "SKILL.md"
+    path.write_text("a")
+    manifest["SKILL.md"] = manifest_entry(path, hashlib.sha256(b"a").hexdigest())
+
+
+class TestSkillStore:
+    """Tests for SkillStore."""
+
+    def test_add_and_lookup(self, tmp_path):
+        """Test a stored version is found with its manifest."""
+        store = SkillStore(tmp_path)
+
+        store.add("demo", "1.0.0", _fill({"SKILL.md": "a"}))
+
+        assert store.lookup("demo", "1.0.0")["SKILL.md"]["sha256"] == "sha-SKILL.md"
+        assert store.lookup("demo", "2.0.0") is None
+
+    def test_modified_version_is_not_trusted(self, tmp_path):
+        """Test a stored file changed behind the store's back invalidates the version."""
+        store = SkillStore(tmp_path)
+        store.add("demo", "1.0.0", _fill({"SKILL.md": "a"}))
+
+        stored = store.path("demo", "1.0.0") / "SKILL.md"
+        stored.chmod(0o644)
+        stored.write_text("edited")
+
+        assert store.lookup("demo", "1.0.0") is None
+        assert not store.path("demo", "1.0.0").exists()
+
+    def test_touched_file_is_rehashed(self, tmp_path):
+        """Test a stored file with a new mtime but the same content stays valid."""
+        store = SkillStore(tmp_path)
+        store.add("demo", "1.0.0", lambda directory, manifest: _fill_hashed(directory, manifest))
+        stored = store.path("demo", "1.0.0") / "SKILL.md"
+        os.utime(stored, (0, 0))
+
+        assert store.lookup("demo", "1.0.0") is not None
+        assert store.lookup("demo", "1.0.0")["SKILL.md"]["mtime_ns"] == 0
+
+    def test_prune_keeps_recent_versions(self, tmp_path):
+        """Test only the most recently used versions of a skill are kept."""
+        store = SkillStore(tmp_path, keep=2)
+        for i, version in enumerate(["1.0.0", "1.1.0"]):
+            store.add("demo", version, _fill({"SKILL.md": version}))
+            past = time.time() - 100 + i
+            os.utime(store.path("demo", version), (past, past))
+
+        store.add("demo", "1.2.0", _fill({"SKILL.md": "1.2.0"}))
+
+        assert sorted(p.name for p in (tmp_path / "demo").iterdir()) == ["1.1.0", "1.2.0"]
+
@@ -0,0 +1,92 @@
+"""Tests for latest-version resolution and the tag cache."""
+
+import json
+import threading
+from unittest.mock import patch
+
+from kudosx.commands.add import (
+    fetch_latest_version_from_git,
+    latest_version_from_tags,
+    resolve_latest_versions,
+)
+from kudosx.utils.tag_cache import NEGATIVE_TAG_TTL, TagCache
+
+
+def _age(cache, repo, seconds):
+    data = json.loads(cache.path.read_text())
+    data["repos"][repo]["fetched_at"] -= seconds
+    cache.path.write_text(json.dumps(data))
+
+
+class TestTagCache:
+    """Tests for TagCache."""
+
+    def test_put_and_get(self, tmp_path):
+        """Test cached tags are returned until they expire."""
+        cache = TagCache(tmp_path / "tags.json", ttl=60)
+        cache.put("o/r", ["v1.0.0"])
+
+        assert cache.get("o/r") == (True, ["v1.0.0"])
+        assert cache.get("o/other") == (False, None)
+
+        _age(cache, "o/r", 61)
+        assert cache.get("o/r") == (False, None)
+
+    def test_negative_results_expire_sooner(self, tmp_path):
+        """Test failed lookups use the short TTL."""
+        cache = TagCache(tmp_path / "tags.json", ttl=3600, negative_ttl=10)
+        cache.put("o/r", None)
+
+        assert cache.get("o/r") == (True, None)
+        _age(cache, "o/r", 11)
+        assert cache.get("o/r") == (False, None)
+
+
+class TestFetchLatestVersionFromGit:
+    """Tests for the cached git tag lookup."""
+
+    def test_latest_version_from_tags(self):
+        """Test the highest semantic version wins and 'v' is stripped."""
+        assert latest_version_from_tags(["v0.9.0", "v0.10.0", "v0.2.1"]) == "0.10.0"
+        assert latest_version_from_tags([]) is None
+
+    @patch("kudosx.commands.add.fetch_tags_from_git", return_value=["v1.0.0", "v1.2.0"])
+    def test_tags_are_cached(self, mock_tags):
+        """Test a second lookup is answered from the cache."""
+        assert fetch_latest_version_from_git("o/r") == "1.2.0"
+        assert fetch_latest_version_from_git("o/r") == "1.2.0"
+        assert mock_tags.call_count == 1
+
+        assert fetch_latest_version_from_git("o/r", use_cache=False) == "1.2.0"
+        assert mock_tags.call_count == 2
+
+    @patch("kudosx.commands.add.fetch_tags_from_git", return_value=None)
+    def test_failures_are_cached_briefly(self, mock_tags):
+        """Test an unreachable repo is not retried within the negative TTL."""
+        assert fetch_latest_version_from_git("o/down") is None
+        assert fetch_latest_version_from_git("o/down") is None
+        assert mock_tags.call_count == 1
+
+        _age(TagCache(), "o/down", NEGATIVE_TAG_TTL + 1)
+        fetch_latest_version_from_git("o/down")
+        assert mock_tags.call_count == 2
+
+
+class TestResolveLatestVersions:
+    """Tests for resolve_latest_versions."""
+
+    def test_lookups_run_concurrently(self):
+        """Test every repo is looked up at the same time, once."""
+        barrier = threading.Barrier(3, timeout=5)
+        calls = []
+
+        def lookup(repo):
+            calls.append(repo)
+            barrier.wait()
+            return f"{repo}-latest"
+
+        with patch("kudosx.commands.add.get_latest_version", side_effect=lookup):
+            result = resolve_latest_versions(["o/a", "o/b", "o/a", "o/c"])
+
+        assert result == {"o/a": "o/a-latest", "o/b": "o/b-latest", "o/c": "o/c-latest"}
+        assert sorted(calls) == ["o/a", "o/b", "o/c"]
@@ -0,0 +1,180 @@
+"""Tests for the session transcript index."""
+
+import json
+import os
+
+from kudosx.utils.claude_usage import read_session_entries
+from kudosx.utils.transcript_index import TranscriptIndex, extract_document
+
+
+def _entry(role, content, timestamp="2026-01-01T10:00:00Z"):
+    return {"type": role, "timestamp": timestamp, "message": {"role": role, "content": content}}
+
+
+def _write_session(path, entries, mode="w"):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, mode) as f:
+        for entry in entries:
+            f.write(json.dumps(entry) + "\n")
+    # Bump mtime so appends are visible at any timestamp granularity
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+class TestReadSessionEntries:
+    """Tests for read_session_entries."""
+
+    def test_resumes_from_offset(self, tmp_path):
+        """Test reading again from a returned offset yields only new entries."""
+        session = tmp_path / "s.jsonl"
+        _write_session(session, [{"n": 1}, {"n": 2}])
+        offset, _ = list(read_session_entries(session))[-1]
+
+        _write_session(session, [{"n": 3}], mode="a")
+
+        assert [d["n"] for _, d in read_session_entries(session, offset)] == [3]
+
+    def test_partial_trailing_line_is_not_consumed(self, tmp_path):
+        """Test an incomplete last line is left for the next read."""
+        session = tmp_path / "s.jsonl"
+        session.write_text('{"n": 1}\n{"n": ')
+
+        entries = list(read_session_entries(session))
+
+        assert [d["n"] for _, d in entries] == [1]
+        assert entries[-1][0] == len('{"n": 1}\n')
+
+
+class TestExtractDocument:
+    """Tests for extract_document."""
+
+    def test_text_tools_and_paths(self):
+        """Test text blocks, tool names and file paths are extracted."""
+        doc = extract_document(_entry("assistant", [
+            {"type": "text", "text": "Fixing the parser"},
+            {"type": "tool_use", "name": "Edit", "input": {"file_path": "/src/parser.py"}},
+        ]))
+
+        assert doc == ("Fixing the parser", ["Edit"], ["/src/parser.py"])
+
+    def test_tool_results_are_skipped(self):
+        """Test entries holding only tool results produce no document."""
+        entry = _entry("user", [{"type": "tool_result", "content": "file contents"}])
+
+        assert extract_document(entry) is None
+
+
+class TestTranscriptIndex:
+    """Tests for TranscriptIndex."""
+
+    def test_search_ranks_sessions(self, tmp_path):
+        """Test matching sessions are returned with a snippet and hit count."""
+        projects = tmp_path / "projects"
+        _write_session(projects / "app" / "s1.jsonl", [
+            _entry("user", "the login form crashes on submit"),
+            _entry("assistant", "Looking at the login handler"),
+        ])
+        _write_session(projects / "app" / "s2.jsonl", [_entry("user", "update the readme")])
+
+        index = TranscriptIndex(projects, cache_dir=tmp_path / "cache")
+        index.ensure()
+        results = index.search("login")
+
+        assert [r["session"] for r in results] == ["s1"]
+        assert results[0]["project"] == "app"
+        assert results[0]["hits"] == 2
+        assert "login" in results[0]["snippet"]
+
+    def test_all_terms_must_match(self, tmp_path):
+        """Test a message must contain every query term."""
+        projects = tmp_path / "projects"
+        _write_session(projects / "app" / "s1.jsonl", [_entry("user", "login form")])
+
+        index = TranscriptIndex(projects, cache_dir=tmp_path / "cache")
+        index.ensure()
+
+        assert index.search("login form")
+        assert index.search("login banana") == []
+
+    def test_tool_paths_are_searchable(self, tmp_path):
+        """Test sessions can be found by the files their tools touched."""
+        projects = tmp_path / "projects"
+        _write_session(projects / "app" / "s1.jsonl", [_entry("assistant", [
+            {"type": "tool_use", "name": "Read", "input": {"file_path": "/repo/kudosx/cli.py"}},
+        ])])
+
+        index = TranscriptIndex(projects, cache_dir=tmp_path / "cache")
+        index.ensure()
+
+        assert [r["session"] for r in index.search("cli py")] == ["s1"]
+
+    def test_update_reads_only_appended_lines(self, tmp_path):
+        """Test a reloaded index indexes appended entries from its checkpoint."""
+        projects = tmp_path / "projects"
+        session = projects / "app" / "s1.jsonl"
+        _write_session(session, [_entry("user", "first message")])
+        TranscriptIndex(projects, cache_dir=tmp_path / "cache").ensure()
+
+        _write_session(session, [_entry("user", "second message")], mode="a")
+        index = TranscriptIndex(projects, cache_dir=tmp_path / "cache")
+        index.load()
+
+        assert index.update() == 1
+        assert len(index.doc_session) == 2
+        assert index.search("second")
+        assert index.update() == 0
+
+    def test_deleted_session_is_dropped(self, tmp_path):
+        """Test documents of removed transcripts no longer match."""
+        projects = tmp_path / "projects"
+        _write_session(projects / "app" / "s1.jsonl", [_entry("user", "alpha")])
+        _write_session(projects / "app" / "s2.jsonl", [_entry("user", "alpha beta")])
+        index = TranscriptIndex(projects, cache_dir=tmp_path / "cache")
+        index.ensure()
+
+        (projects / "app" / "s1.jsonl").unlink()
+        index.ensure()
+
+        assert [r["session"] for r in index.search("alpha")] == ["s2"]
+
+    def test_truncated_session_is_reindexed(self, tmp_path):
+        """Test a rewritten transcript replaces its old documents."""
+        projects = tmp_path / "projects"
+        session = projects / "app" / "s1.jsonl"
+        _write_session(session, [_entry("user", "old topic"), _entry("user", "more old")])
+        index = TranscriptIndex(projects, cache_dir=tmp_path / "cache")
+        index.ensure()
+
+        _write_session(session, [_entry("user", "new")])
+        index.ensure()
+
+        assert index.search("old") == []
+        assert index.search("new")
+
+    def test_same_size_rewrite_is_reindexed(self, tmp_path):
+        """Test a transcript rewritten without shrinking replaces its old documents."""
+        projects = tmp_path / "projects"
+        session = projects / "app" / "s1.jsonl"
+        _write_session(session, [_entry("user", "alpha topic")])
+        index = TranscriptIndex(projects, cache_dir=tmp_path / "cache")
+        index.ensure()
+
+        _write_session(session, [_entry("user", "gamma topic")])
+        index.ensure()
+
+        assert index.search("alpha") == []
+        assert [r["session"] for r in index.search("gamma")] == ["s1"]
+
+    def test_snippets_are_read_from_transcripts(self, tmp_path):
+        """Test the index stores line offsets, not message text, and snippets still work."""
+        projects = tmp_path / "projects"
+        _write_session(projects / "app" / "s1.jsonl", [
+            _entry("user", "first message"),
+            _entry("assistant", "the secret phrase is here"),
+        ])
+        TranscriptIndex(projects, cache_dir=tmp_path / "cache").ensure()
+
+        assert b"secret phrase" not in (tmp_path / "cache" / "index.marshal").read_bytes()
+        index = TranscriptIndex(projects, cache_dir=tmp_path / "cache")
+        index.load()
+        assert "secret phrase is here" in index.search("secret")[0]["snippet"]